@@ -1 +1,4 @@
 """Reusable UI components for TCG App."""
+from .card_box import CardBox
+
+__all__ = ['CardBox']
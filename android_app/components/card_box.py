@@ -0,0 +1,37 @@
+"""
+Card Box - BoxLayout with a rounded, colored background.
+"""
+
+from kivy.uix.boxlayout import BoxLayout
+from kivy.graphics import Color, RoundedRectangle
+from kivy.metrics import dp
+from kivy.properties import ListProperty, NumericProperty
+
+
+class CardBox(BoxLayout):
+    """BoxLayout drawing a rounded rectangle of bg_color behind its children."""
+
+    bg_color = ListProperty([1, 1, 1, 1])
+    radius = NumericProperty(dp(8))
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self.canvas.before:
+            self._bg_color = Color(rgba=self.bg_color)
+            self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[self.radius])
+        self.bind(
+            pos=self._update_bg,
+            size=self._update_bg,
+            bg_color=self._update_bg_color,
+            radius=self._update_radius
+        )
+
+    def _update_bg(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def _update_bg_color(self, instance, value):
+        self._bg_color.rgba = value
+
+    def _update_radius(self, instance, value):
+        self._bg.radius = [value]
@@ -29,7 +29,7 @@ from kivy.properties import StringProperty
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.news_service import NewsService, Tournament
-from services.user_database import UserDatabase
+from services.user_database import get_user_database
 
 
 # Color scheme
@@ -58,7 +58,7 @@ class CalendarScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.news_service = NewsService()
-        self.db = UserDatabase()
+        self.db = get_user_database()
         self.filter_country = 'all'
         self._build_ui()
 
@@ -515,11 +515,7 @@ class CalendarScreen(Screen):
 
     def _set_event_deck(self, event: Tournament, deck_id: int):
         """Set deck for an event."""
-        for e in self.news_service._events_cache:
-            if e.id == event.id:
-                e.deck_id = deck_id
-                break
-        self.news_service._save_cache()
+        self.news_service.set_event_deck(event.id, deck_id)
         self._load_events()
 
     def _add_to_calendar(self, event: Tournament):
@@ -26,7 +26,7 @@ from kivy.properties import ObjectProperty, StringProperty, NumericProperty
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.user_database import UserDatabase, UserDeck
+from services.user_database import UserDeck, get_user_database
 from meta_data import META_DECKS, get_matchup, get_deck_matchups, Language
 
 
@@ -71,7 +71,7 @@ class ComparisonScreen(Screen):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = UserDatabase()
+        self.db = get_user_database()
         self.current_deck = None
         self.detected_archetype = None
         self._build_ui()
@@ -323,7 +323,7 @@ class ComparisonScreen(Screen):
         if not self.current_deck:
             return
 
-        card_names = [c.name.lower() for c in self.current_deck.cards]
+        card_names = [c.name_lower for c in self.current_deck.cards]
         all_text = ' '.join(card_names)
 
         detected = None
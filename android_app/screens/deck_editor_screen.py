@@ -31,7 +31,8 @@ from kivy.properties import ObjectProperty, StringProperty, NumericProperty
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.user_database import UserDatabase, UserDeck, UserCard
+from services.deck_import import SET_INFO
+from services.user_database import UserDatabase, UserDeck, UserCard, get_user_database
 
 
 # Color scheme
@@ -80,6 +81,9 @@ COMMON_CARDS = [
     {"name": "Basic Metal Energy", "set_code": "SVE", "set_number": "8", "type": "energy", "subtype": "basic"},
 ]
 
+# Regulation mark of each set offered in the editor
+SET_REGULATION_MARKS = {code: mark for code, (_, mark) in SET_INFO.items()}
+
 
 class DeckEditorScreen(Screen):
     """Screen for creating and editing decks."""
@@ -89,13 +93,20 @@ class DeckEditorScreen(Screen):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = UserDatabase()
+        self._db = None
         self.current_deck = None
         self.deck_cards = []  # Working copy of cards
         self.search_results = []
         self._search_scheduled = None
         self._build_ui()
 
+    @property
+    def db(self) -> UserDatabase:
+        """User database, opened on first use rather than at construction."""
+        if self._db is None:
+            self._db = get_user_database()
+        return self._db
+
     def _build_ui(self):
         """Build the editor screen UI."""
         main_layout = BoxLayout(orientation='vertical', padding=dp(12), spacing=dp(10))
@@ -544,7 +555,7 @@ class DeckEditorScreen(Screen):
         # Check if card already exists
         existing = None
         for card in self.deck_cards:
-            if card.name.lower() == card_data['name'].lower():
+            if card.name_lower == card_data['name'].lower():
                 existing = card
                 break
 
@@ -592,13 +603,7 @@ class DeckEditorScreen(Screen):
 
     def _get_regulation_mark(self, set_code):
         """Get regulation mark for a set code."""
-        marks = {
-            'SVI': 'G', 'PAL': 'G', 'OBF': 'G', 'MEW': 'G', 'PAR': 'G', 'PAF': 'G',
-            'TEF': 'H', 'TWM': 'H', 'SFA': 'H', 'SCR': 'H', 'SSP': 'H',
-            'PRE': 'I', 'JTG': 'I', 'ASC': 'I', 'DRI': 'I',
-            'SVE': 'H',
-        }
-        return marks.get(set_code.upper(), '?')
+        return SET_REGULATION_MARKS.get(set_code.upper(), '?')
 
     # =========================================================================
     # UI REFRESH
@@ -23,7 +23,7 @@ from kivy.uix.image import AsyncImage
 from kivy.uix.screenmanager import Screen
 from kivy.metrics import dp, sp
 from kivy.utils import get_color_from_hex
-from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics import Color, Rectangle, RoundedRectangle, BorderImage
 from kivy.clock import Clock
 from kivy.properties import ObjectProperty, StringProperty, ListProperty
 
@@ -31,7 +31,7 @@ from kivy.properties import ObjectProperty, StringProperty, ListProperty
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.deck_import import DeckImportService, ImportResult, ValidationSeverity
-from services.user_database import UserDatabase, UserDeck
+from services.user_database import UserDatabase, UserDeck, get_user_database
 
 
 # Color scheme (matching main app)
@@ -53,6 +53,13 @@ COLORS = {
     'info': '#2196f3',
 }
 
+# Shared 9-patch background for preview rows - one texture for every row
+ROW_BG_SOURCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'assets', 'rounded_bg.png'
+)
+ROW_BG_BORDER = (4, 4, 4, 4)
+
 
 class ImportScreen(Screen):
     """Screen for importing decks."""
@@ -61,12 +68,57 @@ class ImportScreen(Screen):
     status_text = StringProperty("")
     lang = StringProperty("en")
 
+    # Preview styling constants - computed once instead of per card row
+    _SURFACE_COLOR = get_color_from_hex(COLORS['surface'])
+    _TEXT_COLOR = get_color_from_hex(COLORS['text'])
+    _TEXT_SECONDARY_COLOR = get_color_from_hex(COLORS['text_secondary'])
+    _QTY_COLOR = get_color_from_hex(COLORS['primary'])
+    _SET_COLOR = get_color_from_hex(COLORS['text_muted'])
+    _WARNING_COLOR = get_color_from_hex(COLORS['warning'])
+    _INFO_COLOR = get_color_from_hex(COLORS['info'])
+    _SEVERITY_COLORS = {
+        ValidationSeverity.ERROR: get_color_from_hex(COLORS['danger']),
+        ValidationSeverity.WARNING: get_color_from_hex(COLORS['warning']),
+    }
+
+    _SUMMARY_HEIGHT = dp(120)
+    _SUMMARY_PADDING = dp(12)
+    _SUMMARY_SPACING = dp(8)
+    _SUMMARY_RADIUS = dp(8)
+    _STATS_HEIGHT = dp(30)
+    _STATS_TOTAL_FONT = sp(13)
+    _STATS_FONT = sp(12)
+    _ISSUE_FONT = sp(11)
+    _ISSUE_HEIGHT = dp(20)
+
+    _SECTION_FONT = sp(14)
+    _SECTION_HEIGHT = dp(35)
+    _SECTION_PADDING = [0, dp(10)]
+
+    _ROW_HEIGHT = dp(35)
+    _ROW_SPACING = dp(8)
+    _ROW_PADDING = [dp(8), 0]
+    _QTY_FONT = sp(14)
+    _QTY_WIDTH = dp(25)
+    _NAME_FONT = sp(13)
+    _SET_FONT = sp(11)
+    _SET_WIDTH = dp(70)
+    _ROT_FONT = sp(10)
+    _ROT_WIDTH = dp(20)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.import_service = DeckImportService()
-        self.db = UserDatabase()
+        self._db = None
         self._build_ui()
 
+    @property
+    def db(self) -> UserDatabase:
+        """User database, opened on first use rather than at construction."""
+        if self._db is None:
+            self._db = get_user_database()
+        return self._db
+
     def _build_ui(self):
         """Build the import screen UI."""
         # Main container
@@ -588,52 +640,48 @@ class ImportScreen(Screen):
         card = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=dp(120),
-            padding=dp(12),
-            spacing=dp(8)
+            height=self._SUMMARY_HEIGHT,
+            padding=self._SUMMARY_PADDING,
+            spacing=self._SUMMARY_SPACING
         )
 
         with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(8)])
+            Color(*self._SURFACE_COLOR)
+            RoundedRectangle(pos=card.pos, size=card.size, radius=[self._SUMMARY_RADIUS])
 
         # Stats row
-        stats = BoxLayout(size_hint_y=None, height=dp(30))
+        stats = BoxLayout(size_hint_y=None, height=self._STATS_HEIGHT)
         stats.add_widget(Label(
             text=f'Total: {deck.total_cards}/60',
-            font_size=sp(13),
-            color=get_color_from_hex(COLORS['text']),
+            font_size=self._STATS_TOTAL_FONT,
+            color=self._TEXT_COLOR,
             bold=True
         ))
         stats.add_widget(Label(
             text=f'Pokemon: {deck.pokemon_count}',
-            font_size=sp(12),
-            color=get_color_from_hex(COLORS['text_secondary'])
+            font_size=self._STATS_FONT,
+            color=self._TEXT_SECONDARY_COLOR
         ))
         stats.add_widget(Label(
             text=f'Trainers: {deck.trainer_count}',
-            font_size=sp(12),
-            color=get_color_from_hex(COLORS['text_secondary'])
+            font_size=self._STATS_FONT,
+            color=self._TEXT_SECONDARY_COLOR
         ))
         stats.add_widget(Label(
             text=f'Energy: {deck.energy_count}',
-            font_size=sp(12),
-            color=get_color_from_hex(COLORS['text_secondary'])
+            font_size=self._STATS_FONT,
+            color=self._TEXT_SECONDARY_COLOR
         ))
         card.add_widget(stats)
 
         # Issues
         for issue in issues[:3]:  # Show max 3 issues
-            color = COLORS['danger'] if issue.severity == ValidationSeverity.ERROR else \
-                    COLORS['warning'] if issue.severity == ValidationSeverity.WARNING else \
-                    COLORS['info']
-
             issue_label = Label(
                 text=f'• {issue.message_en}' if self.lang == 'en' else f'• {issue.message_pt}',
-                font_size=sp(11),
-                color=get_color_from_hex(color),
+                font_size=self._ISSUE_FONT,
+                color=self._SEVERITY_COLORS.get(issue.severity, self._INFO_COLOR),
                 size_hint_y=None,
-                height=dp(20),
+                height=self._ISSUE_HEIGHT,
                 halign='left',
                 valign='middle'
             )
@@ -646,74 +694,84 @@ class ImportScreen(Screen):
         """Create section header."""
         header = Label(
             text=text,
-            font_size=sp(14),
+            font_size=self._SECTION_FONT,
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=self._TEXT_COLOR,
             size_hint_y=None,
-            height=dp(35),
+            height=self._SECTION_HEIGHT,
             halign='left',
             valign='bottom',
-            padding=[0, dp(10)]
+            padding=self._SECTION_PADDING
         )
         header.bind(size=header.setter('text_size'))
         return header
 
+    def _update_row_bg(self, row, *args):
+        row._bg.pos = row.pos
+        row._bg.size = row.size
+
     def _create_card_row(self, card):
         """Create a row for a card."""
         row = BoxLayout(
             size_hint_y=None,
-            height=dp(35),
-            spacing=dp(8),
-            padding=[dp(8), 0]
+            height=self._ROW_HEIGHT,
+            spacing=self._ROW_SPACING,
+            padding=self._ROW_PADDING
         )
 
         with row.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            RoundedRectangle(pos=row.pos, size=row.size, radius=[dp(4)])
+            Color(*self._SURFACE_COLOR)
+            row._bg = BorderImage(
+                source=ROW_BG_SOURCE,
+                border=ROW_BG_BORDER,
+                pos=row.pos,
+                size=row.size
+            )
+        row.bind(pos=self._update_row_bg, size=self._update_row_bg)
 
         # Quantity
         qty = Label(
             text=str(card.quantity),
-            font_size=sp(14),
+            font_size=self._QTY_FONT,
             bold=True,
-            color=get_color_from_hex(COLORS['primary']),
+            color=self._QTY_COLOR,
             size_hint_x=None,
-            width=dp(25)
+            width=self._QTY_WIDTH
         )
         row.add_widget(qty)
 
         # Name
         name = Label(
             text=card.name,
-            font_size=sp(13),
-            color=get_color_from_hex(COLORS['text']),
+            font_size=self._NAME_FONT,
+            color=self._TEXT_COLOR,
             halign='left',
             valign='middle'
         )
         name.bind(size=name.setter('text_size'))
         row.add_widget(name)
 
-        # Set code
+        # Set code - fixed width and single line, so text_size is static
+        # and needs no size binding to right-align
         set_label = Label(
             text=f'{card.set_code} {card.set_number}',
-            font_size=sp(11),
-            color=get_color_from_hex(COLORS['text_muted']),
+            font_size=self._SET_FONT,
+            color=self._SET_COLOR,
             size_hint_x=None,
-            width=dp(70),
-            halign='right',
-            valign='middle'
+            width=self._SET_WIDTH,
+            text_size=(self._SET_WIDTH, None),
+            halign='right'
         )
-        set_label.bind(size=set_label.setter('text_size'))
         row.add_widget(set_label)
 
         # Rotation indicator
         if card.regulation_mark == 'G':
             rot_label = Label(
                 text='G',
-                font_size=sp(10),
-                color=get_color_from_hex(COLORS['warning']),
+                font_size=self._ROT_FONT,
+                color=self._WARNING_COLOR,
                 size_hint_x=None,
-                width=dp(20),
+                width=self._ROT_WIDTH,
                 bold=True
             )
             row.add_widget(rot_label)
@@ -11,19 +11,24 @@ Features:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
+from kivy.uix.widget import Widget
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.popup import Popup
 from kivy.uix.screenmanager import Screen
 from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.metrics import dp, sp
 from kivy.utils import get_color_from_hex
-from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics import Color, Rectangle, RoundedRectangle, InstructionGroup
 from kivy.clock import Clock
 from kivy.properties import StringProperty
 
@@ -55,24 +60,303 @@ COLORS = {
     'ai_purple': '#9c27b0',
 }
 
+# Parsed once at import - widgets share these tuples instead of re-parsing hex
+COLORS_RGBA = {name: tuple(get_color_from_hex(value)) for name, value in COLORS.items()}
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Truncate text to limit characters, adding '...' when it was cut."""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _sync_height_to_texture(instance, texture_size):
+    """Grow a wrapped Label to the height of its rendered text."""
+    instance.height = texture_size[1]
+
+
+def _sync_bg(instance, value):
+    """Keep a widget's ``_bg`` canvas instruction aligned with the widget."""
+    instance._bg.pos = instance.pos
+    instance._bg.size = instance.size
+
+
+class SharedBackgroundBehavior:
+    """
+    Row mixin that draws its ``_bg`` into the parent layout's shared group.
+
+    The recycle layout sets the surface Color once in its canvas.before;
+    rows only contribute their RoundedRectangle, so N rows issue one
+    color state change instead of N.
+    """
+
+    _bg_group = None
+
+    def on_parent(self, instance, parent):
+        if self._bg_group is not None:
+            self._bg_group.remove(self._bg)
+            self._bg_group = None
+        group = getattr(parent, 'bg_group', None)
+        if group is not None:
+            group.add(self._bg)
+            self._bg_group = group
+
+
+class ResultCardView(SharedBackgroundBehavior, RecycleDataViewBehavior, BoxLayout):
+    """Recyclable result card - child widgets are created once and re-bound to data."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            orientation='vertical',
+            padding=dp(10),
+            spacing=dp(4),
+            **kwargs
+        )
+
+        self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(6)])
+        self.bind(pos=_sync_bg, size=_sync_bg)
+
+        # Header row
+        header = BoxLayout(size_hint_y=None, height=dp(25))
+
+        self.source_badge = Label(
+            font_size=sp(10),
+            bold=True,
+            size_hint_x=None,
+            width=dp(80)
+        )
+        header.add_widget(self.source_badge)
+
+        self.title_label = Label(
+            font_size=sp(13),
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left'
+        )
+        self.title_label.bind(size=self.title_label.setter('text_size'))
+        header.add_widget(self.title_label)
+
+        self.add_widget(header)
+
+        # Deck detection, insight preview and card count - hidden when empty
+        self.deck_label = self._create_detail_label(sp(11), COLORS_RGBA['primary'])
+        self.insight_label = self._create_detail_label(sp(11), COLORS_RGBA['text_secondary'])
+        self.cards_label = self._create_detail_label(sp(10), COLORS_RGBA['text_muted'])
+
+    def _create_detail_label(self, font_size, color):
+        label = Label(
+            font_size=font_size,
+            color=color,
+            size_hint_y=None,
+            height=0,
+            halign='left'
+        )
+        label.bind(size=label.setter('text_size'))
+        self.add_widget(label)
+        return label
+
+    @staticmethod
+    def _set_detail(label, text, height):
+        label.text = text
+        label.height = height if text else 0
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self.source_badge.text = data['source_text']
+        self.source_badge.color = data['source_color']
+        self.title_label.text = data['title']
+        self._set_detail(self.deck_label, data['deck'], dp(20))
+        self._set_detail(self.insight_label, data['insight'], dp(20))
+        self._set_detail(self.cards_label, data['cards'], dp(18))
+        return super().refresh_view_attrs(rv, index, data)
+
+
+class HistoryCardView(SharedBackgroundBehavior, RecycleDataViewBehavior, BoxLayout):
+    """Recyclable history card - child widgets are created once and re-bound to data."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            orientation='horizontal',
+            padding=dp(10),
+            spacing=dp(8),
+            **kwargs
+        )
+        self.match_id = ''
+        self._rv = None
+
+        self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(6)])
+        self.bind(pos=_sync_bg, size=_sync_bg)
+
+        # Info
+        info = BoxLayout(orientation='vertical', spacing=dp(2))
+
+        self.title_label = Label(
+            font_size=sp(13),
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left'
+        )
+        self.title_label.bind(size=self.title_label.setter('text_size'))
+        info.add_widget(self.title_label)
+
+        self.meta_label = Label(
+            font_size=sp(10),
+            color=COLORS_RGBA['text_muted'],
+            halign='left'
+        )
+        self.meta_label.bind(size=self.meta_label.setter('text_size'))
+        info.add_widget(self.meta_label)
+
+        self.add_widget(info)
+
+        # View button
+        view_btn = Button(
+            text='View',
+            size_hint_x=None,
+            width=dp(60),
+            background_color=COLORS_RGBA['secondary'],
+            font_size=sp(12)
+        )
+        view_btn.bind(on_release=self._on_view)
+        self.add_widget(view_btn)
+
+        # Delete button
+        del_btn = Button(
+            text='×',
+            size_hint_x=None,
+            width=dp(40),
+            background_color=COLORS_RGBA['danger'],
+            font_size=sp(16)
+        )
+        del_btn.bind(on_release=self._on_delete)
+        self.add_widget(del_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self._rv = rv
+        self.match_id = data['match_id']
+        self.title_label.text = data['title']
+        self.meta_label.text = data['meta']
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_view(self, *args):
+        if self._rv is not None:
+            self._rv.owner._view_match(self.match_id)
+
+    def _on_delete(self, *args):
+        if self._rv is not None:
+            self._rv.owner._delete_match(self.match_id)
+
+
+def _create_recycle_view(owner, viewclass, row_height):
+    """Create a single-column RecycleView whose rows call back into owner."""
+    rv = RecycleView(viewclass=viewclass)
+    rv.owner = owner
+
+    layout = RecycleGridLayout(
+        cols=1,
+        spacing=dp(8),
+        padding=[0, dp(4)],
+        default_size=(None, row_height),
+        default_size_hint=(1, None),
+        size_hint_y=None
+    )
+    layout.bind(minimum_height=layout.setter('height'))
+
+    # Row backgrounds share one Color; each row adds its own rectangle
+    layout.bg_group = InstructionGroup()
+    layout.canvas.before.add(Color(*COLORS_RGBA['surface']))
+    layout.canvas.before.add(layout.bg_group)
+
+    rv.add_widget(layout)
+    return rv
+
+
 
 class MatchAnalysisScreen(Screen):
     """Screen for AI-powered match analysis."""
 
     lang = StringProperty("en")
 
+    HISTORY_LIMIT = 10
+    RESULTS_LIMIT = 5
+    POPUP_CARDS_LIMIT = 15
+
+    # Localized UI strings, looked up through T()
+    STRINGS = {
+        'en': {
+            'results_title': 'Analysis Results',
+            'no_results': 'No results yet',
+            'title': 'Match Analysis',
+            'ai_badge': '🤖 AI-Powered Analysis',
+            'tab_youtube': 'YouTube',
+            'tab_transcription': 'Transcription',
+            'tab_history': 'History',
+            'youtube_instructions': 'Paste a YouTube URL of a Pokemon TCG match:',
+            'analyze_video': 'Analyze Video',
+            'youtube_tip': '💡 Tip: Works best with TCG Live streams and tournament VODs',
+            'transcription_instructions': 'Paste a match transcription or play-by-play:',
+            'analyze_transcription': 'Analyze Transcription',
+            'history_empty': 'No analyzed matches yet.\nStart by processing a video or transcription!',
+            'error': 'Error',
+            'enter_url': 'Please enter a YouTube URL',
+            'enter_transcription': 'Please enter a transcription',
+            'close': 'Close',
+            'result_title': 'Match Analysis',
+        },
+        'pt': {
+            'results_title': 'Resultados da Análise',
+            'no_results': 'Sem resultados ainda',
+            'title': 'Análise de Partidas',
+            'ai_badge': '🤖 Análise com IA',
+            'tab_youtube': 'YouTube',
+            'tab_transcription': 'Transcrição',
+            'tab_history': 'Histórico',
+            'youtube_instructions': 'Cole a URL de um vídeo de partida Pokemon TCG:',
+            'analyze_video': 'Analisar Vídeo',
+            'youtube_tip': '💡 Dica: Funciona melhor com streams do TCG Live e VODs de torneios',
+            'transcription_instructions': 'Cole uma transcrição ou resumo da partida:',
+            'analyze_transcription': 'Analisar Transcrição',
+            'history_empty': 'Nenhuma partida analisada ainda.\nComece processando um vídeo ou transcrição!',
+            'error': 'Erro',
+            'enter_url': 'Por favor, insira uma URL do YouTube',
+            'enter_transcription': 'Por favor, insira uma transcrição',
+            'close': 'Fechar',
+            'result_title': 'Análise da Partida',
+        },
+    }
+
+    # Source badge color keys, resolved against COLORS_RGBA
+    _SOURCE_COLORS = {
+        MatchSource.YOUTUBE: 'danger',
+        MatchSource.TRANSCRIPTION: 'ai_purple',
+        MatchSource.VIDEO_FILE: 'secondary',
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.analysis_service = MatchAnalysisService()
+        # Every call that modifies the service runs on this one thread, so
+        # analyses and deletes never touch its matches or cache file at once
+        self._service_worker = ThreadPoolExecutor(max_workers=1)
         self.current_tab = 'youtube'
+        self._matches_cache = None
+        self._refresh_scheduled = None
+        self.results_rv = _create_recycle_view(self, ResultCardView, dp(100))
+        # History pane is built on first visit to the History tab
+        self._history_pane = None
+        self.history_rv = None
         self._build_ui()
 
+    def T(self, key: str) -> str:
+        """Get the UI string for key in the current language."""
+        return self.STRINGS[self.lang][key]
+
     def _build_ui(self):
         """Build the analysis screen UI."""
         main_layout = BoxLayout(orientation='vertical', padding=dp(12), spacing=dp(10))
 
         with main_layout.canvas.before:
-            Color(*get_color_from_hex(COLORS['background']))
+            Color(*COLORS_RGBA['background'])
             self._bg_rect = Rectangle(pos=main_layout.pos, size=main_layout.size)
         main_layout.bind(pos=self._update_bg, size=self._update_bg)
 
@@ -94,10 +378,10 @@ class MatchAnalysisScreen(Screen):
 
         # Results/History section
         results_label = Label(
-            text='Analysis Results' if self.lang == 'en' else 'Resultados da Análise',
+            text=self.T('results_title'),
             font_size=sp(14),
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=COLORS_RGBA['text'],
             size_hint_y=None,
             height=dp(30),
             halign='left',
@@ -106,22 +390,25 @@ class MatchAnalysisScreen(Screen):
         results_label.bind(size=results_label.setter('text_size'))
         main_layout.add_widget(results_label)
 
-        # Results scroll
-        scroll = ScrollView(size_hint_y=0.4)
-        self.results_grid = GridLayout(
-            cols=1,
-            spacing=dp(8),
+        # Results list (recycled) or empty-state label
+        self.results_area = BoxLayout(orientation='vertical', size_hint_y=0.4)
+        self.results_empty = Label(
+            text=self.T('no_results'),
+            font_size=sp(13),
+            color=COLORS_RGBA['text_muted'],
             size_hint_y=None,
-            padding=[0, dp(4)]
+            height=dp(40)
         )
-        self.results_grid.bind(minimum_height=self.results_grid.setter('height'))
-        scroll.add_widget(self.results_grid)
-        main_layout.add_widget(scroll)
+        main_layout.add_widget(self.results_area)
 
         self.add_widget(main_layout)
 
+        # Static input panes are built once and swapped on tab switch
+        self._youtube_pane = self._build_youtube_pane()
+        self._transcription_pane = self._build_transcription_pane()
+
         # Initialize with YouTube tab
-        self._show_youtube_input()
+        self.input_area.add_widget(self._youtube_pane)
 
     def _update_bg(self, *args):
         self._bg_rect.pos = args[0].pos
@@ -135,17 +422,17 @@ class MatchAnalysisScreen(Screen):
             text='<',
             size_hint_x=None,
             width=dp(40),
-            background_color=get_color_from_hex(COLORS['text_muted']),
+            background_color=COLORS_RGBA['text_muted'],
             font_size=sp(20)
         )
         back_btn.bind(on_release=self._go_back)
         header.add_widget(back_btn)
 
         title = Label(
-            text='Match Analysis' if self.lang == 'en' else 'Análise de Partidas',
+            text=self.T('title'),
             font_size=sp(18),
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=COLORS_RGBA['text'],
             halign='left',
             valign='middle'
         )
@@ -159,16 +446,12 @@ class MatchAnalysisScreen(Screen):
         badge = BoxLayout(size_hint_y=None, height=dp(35), padding=[dp(8), dp(4)])
 
         with badge.canvas.before:
-            Color(*get_color_from_hex(COLORS['ai_purple']))
+            Color(*COLORS_RGBA['ai_purple'])
             badge._bg = RoundedRectangle(pos=badge.pos, size=badge.size, radius=[dp(6)])
-        badge.bind(
-            pos=lambda *a: setattr(badge._bg, 'pos', badge.pos),
-            size=lambda *a: setattr(badge._bg, 'size', badge.size)
-        )
+        badge.bind(pos=_sync_bg, size=_sync_bg)
 
-        text = '🤖 AI-Powered Analysis' if self.lang == 'en' else '🤖 Análise com IA'
         label = Label(
-            text=text,
+            text=self.T('ai_badge'),
             font_size=sp(12),
             bold=True,
             color=(1, 1, 1, 1)
@@ -181,29 +464,19 @@ class MatchAnalysisScreen(Screen):
         """Create tab buttons."""
         tabs = BoxLayout(size_hint_y=None, height=dp(40), spacing=dp(8))
 
-        self.youtube_tab = Button(
-            text='YouTube',
-            background_color=get_color_from_hex(COLORS['primary']),
-            font_size=sp(13)
-        )
-        self.youtube_tab.bind(on_release=lambda x: self._switch_tab('youtube'))
-        tabs.add_widget(self.youtube_tab)
+        self._tab_buttons = {}
+        for tab_name in ('youtube', 'transcription', 'history'):
+            btn = Button(
+                text=self.T(f'tab_{tab_name}'),
+                background_color=COLORS_RGBA['text_muted'],
+                font_size=sp(13)
+            )
+            btn.tab_name = tab_name
+            btn.bind(on_release=self._on_tab_release)
+            tabs.add_widget(btn)
+            self._tab_buttons[tab_name] = btn
 
-        self.transcription_tab = Button(
-            text='Transcription' if self.lang == 'en' else 'Transcrição',
-            background_color=get_color_from_hex(COLORS['text_muted']),
-            font_size=sp(13)
-        )
-        self.transcription_tab.bind(on_release=lambda x: self._switch_tab('transcription'))
-        tabs.add_widget(self.transcription_tab)
-
-        self.history_tab = Button(
-            text='History' if self.lang == 'en' else 'Histórico',
-            background_color=get_color_from_hex(COLORS['text_muted']),
-            font_size=sp(13)
-        )
-        self.history_tab.bind(on_release=lambda x: self._switch_tab('history'))
-        tabs.add_widget(self.history_tab)
+        self._tab_buttons[self.current_tab].background_color = COLORS_RGBA['primary']
 
         return tabs
 
@@ -211,40 +484,37 @@ class MatchAnalysisScreen(Screen):
     # TAB SWITCHING
     # =========================================================================
 
+    def _on_tab_release(self, button):
+        self._switch_tab(button.tab_name)
+
     def _switch_tab(self, tab):
         """Switch between tabs."""
         self.current_tab = tab
 
         # Update tab button colors
-        self.youtube_tab.background_color = get_color_from_hex(
-            COLORS['primary'] if tab == 'youtube' else COLORS['text_muted']
-        )
-        self.transcription_tab.background_color = get_color_from_hex(
-            COLORS['primary'] if tab == 'transcription' else COLORS['text_muted']
-        )
-        self.history_tab.background_color = get_color_from_hex(
-            COLORS['primary'] if tab == 'history' else COLORS['text_muted']
-        )
+        active = COLORS_RGBA['primary']
+        inactive = COLORS_RGBA['text_muted']
+        for name, button in self._tab_buttons.items():
+            button.background_color = active if name == tab else inactive
 
         # Update input area
         self.input_area.clear_widgets()
         if tab == 'youtube':
-            self._show_youtube_input()
+            self.input_area.add_widget(self._youtube_pane)
         elif tab == 'transcription':
-            self._show_transcription_input()
+            self.input_area.add_widget(self._transcription_pane)
         else:
             self._show_history()
 
-    def _show_youtube_input(self):
-        """Show YouTube URL input."""
+    def _build_youtube_pane(self):
+        """Build the YouTube URL input pane."""
         container = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(8))
 
         # Instructions
         instructions = Label(
-            text='Paste a YouTube URL of a Pokemon TCG match:' if self.lang == 'en' else
-                 'Cole a URL de um vídeo de partida Pokemon TCG:',
+            text=self.T('youtube_instructions'),
             font_size=sp(13),
-            color=get_color_from_hex(COLORS['text_secondary']),
+            color=COLORS_RGBA['text_secondary'],
             size_hint_y=None,
             height=dp(25),
             halign='left'
@@ -255,19 +525,16 @@ class MatchAnalysisScreen(Screen):
         # URL input
         input_box = BoxLayout(padding=dp(2), size_hint_y=None, height=dp(45))
         with input_box.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
+            Color(*COLORS_RGBA['surface'])
             input_box._bg = RoundedRectangle(pos=input_box.pos, size=input_box.size, radius=[dp(6)])
-        input_box.bind(
-            pos=lambda *a: setattr(input_box._bg, 'pos', input_box.pos),
-            size=lambda *a: setattr(input_box._bg, 'size', input_box.size)
-        )
+        input_box.bind(pos=_sync_bg, size=_sync_bg)
 
         self.url_input = TextInput(
             hint_text='https://youtube.com/watch?v=...',
             multiline=False,
             font_size=sp(13),
             background_color=(0, 0, 0, 0),
-            foreground_color=get_color_from_hex(COLORS['text']),
+            foreground_color=COLORS_RGBA['text'],
             padding=[dp(10), dp(10)]
         )
         input_box.add_widget(self.url_input)
@@ -275,8 +542,8 @@ class MatchAnalysisScreen(Screen):
 
         # Process button
         process_btn = Button(
-            text='Analyze Video' if self.lang == 'en' else 'Analisar Vídeo',
-            background_color=get_color_from_hex(COLORS['secondary']),
+            text=self.T('analyze_video'),
+            background_color=COLORS_RGBA['secondary'],
             font_size=sp(14),
             bold=True,
             size_hint_y=None,
@@ -284,33 +551,32 @@ class MatchAnalysisScreen(Screen):
         )
         process_btn.bind(on_release=self._process_youtube)
         container.add_widget(process_btn)
+        self._youtube_btn = process_btn
 
         # Tips
         tips = Label(
-            text='💡 Tip: Works best with TCG Live streams and tournament VODs' if self.lang == 'en' else
-                 '💡 Dica: Funciona melhor com streams do TCG Live e VODs de torneios',
+            text=self.T('youtube_tip'),
             font_size=sp(11),
-            color=get_color_from_hex(COLORS['text_muted']),
+            color=COLORS_RGBA['text_muted'],
             size_hint_y=None,
             height=dp(25),
             halign='center'
         )
         container.add_widget(tips)
 
-        container.add_widget(BoxLayout())  # Spacer
+        container.add_widget(Widget())  # Spacer - a bare Widget has no layout pass
 
-        self.input_area.add_widget(container)
+        return container
 
-    def _show_transcription_input(self):
-        """Show transcription text input."""
+    def _build_transcription_pane(self):
+        """Build the transcription text input pane."""
         container = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(8))
 
         # Instructions
         instructions = Label(
-            text='Paste a match transcription or play-by-play:' if self.lang == 'en' else
-                 'Cole uma transcrição ou resumo da partida:',
+            text=self.T('transcription_instructions'),
             font_size=sp(13),
-            color=get_color_from_hex(COLORS['text_secondary']),
+            color=COLORS_RGBA['text_secondary'],
             size_hint_y=None,
             height=dp(25),
             halign='left'
@@ -321,19 +587,16 @@ class MatchAnalysisScreen(Screen):
         # Text input
         input_box = BoxLayout(padding=dp(2))
         with input_box.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
+            Color(*COLORS_RGBA['surface'])
             input_box._bg = RoundedRectangle(pos=input_box.pos, size=input_box.size, radius=[dp(6)])
-        input_box.bind(
-            pos=lambda *a: setattr(input_box._bg, 'pos', input_box.pos),
-            size=lambda *a: setattr(input_box._bg, 'size', input_box.size)
-        )
+        input_box.bind(pos=_sync_bg, size=_sync_bg)
 
         self.transcription_input = TextInput(
             hint_text='Turn 1: I start with Charmander, attach Fire Energy...\nTurn 2: Play Rare Candy, evolve to Charizard ex...',
             multiline=True,
             font_size=sp(12),
             background_color=(0, 0, 0, 0),
-            foreground_color=get_color_from_hex(COLORS['text']),
+            foreground_color=COLORS_RGBA['text'],
             padding=[dp(10), dp(10)]
         )
         input_box.add_widget(self.transcription_input)
@@ -341,8 +604,8 @@ class MatchAnalysisScreen(Screen):
 
         # Process button
         process_btn = Button(
-            text='Analyze Transcription' if self.lang == 'en' else 'Analisar Transcrição',
-            background_color=get_color_from_hex(COLORS['ai_purple']),
+            text=self.T('analyze_transcription'),
+            background_color=COLORS_RGBA['ai_purple'],
             font_size=sp(14),
             bold=True,
             size_hint_y=None,
@@ -350,269 +613,208 @@ class MatchAnalysisScreen(Screen):
         )
         process_btn.bind(on_release=self._process_transcription)
         container.add_widget(process_btn)
+        self._transcription_btn = process_btn
+
+        return container
 
-        self.input_area.add_widget(container)
+    def _build_history_pane(self):
+        """Build the history pane, its RecycleView and empty state once."""
+        self._history_pane = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(8))
+        self.history_rv = _create_recycle_view(self, HistoryCardView, dp(60))
+        self._history_empty = Label(
+            text=self.T('history_empty'),
+            font_size=sp(13),
+            color=COLORS_RGBA['text_secondary'],
+            halign='center'
+        )
 
     def _show_history(self):
         """Show analysis history."""
-        container = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(8))
+        if self._history_pane is None:
+            self._build_history_pane()
 
-        matches = self.analysis_service.get_all_matches()
+        pane = self._history_pane
+        pane.clear_widgets()
 
-        if not matches:
-            empty = Label(
-                text='No analyzed matches yet.\nStart by processing a video or transcription!' if self.lang == 'en' else
-                     'Nenhuma partida analisada ainda.\nComece processando um vídeo ou transcrição!',
-                font_size=sp(13),
-                color=get_color_from_hex(COLORS['text_secondary']),
-                halign='center'
-            )
-            container.add_widget(empty)
+        if not self._get_matches():
+            pane.add_widget(self._history_empty)
         else:
-            scroll = ScrollView()
-            grid = GridLayout(cols=1, spacing=dp(8), size_hint_y=None)
-            grid.bind(minimum_height=grid.setter('height'))
-
-            for match in matches[:10]:  # Show last 10
-                card = self._create_match_history_card(match)
-                grid.add_widget(card)
+            # Attach the list empty so the tap frame only paints the tab
+            # change; rows are bound on the next frame
+            self.history_rv.data = []
+            pane.add_widget(self.history_rv)
+            Clock.schedule_once(self._fill_history, 0)
 
-            scroll.add_widget(grid)
-            container.add_widget(scroll)
+        self.input_area.add_widget(pane)
 
-        self.input_area.add_widget(container)
+    def _fill_history(self, dt):
+        """Bind the history rows once the history pane is on screen."""
+        if self.current_tab != 'history':
+            return
+        self.history_rv.data = [self._history_card_data(match) for match in self._get_matches()]
 
     # =========================================================================
     # PROCESSING
     # =========================================================================
 
+    def _get_matches(self) -> list[MatchData]:
+        """Get the most recent matches, memoized until the history changes."""
+        if self._matches_cache is None:
+            self._matches_cache = self.analysis_service.get_recent_matches(self.HISTORY_LIMIT)
+        return self._matches_cache
+
+    def _invalidate_matches(self):
+        """Drop the memoized match list after the history was modified."""
+        self._matches_cache = None
+
     def on_enter(self):
         """Called when screen is displayed."""
-        self._refresh_results()
+        # Matches only change through this screen, so the results list is
+        # current unless the memoized list was dropped
+        if self._matches_cache is None:
+            self._schedule_refresh()
+
+    def _run_analysis(self, button, work, on_done):
+        """
+        Run an analysis call on the service worker thread.
+
+        The button is disabled while the worker runs; on_done receives the
+        resulting MatchData back on the UI thread, a failed one if the call
+        raised.
+        """
+        button.disabled = True
+
+        def finish(match):
+            button.disabled = False
+            self._invalidate_matches()
+            on_done(match)
+
+        def worker():
+            try:
+                match = work()
+            except Exception as e:
+                # Always report back, or the button would stay disabled
+                match = MatchData(status=ProcessingStatus.FAILED, error_message=str(e))
+            Clock.schedule_once(lambda dt: finish(match), 0)
+
+        self._service_worker.submit(worker)
 
     def _process_youtube(self, *args):
         """Process YouTube URL."""
         url = self.url_input.text.strip()
         if not url:
             self._show_message(
-                'Error' if self.lang == 'en' else 'Erro',
-                'Please enter a YouTube URL' if self.lang == 'en' else 'Por favor, insira uma URL do YouTube'
+                self.T('error'),
+                self.T('enter_url')
             )
             return
 
-        # Process the URL
-        match = self.analysis_service.process_youtube_url(url)
+        # Fetching video metadata hits the network - keep it off the UI thread
+        self._run_analysis(
+            self._youtube_btn,
+            lambda: self.analysis_service.process_youtube_url(url),
+            self._on_youtube_processed
+        )
 
+    def _on_youtube_processed(self, match: MatchData):
+        """Show the outcome of a YouTube analysis."""
         if match.status == ProcessingStatus.FAILED:
             self._show_message(
-                'Error' if self.lang == 'en' else 'Erro',
+                self.T('error'),
                 match.error_message
             )
         else:
             self._show_match_result(match)
             self.url_input.text = ''
-            self._refresh_results()
+            self._schedule_refresh()
 
     def _process_transcription(self, *args):
         """Process transcription text."""
         text = self.transcription_input.text.strip()
         if not text:
             self._show_message(
-                'Error' if self.lang == 'en' else 'Erro',
-                'Please enter a transcription' if self.lang == 'en' else 'Por favor, insira uma transcrição'
+                self.T('error'),
+                self.T('enter_transcription')
             )
             return
 
-        # Process the transcription
-        match = self.analysis_service.process_transcription(text)
-        self._show_match_result(match)
-        self.transcription_input.text = ''
+        self._run_analysis(
+            self._transcription_btn,
+            lambda: self.analysis_service.process_transcription(text),
+            self._on_transcription_processed
+        )
+
+    def _on_transcription_processed(self, match: MatchData):
+        """Show the outcome of a transcription analysis."""
+        if match.status == ProcessingStatus.FAILED:
+            self._show_message(
+                self.T('error'),
+                match.error_message
+            )
+        else:
+            self._show_match_result(match)
+            self.transcription_input.text = ''
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Coalesce refresh requests into a single rebuild before the next frame."""
+        if self._refresh_scheduled is None:
+            self._refresh_scheduled = Clock.schedule_once(self._do_refresh, 0)
+
+    def _do_refresh(self, dt):
+        self._refresh_scheduled = None
         self._refresh_results()
 
     def _refresh_results(self):
         """Refresh results display."""
-        self.results_grid.clear_widgets()
+        self.results_area.clear_widgets()
 
-        matches = self.analysis_service.get_all_matches()[:5]  # Last 5
+        matches = self._get_matches()
 
         if not matches:
-            empty = Label(
-                text='No results yet' if self.lang == 'en' else 'Sem resultados ainda',
-                font_size=sp(13),
-                color=get_color_from_hex(COLORS['text_muted']),
-                size_hint_y=None,
-                height=dp(40)
-            )
-            self.results_grid.add_widget(empty)
+            self.results_rv.data = []
+            self.results_area.add_widget(self.results_empty)
             return
 
-        for match in matches:
-            card = self._create_result_card(match)
-            self.results_grid.add_widget(card)
+        self.results_rv.data = [
+            self._result_card_data(match) for match in islice(matches, self.RESULTS_LIMIT)
+        ]
+        self.results_area.add_widget(self.results_rv)
 
     # =========================================================================
     # UI COMPONENTS
     # =========================================================================
 
-    def _create_result_card(self, match: MatchData):
-        """Create a result card for a processed match."""
-        card = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=dp(100),
-            padding=dp(10),
-            spacing=dp(4)
-        )
-
-        with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            card._bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(6)])
-        card.bind(
-            pos=lambda *a, c=card: setattr(c._bg, 'pos', c.pos),
-            size=lambda *a, c=card: setattr(c._bg, 'size', c.size)
-        )
-
-        # Header row
-        header = BoxLayout(size_hint_y=None, height=dp(25))
-
-        # Source badge
-        source_colors = {
-            MatchSource.YOUTUBE: COLORS['danger'],
-            MatchSource.TRANSCRIPTION: COLORS['ai_purple'],
-            MatchSource.VIDEO_FILE: COLORS['secondary'],
-        }
-        source_text = match.source.value.title()
-
-        source_badge = Label(
-            text=source_text,
-            font_size=sp(10),
-            bold=True,
-            color=get_color_from_hex(source_colors.get(match.source, COLORS['text_muted'])),
-            size_hint_x=None,
-            width=dp(80)
-        )
-        header.add_widget(source_badge)
-
-        # Title
-        title = Label(
-            text=match.title[:30] + ('...' if len(match.title) > 30 else ''),
-            font_size=sp(13),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            halign='left'
-        )
-        title.bind(size=title.setter('text_size'))
-        header.add_widget(title)
-
-        card.add_widget(header)
-
-        # Deck detection
+    def _result_card_data(self, match: MatchData) -> dict:
+        """Build the RecycleView data entry for a result card."""
+        deck = ''
         if match.player1_deck and match.player1_deck != "Unknown":
-            deck_label = Label(
-                text=f'🃏 Deck: {match.player1_deck}',
-                font_size=sp(11),
-                color=get_color_from_hex(COLORS['primary']),
-                size_hint_y=None,
-                height=dp(20),
-                halign='left'
-            )
-            deck_label.bind(size=deck_label.setter('text_size'))
-            card.add_widget(deck_label)
+            deck = f'🃏 Deck: {match.player1_deck}'
 
-        # Insights preview
+        insight = ''
         if match.insights:
-            insight_text = match.insights[0][:50] + ('...' if len(match.insights[0]) > 50 else '')
-            insight_label = Label(
-                text=f'💡 {insight_text}',
-                font_size=sp(11),
-                color=get_color_from_hex(COLORS['text_secondary']),
-                size_hint_y=None,
-                height=dp(20),
-                halign='left'
-            )
-            insight_label.bind(size=insight_label.setter('text_size'))
-            card.add_widget(insight_label)
+            insight = f'💡 {_ellipsize(match.insights[0], 50)}'
 
-        # Cards count
+        cards = ''
         if match.cards_identified:
-            cards_label = Label(
-                text=f'🎴 {len(match.cards_identified)} cards identified',
-                font_size=sp(10),
-                color=get_color_from_hex(COLORS['text_muted']),
-                size_hint_y=None,
-                height=dp(18),
-                halign='left'
-            )
-            cards_label.bind(size=cards_label.setter('text_size'))
-            card.add_widget(cards_label)
-
-        return card
-
-    def _create_match_history_card(self, match: MatchData):
-        """Create a history card for a match."""
-        card = BoxLayout(
-            orientation='horizontal',
-            size_hint_y=None,
-            height=dp(60),
-            padding=dp(10),
-            spacing=dp(8)
-        )
-
-        with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            card._bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(6)])
-        card.bind(
-            pos=lambda *a, c=card: setattr(c._bg, 'pos', c.pos),
-            size=lambda *a, c=card: setattr(c._bg, 'size', c.size)
-        )
-
-        # Info
-        info = BoxLayout(orientation='vertical', spacing=dp(2))
-
-        title = Label(
-            text=match.title[:25] + ('...' if len(match.title) > 25 else ''),
-            font_size=sp(13),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            halign='left'
-        )
-        title.bind(size=title.setter('text_size'))
-        info.add_widget(title)
-
-        meta = Label(
-            text=f'{match.source.value} • {len(match.cards_identified)} cards',
-            font_size=sp(10),
-            color=get_color_from_hex(COLORS['text_muted']),
-            halign='left'
-        )
-        meta.bind(size=meta.setter('text_size'))
-        info.add_widget(meta)
-
-        card.add_widget(info)
-
-        # View button
-        view_btn = Button(
-            text='View',
-            size_hint_x=None,
-            width=dp(60),
-            background_color=get_color_from_hex(COLORS['secondary']),
-            font_size=sp(12)
-        )
-        view_btn.bind(on_release=lambda x, m=match: self._show_match_result(m))
-        card.add_widget(view_btn)
-
-        # Delete button
-        del_btn = Button(
-            text='×',
-            size_hint_x=None,
-            width=dp(40),
-            background_color=get_color_from_hex(COLORS['danger']),
-            font_size=sp(16)
-        )
-        del_btn.bind(on_release=lambda x, m=match: self._delete_match(m))
-        card.add_widget(del_btn)
+            cards = f'🎴 {len(match.cards_identified)} cards identified'
+
+        return {
+            'source_text': match.source.value.title(),
+            'source_color': COLORS_RGBA[self._SOURCE_COLORS.get(match.source, 'text_muted')],
+            'title': _ellipsize(match.title, 30),
+            'deck': deck,
+            'insight': insight,
+            'cards': cards,
+        }
 
-        return card
+    def _history_card_data(self, match: MatchData) -> dict:
+        """Build the RecycleView data entry for a history card."""
+        return {
+            'match_id': match.id,
+            'title': _ellipsize(match.title, 25),
+            'meta': f'{match.source.value} • {len(match.cards_identified)} cards',
+        }
 
     def _show_match_result(self, match: MatchData):
         """Show detailed match result popup."""
@@ -623,7 +825,7 @@ class MatchAnalysisScreen(Screen):
             text=match.title,
             font_size=sp(16),
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=COLORS_RGBA['text'],
             size_hint_y=None,
             height=dp(30)
         ))
@@ -638,7 +840,7 @@ class MatchAnalysisScreen(Screen):
             details.add_widget(Label(
                 text=f'🃏 Detected Deck: {match.player1_deck}',
                 font_size=sp(13),
-                color=get_color_from_hex(COLORS['primary']),
+                color=COLORS_RGBA['primary'],
                 size_hint_y=None,
                 height=dp(25)
             ))
@@ -649,17 +851,18 @@ class MatchAnalysisScreen(Screen):
                 text=f'🎴 Cards Identified ({len(match.cards_identified)}):',
                 font_size=sp(12),
                 bold=True,
-                color=get_color_from_hex(COLORS['text']),
+                color=COLORS_RGBA['text'],
                 size_hint_y=None,
                 height=dp(25)
             ))
-            cards_text = ', '.join(match.cards_identified[:15])
-            if len(match.cards_identified) > 15:
-                cards_text += f' (+{len(match.cards_identified) - 15} more)'
+            cards_text = ', '.join(islice(match.cards_identified, self.POPUP_CARDS_LIMIT))
+            hidden = len(match.cards_identified) - self.POPUP_CARDS_LIMIT
+            if hidden > 0:
+                cards_text += f' (+{hidden} more)'
             details.add_widget(Label(
                 text=cards_text,
                 font_size=sp(11),
-                color=get_color_from_hex(COLORS['text_secondary']),
+                color=COLORS_RGBA['text_secondary'],
                 size_hint_y=None,
                 height=dp(40),
                 text_size=(dp(280), None)
@@ -671,32 +874,35 @@ class MatchAnalysisScreen(Screen):
                 text='💡 Insights:',
                 font_size=sp(12),
                 bold=True,
-                color=get_color_from_hex(COLORS['text']),
+                color=COLORS_RGBA['text'],
                 size_hint_y=None,
                 height=dp(25)
             ))
-            for insight in match.insights:
-                details.add_widget(Label(
-                    text=f'• {insight}',
-                    font_size=sp(11),
-                    color=get_color_from_hex(COLORS['text_secondary']),
-                    size_hint_y=None,
-                    height=dp(22)
-                ))
+            # One wrapped Label for the whole list instead of one per insight
+            insights_label = Label(
+                text='\n'.join(f'• {insight}' for insight in match.insights),
+                font_size=sp(11),
+                color=COLORS_RGBA['text_secondary'],
+                size_hint_y=None,
+                height=dp(22) * len(match.insights),
+                text_size=(dp(280), None)
+            )
+            insights_label.bind(texture_size=_sync_height_to_texture)
+            details.add_widget(insights_label)
 
         scroll.add_widget(details)
         content.add_widget(scroll)
 
         # Close button
         close_btn = Button(
-            text='Close' if self.lang == 'en' else 'Fechar',
+            text=self.T('close'),
             size_hint_y=None,
             height=dp(45),
-            background_color=get_color_from_hex(COLORS['primary'])
+            background_color=COLORS_RGBA['primary']
         )
 
         popup = Popup(
-            title='Match Analysis' if self.lang == 'en' else 'Análise da Partida',
+            title=self.T('result_title'),
             content=content,
             size_hint=(0.9, 0.8)
         )
@@ -704,11 +910,25 @@ class MatchAnalysisScreen(Screen):
         content.add_widget(close_btn)
         popup.open()
 
-    def _delete_match(self, match: MatchData):
+    def _view_match(self, match_id: str):
+        """Show the result popup for a match in history."""
+        match = self.analysis_service.get_match(match_id)
+        if match:
+            self._show_match_result(match)
+
+    def _delete_match(self, match_id: str):
         """Delete a match from history."""
-        self.analysis_service.delete_match(match.id)
-        self._switch_tab('history')
-        self._refresh_results()
+        # Queued behind any running analysis, which may be appending to the cache
+        future = self._service_worker.submit(self.analysis_service.delete_match, match_id)
+        future.add_done_callback(lambda f: Clock.schedule_once(self._on_match_deleted, 0))
+
+    def _on_match_deleted(self, dt):
+        """Refresh the history once a delete has finished."""
+        self._invalidate_matches()
+        # Rebuild the history pane only if the user is still looking at it
+        if self.current_tab == 'history':
+            self._switch_tab('history')
+        self._schedule_refresh()
 
     def _show_message(self, title, message):
         """Show a message popup."""
@@ -724,7 +944,7 @@ class MatchAnalysisScreen(Screen):
             text='OK',
             size_hint_y=None,
             height=dp(40),
-            background_color=get_color_from_hex(COLORS['primary'])
+            background_color=COLORS_RGBA['primary']
         )
 
         popup = Popup(
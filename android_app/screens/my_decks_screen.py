@@ -13,24 +13,27 @@ Responsive for Samsung Galaxy Z Fold 6:
 """
 
 import os
-import sys
+import threading
 
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
+from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.screenmanager import Screen
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.metrics import dp, sp
 from kivy.utils import get_color_from_hex
-from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics import Color, Rectangle, BorderImage
+from kivy.core.text import Label as CoreLabel
 from kivy.properties import StringProperty
 from kivy.clock import Clock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from services.user_database import UserDatabase, UserDeck
+# services/ and utils/ resolve from the app directory, which main.py puts
+# first on sys.path
+from services.user_database import UserDeck, get_user_database
 from utils.responsive import get_responsive_manager
 
 
@@ -52,170 +55,509 @@ COLORS = {
     'border': '#e0e0e0',
 }
 
+# Parsed once at import - widgets share these tuples instead of re-parsing hex
+COLORS_RGBA = {name: tuple(get_color_from_hex(value)) for name, value in COLORS.items()}
+
+
+# Shared 9-patch background for deck cards and the active deck pill - one
+# white texture, tinted by the preceding Color
+CARD_BG_SOURCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'assets', 'card_bg.png'
+)
+CARD_BG_BORDER = (30, 30, 30, 30)
+
+
+def _sync_bg(instance, value):
+    """Keep a widget's ``_bg`` canvas instruction aligned with the widget."""
+    instance._bg.pos = instance.pos
+    instance._bg.size = instance.size
+
+
+# Rendered badge textures keyed by (text, font_size, bold); a language or
+# font scale change simply produces new keys
+_BADGE_TEXTURES = {}
+
+
+def _get_badge_texture(text, font_size, bold=False):
+    """Render a badge caption once and return the shared texture."""
+    key = (text, font_size, bold)
+    texture = _BADGE_TEXTURES.get(key)
+    if texture is None:
+        label = CoreLabel(text=text, font_size=font_size, bold=bold)
+        label.refresh()
+        texture = _BADGE_TEXTURES[key] = label.texture
+    return texture
+
+
+# Deck card metrics keyed by (screen_mode, font_scale)
+_CARD_METRICS = {}
+
+
+def _get_card_metrics(responsive):
+    """
+    Return the dp/sp values used by deck cards for the current screen mode.
+
+    Computed once per mode/font scale so building and re-binding cards
+    doesn't repeat the same metric conversions for every deck.
+    """
+    key = (responsive.screen_mode, responsive.font_scale)
+    metrics = _CARD_METRICS.get(key)
+    if metrics is None:
+        fs = responsive.font_scale
+        is_main = responsive.is_main_mode
+        is_cover = responsive.is_cover_mode
+        metrics = _CARD_METRICS[key] = {
+            'card_height': dp(140) if is_main else (dp(120) if is_cover else dp(130)),
+            'padding': dp(16) if is_main else dp(12),
+            'spacing': dp(10),
+            'radius': dp(10),
+            'top_row_height': dp(30),
+            'stats_row_height': dp(24),
+            'btn_height': dp(44) if is_main else dp(40),
+            'active_badge_width': dp(80),
+            'incomplete_badge_width': dp(90),
+            'name_fs': sp(18 * fs),
+            'active_badge_fs': sp(12 * fs),
+            'incomplete_badge_fs': sp(11 * fs),
+            'stats_fs': sp(13 * fs),
+            'btn_fs': sp(14 * fs),
+        }
+    return metrics
+
+
+class DeckCard(RecycleDataViewBehavior, RelativeLayout):
+    """
+    Recyclable deck card - child widgets are created once and re-bound to data.
+
+    Only about a viewport's worth of cards exist at any time; scrolling and
+    refreshes update their labels and swap the optional buttons in and out.
+    Labels are placed directly on the card by _layout_rows instead of
+    through nested row layouts.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.deck_id = None
+        self._rv = None
+        self._metrics = None
+
+        # RelativeLayout canvas is in local coordinates - only size changes
+        with self.canvas.before:
+            Color(*COLORS_RGBA['surface'])
+            self._bg = BorderImage(
+                source=CARD_BG_SOURCE,
+                border=CARD_BG_BORDER,
+                pos=(0, 0),
+                size=self.size
+            )
+
+        # Top row: Name + Active indicator
+        self.name_label = Label(
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left',
+            valign='middle',
+            size_hint=(None, None)
+        )
+        self.name_label.bind(size=self.name_label.setter('text_size'))
+        self.add_widget(self.name_label)
+
+        # Badges are drawn straight from cached text textures rather than
+        # Label widgets; their slots collapse to zero width when unused
+        self._active_badge_width = 0
+        self._incomplete_badge_width = 0
+        with self.canvas:
+            Color(*COLORS_RGBA['primary'])
+            self._active_badge = Rectangle(size=(0, 0))
+            Color(*COLORS_RGBA['warning'])
+            self._incomplete_badge = Rectangle(size=(0, 0))
+
+        # Stats row
+        self.stats_label = Label(
+            color=COLORS_RGBA['text_secondary'],
+            halign='left',
+            valign='middle',
+            size_hint=(None, None)
+        )
+        self.stats_label.bind(size=self.stats_label.setter('text_size'))
+        self.add_widget(self.stats_label)
+
+        # Buttons row - larger touch targets; the one nested layout, since
+        # it flows a variable number of buttons
+        self.buttons_row = BoxLayout(size_hint=(None, None))
+
+        self.active_btn = Button(background_color=COLORS_RGBA['primary'])
+        self.active_btn.deck_action = 'set_active'
+        self.active_btn.bind(on_release=self._on_action)
+
+        self.compare_btn = Button(background_color=COLORS_RGBA['secondary'])
+        self.compare_btn.deck_action = 'compare'
+        self.compare_btn.bind(on_release=self._on_action)
+
+        self.edit_btn = Button(background_color=COLORS_RGBA['accent'])
+        self.edit_btn.deck_action = 'edit'
+        self.edit_btn.bind(on_release=self._on_action)
+
+        self.delete_btn = Button(background_color=COLORS_RGBA['danger'])
+        self.delete_btn.deck_action = 'delete'
+        self.delete_btn.bind(on_release=self._on_action)
+
+        self.add_widget(self.buttons_row)
+        self._apply_metrics(_get_card_metrics(get_responsive_manager()))
+        self.bind(size=self._layout_rows)
+
+    def _apply_metrics(self, m):
+        """Resize the card's children for a screen mode's metrics table."""
+        self._metrics = m
+        self._bg.display_border = [m['radius']] * 4
+        self.name_label.font_size = m['name_fs']
+        self.name_label.height = m['top_row_height']
+        self.stats_label.font_size = m['stats_fs']
+        self.stats_label.height = m['stats_row_height']
+        self.buttons_row.height = m['btn_height']
+        self.buttons_row.spacing = m['spacing']
+        for btn in (self.active_btn, self.compare_btn, self.edit_btn, self.delete_btn):
+            btn.font_size = m['btn_fs']
+
+    def _layout_rows(self, *args):
+        """Position the card's children from the top, inside the padding."""
+        m = self._metrics
+        pad = m['padding']
+        width, height = self.size
+        inner_width = max(0, width - 2 * pad)
+        self._bg.size = self.size
+
+        row_height = m['top_row_height']
+        top = height - pad - row_height
+        badges_width = self._active_badge_width + self._incomplete_badge_width
+        self.name_label.width = max(0, inner_width - badges_width)
+        self.name_label.pos = (pad, top)
+        slot_x = pad + self.name_label.width
+        self._place_badge(self._active_badge, slot_x, top, self._active_badge_width, row_height)
+        slot_x += self._active_badge_width
+        self._place_badge(self._incomplete_badge, slot_x, top, self._incomplete_badge_width, row_height)
+
+        top -= m['spacing'] + m['stats_row_height']
+        self.stats_label.width = inner_width
+        self.stats_label.pos = (pad, top)
+
+        top -= m['spacing'] + m['btn_height']
+        self.buttons_row.width = inner_width
+        self.buttons_row.pos = (pad, top)
+
+    @staticmethod
+    def _place_badge(rect, x, y, slot_width, slot_height):
+        """Center a badge rectangle inside its slot."""
+        width, height = rect.size
+        rect.pos = (x + (slot_width - width) / 2, y + (slot_height - height) / 2)
+
+    @staticmethod
+    def _set_badge(rect, text, font_size, bold=False):
+        """Show text on a badge rectangle, or hide it when text is empty."""
+        if text:
+            texture = _get_badge_texture(text, font_size, bold)
+            rect.texture = texture
+            rect.size = texture.size
+        else:
+            rect.texture = None
+            rect.size = (0, 0)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self._rv = rv
+        # Views created before a fold/unfold pick up the new metrics here
+        if rv.owner._card_metrics is not self._metrics:
+            self._apply_metrics(rv.owner._card_metrics)
+        self.deck_id = data['deck_id']
+        is_active = data['is_active']
+        is_complete = data['is_complete']
+        T = rv.owner.T
+
+        self.name_label.text = data['name']
+        self.stats_label.text = data['stats']
+
+        m = self._metrics
+        self._set_badge(
+            self._active_badge,
+            T('badge_active') if is_active else '',
+            m['active_badge_fs'],
+            bold=True
+        )
+        self._active_badge_width = m['active_badge_width'] if is_active else 0
+        self._set_badge(
+            self._incomplete_badge,
+            '' if is_complete else T('badge_incomplete'),
+            m['incomplete_badge_fs']
+        )
+        self._incomplete_badge_width = 0 if is_complete else m['incomplete_badge_width']
+
+        self.active_btn.text = T('set_active')
+        self.compare_btn.text = T('compare')
+        self.edit_btn.text = T('edit')
+        self.delete_btn.text = T('delete')
+
+        # Set Active only for inactive decks, Compare only for complete ones
+        self.buttons_row.clear_widgets()
+        if not is_active:
+            self.buttons_row.add_widget(self.active_btn)
+        if is_complete:
+            self.buttons_row.add_widget(self.compare_btn)
+        self.buttons_row.add_widget(self.edit_btn)
+        self.buttons_row.add_widget(self.delete_btn)
+
+        self._layout_rows()
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_action(self, button):
+        if self._rv is not None:
+            self._rv.owner._on_deck_action(button.deck_action, self.deck_id)
+
 
 class MyDecksScreen(Screen):
     """Screen displaying user's saved decks - responsive for Samsung Fold 6."""
 
     lang = StringProperty("en")
 
+    # Localized UI strings, looked up through T()
+    STRINGS = {
+        'en': {
+            'title': 'My Decks',
+            'import': '+ Import',
+            'new_deck': '+ New Deck',
+            'no_active': 'No active deck',
+            'active_deck': 'Active: {name}',
+            'empty': 'No decks saved yet.\nImport your first deck!',
+            'loading': 'Loading decks...',
+            'load_error': 'Could not load your decks.',
+            'badge_active': '★ ACTIVE',
+            'badge_incomplete': 'INCOMPLETE',
+            'set_active': 'Set Active',
+            'compare': 'Compare',
+            'edit': 'Edit',
+            'delete': 'Delete',
+            'cancel': 'Cancel',
+            'confirm_delete': 'Confirm Delete',
+            'delete_prompt': 'Delete "{name}"?',
+            'cannot_undo': 'This action cannot be undone.',
+        },
+        'pt': {
+            'title': 'Meus Decks',
+            'import': '+ Importar',
+            'new_deck': '+ Novo Deck',
+            'no_active': 'Nenhum deck ativo',
+            'active_deck': 'Active: {name}',
+            'empty': 'Nenhum deck salvo ainda.\nImporte seu primeiro deck!',
+            'loading': 'Carregando decks...',
+            'load_error': 'Não foi possível carregar seus decks.',
+            'badge_active': '★ ATIVO',
+            'badge_incomplete': 'INCOMPLETO',
+            'set_active': 'Ativar',
+            'compare': 'Comparar',
+            'edit': 'Editar',
+            'delete': 'Excluir',
+            'cancel': 'Cancelar',
+            'confirm_delete': 'Confirmar Exclusão',
+            'delete_prompt': 'Excluir "{name}"?',
+            'cannot_undo': 'Esta ação não pode ser desfeita.',
+        },
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = UserDatabase()
+        self.db = get_user_database()
         self.responsive = get_responsive_manager()
+        self._decks_cache = None
+        self._load_generation = 0
+        self._refresh_scheduled = None
+        # Popups are built on first use and reused afterwards
+        self._delete_popup = None
+        self._pending_delete_id = None
+        self._message_popup = None
+        self._decks_by_id = {}
+        # deck id -> (updated_at, stats text)
+        self._stats_cache = {}
+        # Card buttons name their action; the handlers look decks up by id
+        self._deck_actions = {
+            'set_active': self._set_active,
+            'compare': self._go_to_compare,
+            'edit': self._go_to_edit,
+            'delete': self._confirm_delete,
+        }
         self._build_ui()
         # Bind to screen mode changes
         self.responsive.bind(screen_mode=self._on_mode_change)
 
     def _on_mode_change(self, instance, mode):
-        """Rebuild UI when screen mode changes."""
-        self.clear_widgets()
-        self._build_ui()
-        if hasattr(self, '_entered') and self._entered:
-            self._refresh_decks()
+        """Resize the existing widgets when the screen mode changes."""
+        # Cached popups were sized for the previous mode; close any open one
+        # before dropping it so its handlers never see a missing reference
+        for popup in (self._delete_popup, self._message_popup):
+            if popup is not None:
+                popup.dismiss()
+        self._delete_popup = None
+        self._message_popup = None
+        self._apply_mode()
+
+    def T(self, key: str) -> str:
+        """Get the UI string for key in the current language."""
+        return self.STRINGS[self.lang][key]
 
     def _get_font_scale(self):
         """Get current font scale factor."""
         return self.responsive.font_scale
 
     def _build_ui(self):
-        """Build the screen UI with responsive sizing."""
-        font_scale = self._get_font_scale()
-        is_cover = self.responsive.is_cover_mode
-        is_main = self.responsive.is_main_mode
+        """Build the screen UI; mode-dependent sizes are set by _apply_mode."""
+        self.main_layout = BoxLayout(orientation='vertical', spacing=dp(16))
 
-        # Responsive padding
-        padding = dp(20) if is_main else (dp(14) if is_cover else dp(16))
-        main_layout = BoxLayout(orientation='vertical', padding=padding, spacing=dp(16))
-
-        with main_layout.canvas.before:
-            Color(*get_color_from_hex(COLORS['background']))
-            self._bg_rect = Rectangle(pos=main_layout.pos, size=main_layout.size)
-        main_layout.bind(pos=self._update_bg, size=self._update_bg)
+        with self.main_layout.canvas.before:
+            Color(*COLORS_RGBA['background'])
+            self.main_layout._bg = Rectangle(pos=self.main_layout.pos, size=self.main_layout.size)
+        self.main_layout.bind(pos=_sync_bg, size=_sync_bg)
 
         # Header
-        header = self._create_header()
-        main_layout.add_widget(header)
+        self.main_layout.add_widget(self._create_header())
 
         # Active deck indicator
         self.active_deck_widget = self._create_active_deck_indicator()
-        main_layout.add_widget(self.active_deck_widget)
+        self.main_layout.add_widget(self.active_deck_widget)
 
-        # Decks list (scrollable)
-        self.scroll = ScrollView()
-        self.decks_grid = GridLayout(
-            cols=1,
+        # Decks list - recycled cards, only the visible ones are realized
+        self.rv = RecycleView(viewclass=DeckCard)
+        self.rv.owner = self
+        self.decks_layout = RecycleBoxLayout(
+            orientation='vertical',
             spacing=dp(14),
-            size_hint_y=None,
-            padding=[0, dp(10)]
+            padding=[0, dp(10)],
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        self.decks_layout.bind(minimum_height=self.decks_layout.setter('height'))
+        self.rv.add_widget(self.decks_layout)
+
+        # Shows the loading and empty states in place of the list
+        self.status_label = Label(
+            color=COLORS_RGBA['text_secondary'],
+            halign='center'
         )
-        self.decks_grid.bind(minimum_height=self.decks_grid.setter('height'))
-        self.scroll.add_widget(self.decks_grid)
-        main_layout.add_widget(self.scroll)
+
+        # Holds either the deck list or the status label
+        self.list_container = BoxLayout()
+        self.list_container.add_widget(self.rv)
+        self.main_layout.add_widget(self.list_container)
 
         # Bottom buttons - larger touch targets
-        btn_height = self.responsive.button_height
-        bottom_btns = BoxLayout(size_hint_y=None, height=btn_height, spacing=dp(12))
+        self.bottom_btns = BoxLayout(size_hint_y=None, spacing=dp(12))
 
         # Import deck button
-        import_btn = Button(
-            text='+ Import' if self.lang == 'en' else '+ Importar',
-            background_color=get_color_from_hex(COLORS['secondary']),
-            font_size=sp(16 * font_scale),
+        self.import_btn = Button(
+            text=self.T('import'),
+            background_color=COLORS_RGBA['secondary'],
             bold=True
         )
-        import_btn.bind(on_release=self._go_to_import)
-        bottom_btns.add_widget(import_btn)
+        self.import_btn.bind(on_release=self._go_to_import)
+        self.bottom_btns.add_widget(self.import_btn)
 
         # Create new deck button
-        new_btn = Button(
-            text='+ New Deck' if self.lang == 'en' else '+ Novo Deck',
-            background_color=get_color_from_hex(COLORS['primary']),
-            font_size=sp(16 * font_scale),
+        self.new_btn = Button(
+            text=self.T('new_deck'),
+            background_color=COLORS_RGBA['primary'],
             bold=True
         )
-        new_btn.bind(on_release=self._go_to_new_deck)
-        bottom_btns.add_widget(new_btn)
+        self.new_btn.bind(on_release=self._go_to_new_deck)
+        self.bottom_btns.add_widget(self.new_btn)
 
-        main_layout.add_widget(bottom_btns)
+        self.main_layout.add_widget(self.bottom_btns)
 
-        self.add_widget(main_layout)
+        self._apply_mode()
+        self.add_widget(self.main_layout)
 
-    def _update_bg(self, *args):
-        self._bg_rect.pos = args[0].pos
-        self._bg_rect.size = args[0].size
-
-    def _create_header(self):
-        """Create header with title and back button - responsive sizing."""
+    def _apply_mode(self):
+        """Apply the current screen mode's sizes and fonts to existing widgets."""
         font_scale = self._get_font_scale()
         is_cover = self.responsive.is_cover_mode
+        is_main = self.responsive.is_main_mode
+
+        # Responsive padding
+        self.main_layout.padding = dp(20) if is_main else (dp(14) if is_cover else dp(16))
+
+        # Header - minimum 56dp height and 48dp back button for touch
+        self.header.height = self.responsive.nav_height
+        self.back_btn.width = self.responsive.touch_target
+        self.back_btn.font_size = sp(22 * font_scale)
+        self.title_label.font_size = sp(22 * font_scale)
+
+        # Active deck indicator
+        self.active_deck_widget.height = dp(56) if is_main else dp(48)
+        self.active_icon.font_size = sp(20 * font_scale)
+        self.active_deck_label.font_size = sp(16 * font_scale)
+
+        # Deck cards re-read the metrics table when they are next bound
+        self._card_metrics = _get_card_metrics(self.responsive)
+        self.decks_layout.default_size = (None, self._card_metrics['card_height'])
+        self.rv.refresh_from_data()
+        self.status_label.font_size = sp(18 * font_scale)
+
+        # Bottom buttons - larger touch targets
+        btn_font_size = sp(16 * font_scale)
+        self.bottom_btns.height = self.responsive.button_height
+        self.import_btn.font_size = btn_font_size
+        self.new_btn.font_size = btn_font_size
 
-        # Responsive header height - minimum 56dp for touch
-        header_height = self.responsive.nav_height
-        header = BoxLayout(size_hint_y=None, height=header_height, spacing=dp(12))
+    def _create_header(self):
+        """Create header with title and back button."""
+        self.header = BoxLayout(size_hint_y=None, spacing=dp(12))
 
-        # Back button - minimum 48dp touch target
-        btn_size = self.responsive.touch_target
-        back_btn = Button(
+        self.back_btn = Button(
             text='<',
             size_hint_x=None,
-            width=btn_size,
-            background_color=get_color_from_hex(COLORS['text_muted']),
-            font_size=sp(22 * font_scale)
+            background_color=COLORS_RGBA['text_muted']
         )
-        back_btn.bind(on_release=self._go_back)
-        header.add_widget(back_btn)
+        self.back_btn.bind(on_release=self._go_back)
+        self.header.add_widget(self.back_btn)
 
-        # Title - responsive font
-        title = Label(
-            text='My Decks' if self.lang == 'en' else 'Meus Decks',
-            font_size=sp(22 * font_scale),
+        self.title_label = Label(
+            text=self.T('title'),
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=COLORS_RGBA['text'],
             halign='left',
             valign='middle'
         )
-        title.bind(size=title.setter('text_size'))
-        header.add_widget(title)
+        self.title_label.bind(size=self.title_label.setter('text_size'))
+        self.header.add_widget(self.title_label)
 
-        return header
+        return self.header
 
     def _create_active_deck_indicator(self):
-        """Create indicator showing the active deck - responsive sizing."""
-        font_scale = self._get_font_scale()
-
-        # Larger touch target
-        indicator_height = dp(56) if self.responsive.is_main_mode else dp(48)
+        """Create indicator showing the active deck."""
         container = BoxLayout(
             size_hint_y=None,
-            height=indicator_height,
             padding=dp(14),
             spacing=dp(10)
         )
 
         with container.canvas.before:
-            Color(*get_color_from_hex(COLORS['primary']))
-            self._active_bg = RoundedRectangle(
+            Color(*COLORS_RGBA['primary'])
+            container._bg = BorderImage(
+                source=CARD_BG_SOURCE,
+                border=CARD_BG_BORDER,
+                display_border=[dp(10)] * 4,
                 pos=container.pos,
-                size=container.size,
-                radius=[dp(10)]
+                size=container.size
             )
-        container.bind(
-            pos=lambda *a: setattr(self._active_bg, 'pos', container.pos),
-            size=lambda *a: setattr(self._active_bg, 'size', container.size)
-        )
+        container.bind(pos=_sync_bg, size=_sync_bg)
 
-        icon = Label(
+        self.active_icon = Label(
             text='★',
-            font_size=sp(20 * font_scale),
             color=(1, 1, 1, 1),
             size_hint_x=None,
             width=dp(36)
         )
-        container.add_widget(icon)
+        container.add_widget(self.active_icon)
 
         self.active_deck_label = Label(
-            text='No active deck' if self.lang == 'en' else 'Nenhum deck ativo',
-            font_size=sp(16 * font_scale),
+            text=self.T('no_active'),
             color=(1, 1, 1, 1),
             halign='left',
             valign='middle'
@@ -227,169 +569,128 @@ class MyDecksScreen(Screen):
 
     def on_enter(self):
         """Called when screen is displayed."""
-        self._entered = True
+        # Decks are edited and imported from other screens, so re-read them
+        self._invalidate_decks()
+        self._schedule_refresh()
+
+    def _invalidate_decks(self):
+        """Drop the memoized deck list after the decks were modified."""
+        self._decks_cache = None
+        # Results of a load started before the change are now stale
+        self._load_generation += 1
+
+    def _schedule_refresh(self):
+        """
+        Coalesce refresh requests into a single rebind on the next frame.
+
+        Lets on_enter return before the list is populated, and a fold
+        rebuild that coincides with on_enter only refreshes once.
+        """
+        if self._refresh_scheduled is None:
+            self._refresh_scheduled = Clock.schedule_once(self._do_refresh, 0)
+
+    def _do_refresh(self, dt):
+        self._refresh_scheduled = None
         self._refresh_decks()
 
     def _refresh_decks(self):
-        """Refresh the deck list."""
-        self.decks_grid.clear_widgets()
-        font_scale = self._get_font_scale()
-
-        decks = self.db.get_all_decks()
-        active_deck = self.db.get_active_deck()
-
-        # Update active deck indicator
-        if active_deck:
-            self.active_deck_label.text = f'Active: {active_deck.name}'
-        else:
-            self.active_deck_label.text = 'No active deck' if self.lang == 'en' else 'Nenhum deck ativo'
-
-        if not decks:
-            empty_label = Label(
-                text='No decks saved yet.\nImport your first deck!' if self.lang == 'en' else
-                     'Nenhum deck salvo ainda.\nImporte seu primeiro deck!',
-                font_size=sp(18 * font_scale),
-                color=get_color_from_hex(COLORS['text_secondary']),
-                halign='center',
-                size_hint_y=None,
-                height=dp(120)
-            )
-            self.decks_grid.add_widget(empty_label)
+        """
+        Refresh the deck list.
+
+        The memoized decks are shown straight away; otherwise they are read
+        on a worker thread while a loading message is displayed.
+        """
+        if self._decks_cache is not None:
+            self._populate_decks(self._decks_cache)
             return
 
-        for deck in decks:
-            card = self._create_deck_card(deck)
-            self.decks_grid.add_widget(card)
-
-    def _create_deck_card(self, deck: UserDeck):
-        """Create a card widget for a deck - responsive sizing."""
-        font_scale = self._get_font_scale()
-        is_cover = self.responsive.is_cover_mode
-        is_main = self.responsive.is_main_mode
-
-        # Larger card for better touch targets
-        card_height = dp(140) if is_main else (dp(120) if is_cover else dp(130))
-        card_padding = dp(16) if is_main else dp(12)
-
-        card = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=card_height,
-            padding=card_padding,
-            spacing=dp(10)
-        )
-
-        with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            card._bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(10)])
-        card.bind(
-            pos=lambda *a, c=card: setattr(c._bg, 'pos', c.pos),
-            size=lambda *a, c=card: setattr(c._bg, 'size', c.size)
-        )
-
-        # Top row: Name + Active indicator
-        top_row = BoxLayout(size_hint_y=None, height=dp(30))
+        generation = self._load_generation
+        self._show_status(self.T('loading'))
 
-        name_label = Label(
-            text=deck.name,
-            font_size=sp(18 * font_scale),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            halign='left',
-            valign='middle'
-        )
-        name_label.bind(size=name_label.setter('text_size'))
-        top_row.add_widget(name_label)
-
-        if deck.is_active:
-            active_badge = Label(
-                text='★ ACTIVE' if self.lang == 'en' else '★ ATIVO',
-                font_size=sp(12 * font_scale),
-                color=get_color_from_hex(COLORS['primary']),
-                bold=True,
-                size_hint_x=None,
-                width=dp(80)
-            )
-            top_row.add_widget(active_badge)
-
-        if not deck.is_complete:
-            incomplete_badge = Label(
-                text='INCOMPLETE' if self.lang == 'en' else 'INCOMPLETO',
-                font_size=sp(11 * font_scale),
-                color=get_color_from_hex(COLORS['warning']),
-                size_hint_x=None,
-                width=dp(90)
-            )
-            top_row.add_widget(incomplete_badge)
-
-        card.add_widget(top_row)
-
-        # Stats row
-        stats_row = BoxLayout(size_hint_y=None, height=dp(24))
-
-        stats_text = f'{deck.total_cards}/60 cards • {deck.pokemon_count} Pokemon • {deck.trainer_count} Trainers • {deck.energy_count} Energy'
-        stats_label = Label(
-            text=stats_text,
-            font_size=sp(13 * font_scale),
-            color=get_color_from_hex(COLORS['text_secondary']),
-            halign='left',
-            valign='middle'
-        )
-        stats_label.bind(size=stats_label.setter('text_size'))
-        stats_row.add_widget(stats_label)
+        def worker():
+            try:
+                decks = self.db.get_all_decks()
+            except Exception:
+                decks = None
+            Clock.schedule_once(lambda dt: self._on_decks_loaded(generation, decks), 0)
 
-        card.add_widget(stats_row)
+        threading.Thread(target=worker, daemon=True).start()
 
-        # Buttons row - larger touch targets
-        btn_height = dp(44) if is_main else dp(40)
-        buttons_row = BoxLayout(size_hint_y=None, height=btn_height, spacing=dp(10))
+    def _on_decks_loaded(self, generation, decks):
+        """Memoize and show decks read by the worker, unless they went stale."""
+        if generation != self._load_generation:
+            return
+        if decks is None:
+            # Leave the memo empty so the next refresh retries the read
+            self._show_status(self.T('load_error'))
+            return
+        self._decks_cache = decks
+        self._populate_decks(decks)
+
+    def _show_status(self, text):
+        """Replace the deck list with a status message."""
+        self.rv.data = []
+        self.status_label.text = text
+        self._show_in_list(self.status_label)
+
+    def _show_in_list(self, widget):
+        """Make widget the list container's only child, skipping no-op swaps."""
+        if widget.parent is self.list_container:
+            return
+        self.list_container.clear_widgets()
+        self.list_container.add_widget(widget)
 
-        # Set Active button
-        if not deck.is_active:
-            active_btn = Button(
-                text='Set Active' if self.lang == 'en' else 'Ativar',
-                background_color=get_color_from_hex(COLORS['primary']),
-                font_size=sp(14 * font_scale)
-            )
-            active_btn.bind(on_release=lambda x, d=deck: self._set_active(d))
-            buttons_row.add_widget(active_btn)
-
-        # Compare button (only if complete)
-        if deck.is_complete:
-            compare_btn = Button(
-                text='Compare' if self.lang == 'en' else 'Comparar',
-                background_color=get_color_from_hex(COLORS['secondary']),
-                font_size=sp(14 * font_scale)
-            )
-            compare_btn.bind(on_release=lambda x, d=deck: self._go_to_compare(d))
-            buttons_row.add_widget(compare_btn)
-
-        # Edit button
-        edit_btn = Button(
-            text='Edit' if self.lang == 'en' else 'Editar',
-            background_color=get_color_from_hex(COLORS['accent']),
-            font_size=sp(14 * font_scale)
-        )
-        edit_btn.bind(on_release=lambda x, d=deck: self._go_to_edit(d))
-        buttons_row.add_widget(edit_btn)
-
-        # Delete button
-        delete_btn = Button(
-            text='Delete' if self.lang == 'en' else 'Excluir',
-            background_color=get_color_from_hex(COLORS['danger']),
-            font_size=sp(14 * font_scale)
-        )
-        delete_btn.bind(on_release=lambda x, d=deck: self._confirm_delete(d))
-        buttons_row.add_widget(delete_btn)
+    def _populate_decks(self, decks):
+        """Bind decks to the deck list and the active deck indicator."""
+        active_deck = next((deck for deck in decks if deck.is_active), None)
+        self._decks_by_id = {deck.id: deck for deck in decks}
 
-        card.add_widget(buttons_row)
+        # Update active deck indicator
+        if active_deck:
+            self.active_deck_label.text = self.T('active_deck').format(name=active_deck.name)
+        else:
+            self.active_deck_label.text = self.T('no_active')
 
-        return card
+        if not decks:
+            self._show_status(self.T('empty'))
+            return
+        self._show_in_list(self.rv)
+
+        self.rv.data = [
+            {
+                'deck_id': deck.id,
+                'name': deck.name,
+                'stats': self._deck_stats_text(deck),
+                'is_active': deck.is_active,
+                'is_complete': deck.is_complete,
+            }
+            for deck in decks
+        ]
+
+    def _deck_stats_text(self, deck: UserDeck) -> str:
+        """
+        Get the card count summary for deck, reusing it while the deck is unchanged.
+
+        Every save stamps updated_at, so it versions the card list without
+        re-summing the four counts.
+        """
+        cached = self._stats_cache.get(deck.id)
+        if cached is not None and cached[0] == deck.updated_at:
+            return cached[1]
+        text = f'{deck.total_cards}/60 cards • {deck.pokemon_count} Pokemon • {deck.trainer_count} Trainers • {deck.energy_count} Energy'
+        self._stats_cache[deck.id] = (deck.updated_at, text)
+        return text
 
     # =========================================================================
     # EVENT HANDLERS
     # =========================================================================
 
+    def _on_deck_action(self, action, deck_id):
+        """Run a deck card button action for the deck with deck_id."""
+        deck = self._decks_by_id.get(deck_id)
+        if deck is not None:
+            self._deck_actions[action](deck)
+
     def _go_back(self, *args):
         """Navigate back to home."""
         if self.manager:
@@ -413,7 +714,8 @@ class MyDecksScreen(Screen):
     def _set_active(self, deck: UserDeck):
         """Set a deck as active."""
         self.db.set_active_deck(deck.id)
-        self._refresh_decks()
+        self._invalidate_decks()
+        self._schedule_refresh()
 
     def _go_to_compare(self, deck: UserDeck):
         """Navigate to comparison screen."""
@@ -431,87 +733,113 @@ class MyDecksScreen(Screen):
             self.manager.transition.direction = 'left'
             self.manager.current = 'deck_editor'
 
-    def _confirm_delete(self, deck: UserDeck):
-        """Show delete confirmation dialog - responsive sizing."""
+    def _ensure_delete_popup(self):
+        """Build the delete confirmation popup on first use - responsive sizing."""
+        if self._delete_popup is not None:
+            return self._delete_popup
+
         font_scale = self._get_font_scale()
         btn_height = self.responsive.button_height
 
         content = BoxLayout(orientation='vertical', padding=dp(24), spacing=dp(18))
 
-        content.add_widget(Label(
-            text=f'Delete "{deck.name}"?' if self.lang == 'en' else f'Excluir "{deck.name}"?',
+        self._delete_title_label = Label(
             font_size=sp(18 * font_scale),
             halign='center'
-        ))
+        )
+        content.add_widget(self._delete_title_label)
 
-        content.add_widget(Label(
-            text='This action cannot be undone.' if self.lang == 'en' else
-                 'Esta ação não pode ser desfeita.',
+        self._delete_warning_label = Label(
             font_size=sp(15 * font_scale),
-            color=get_color_from_hex(COLORS['text_secondary']),
+            color=COLORS_RGBA['text_secondary'],
             halign='center'
-        ))
+        )
+        content.add_widget(self._delete_warning_label)
 
         buttons = BoxLayout(size_hint_y=None, height=btn_height, spacing=dp(12))
 
-        delete_btn = Button(
-            text='Delete' if self.lang == 'en' else 'Excluir',
-            background_color=get_color_from_hex(COLORS['danger']),
+        self._delete_btn = Button(
+            background_color=COLORS_RGBA['danger'],
             font_size=sp(16 * font_scale)
         )
-        cancel_btn = Button(
-            text='Cancel' if self.lang == 'en' else 'Cancelar',
-            background_color=get_color_from_hex(COLORS['text_muted']),
+        self._cancel_btn = Button(
+            background_color=COLORS_RGBA['text_muted'],
             font_size=sp(16 * font_scale)
         )
 
-        buttons.add_widget(delete_btn)
-        buttons.add_widget(cancel_btn)
+        buttons.add_widget(self._delete_btn)
+        buttons.add_widget(self._cancel_btn)
         content.add_widget(buttons)
 
-        popup = Popup(
-            title='Confirm Delete' if self.lang == 'en' else 'Confirmar Exclusão',
+        self._delete_popup = Popup(
             content=content,
             size_hint=(0.85, 0.45),
             auto_dismiss=True
         )
+        self._delete_btn.bind(on_release=self._do_delete)
+        self._cancel_btn.bind(on_release=self._delete_popup.dismiss)
+        return self._delete_popup
 
-        def do_delete(*a):
-            self.db.delete_deck(deck.id)
-            popup.dismiss()
-            self._refresh_decks()
-
-        delete_btn.bind(on_release=do_delete)
-        cancel_btn.bind(on_release=popup.dismiss)
+    def _confirm_delete(self, deck: UserDeck):
+        """Show delete confirmation dialog for deck."""
+        popup = self._ensure_delete_popup()
+        self._pending_delete_id = deck.id
+
+        popup.title = self.T('confirm_delete')
+        self._delete_title_label.text = self.T('delete_prompt').format(name=deck.name)
+        self._delete_warning_label.text = self.T('cannot_undo')
+        self._delete_btn.text = self.T('delete')
+        self._cancel_btn.text = self.T('cancel')
         popup.open()
 
-    def _show_message(self, title, message):
-        """Show a simple message popup - responsive sizing."""
+    def _do_delete(self, *args):
+        """Delete the deck the confirmation popup was opened for."""
+        if self._delete_popup is not None:
+            self._delete_popup.dismiss()
+        if self._pending_delete_id is None:
+            return
+        self.db.delete_deck(self._pending_delete_id)
+        self._stats_cache.pop(self._pending_delete_id, None)
+        self._pending_delete_id = None
+        self._invalidate_decks()
+        self._schedule_refresh()
+
+    def _ensure_message_popup(self):
+        """Build the message popup on first use - responsive sizing."""
+        if self._message_popup is not None:
+            return self._message_popup
+
         font_scale = self._get_font_scale()
         btn_height = self.responsive.button_height
 
         content = BoxLayout(orientation='vertical', padding=dp(24), spacing=dp(18))
 
-        content.add_widget(Label(
-            text=message,
+        self._message_label = Label(
             font_size=sp(16 * font_scale),
             halign='center'
-        ))
+        )
+        content.add_widget(self._message_label)
 
         close_btn = Button(
             text='OK',
             size_hint_y=None,
             height=btn_height,
-            background_color=get_color_from_hex(COLORS['primary']),
+            background_color=COLORS_RGBA['primary'],
             font_size=sp(16 * font_scale)
         )
+        content.add_widget(close_btn)
 
-        popup = Popup(
-            title=title,
+        self._message_popup = Popup(
             content=content,
             size_hint=(0.85, 0.4),
             auto_dismiss=True
         )
-        close_btn.bind(on_release=popup.dismiss)
-        content.add_widget(close_btn)
+        close_btn.bind(on_release=self._message_popup.dismiss)
+        return self._message_popup
+
+    def _show_message(self, title, message):
+        """Show a simple message popup."""
+        popup = self._ensure_message_popup()
+        popup.title = title
+        self._message_label.text = message
         popup.open()
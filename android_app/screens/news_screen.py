@@ -8,26 +8,28 @@ Features:
 - Open articles in browser
 """
 
-import os
-import sys
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.image import AsyncImage
 from kivy.uix.screenmanager import Screen
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.metrics import dp, sp
 from kivy.utils import get_color_from_hex
-from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics import Color, Rectangle
 from kivy.clock import Clock
 from kivy.properties import StringProperty, BooleanProperty
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from services.news_service import NewsService, NewsArticle, Tournament
+if TYPE_CHECKING:
+    from services.news_service import NewsArticle, Tournament
+from services.thumbnail_cache import ThumbnailCache
+from components import CardBox
 
 
 # Color scheme
@@ -47,6 +49,264 @@ COLORS = {
     'border': '#e0e0e0',
 }
 
+# Parsed once at import - widgets share these tuples instead of re-parsing hex
+COLORS_RGBA = {name: tuple(get_color_from_hex(value)) for name, value in COLORS.items()}
+
+# Event type badge colors; None is the fallback for other event types
+_EVENT_TYPE_RGBA = {
+    'Worlds': COLORS_RGBA['accent'],
+    'International': COLORS_RGBA['secondary'],
+    'Regional': COLORS_RGBA['primary'],
+    None: COLORS_RGBA['surface'],
+}
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, ending with '...' when shortened."""
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+@lru_cache(maxsize=512)
+def _format_date(date_str: str) -> str:
+    """Format date string for display."""
+    if not date_str:
+        return ""
+    # Simple formatting - just return first part
+    return date_str.partition(',')[0] if ',' in date_str else date_str[:20]
+
+
+class NewsCardItem(RecycleDataViewBehavior, CardBox):
+    """Recyclable news article card - child widgets are created once and re-bound to data."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            orientation='vertical',
+            padding=dp(12),
+            spacing=dp(8),
+            bg_color=COLORS_RGBA['surface'],
+            **kwargs
+        )
+        self.url = ''
+        self._rv = None
+
+        # Content row
+        content = BoxLayout(spacing=dp(10))
+
+        # Image - collapsed when the article has none
+        self.image = AsyncImage(
+            size_hint_x=None,
+            width=0,
+            allow_stretch=True,
+            keep_ratio=True
+        )
+        content.add_widget(self.image)
+
+        # Text content
+        text_box = BoxLayout(orientation='vertical', spacing=dp(4))
+
+        self.title_label = Label(
+            font_size=sp(14),
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left',
+            valign='top',
+            text_size=(dp(200), None)
+        )
+        text_box.add_widget(self.title_label)
+
+        self.summary_label = Label(
+            font_size=sp(11),
+            color=COLORS_RGBA['text_secondary'],
+            halign='left',
+            valign='top',
+            text_size=(dp(200), None)
+        )
+        text_box.add_widget(self.summary_label)
+
+        # Source and date
+        self.meta_label = Label(
+            font_size=sp(10),
+            color=COLORS_RGBA['text_muted'],
+            halign='left',
+            valign='bottom'
+        )
+        self.meta_label.bind(size=self.meta_label.setter('text_size'))
+        text_box.add_widget(self.meta_label)
+
+        content.add_widget(text_box)
+        self.add_widget(content)
+
+        # Make card clickable
+        self.read_more_btn = Button(
+            size_hint_y=None,
+            height=dp(30),
+            background_color=COLORS_RGBA['secondary'],
+            font_size=sp(12)
+        )
+        self.read_more_btn.bind(on_release=self._on_open)
+        self.add_widget(self.read_more_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self._rv = rv
+        self.url = data['url']
+        self.title_label.text = data['title']
+        self.summary_label.text = data['summary']
+        self.meta_label.text = data['meta']
+        self.read_more_btn.text = data['button_text']
+
+        image_url = data['image_url']
+        self.image.width = dp(80) if image_url else 0
+        if image_url:
+            rv.owner._set_thumbnail(self.image, image_url)
+        else:
+            self.image._thumb_url = None
+            self.image.source = ''
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_open(self, *args):
+        if self._rv is not None:
+            self._rv.owner._open_url(self.url)
+
+
+class EventCardItem(RecycleDataViewBehavior, CardBox):
+    """Recyclable event card - child widgets are created once and re-bound to data."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            orientation='vertical',
+            padding=dp(12),
+            spacing=dp(6),
+            bg_color=COLORS_RGBA['surface'],
+            **kwargs
+        )
+        self.url = ''
+        self._rv = None
+
+        # Header row
+        header = BoxLayout(size_hint_y=None, height=dp(25))
+
+        # Event type badge - its color follows the event type
+        self.type_badge = CardBox(
+            size_hint_x=None,
+            width=dp(80),
+            padding=dp(2),
+            radius=dp(4)
+        )
+
+        self.type_label = Label(
+            font_size=sp(10),
+            bold=True,
+            color=(1, 1, 1, 1)
+        )
+        self.type_badge.add_widget(self.type_label)
+        header.add_widget(self.type_badge)
+
+        # Registered indicator - empty text doubles as the spacer
+        self.reg_label = Label(
+            font_size=sp(10),
+            color=COLORS_RGBA['success'],
+            halign='right'
+        )
+        self.reg_label.bind(size=self.reg_label.setter('text_size'))
+        header.add_widget(self.reg_label)
+
+        self.add_widget(header)
+
+        # Event name
+        self.name_label = Label(
+            font_size=sp(14),
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left',
+            valign='middle',
+            size_hint_y=None,
+            height=dp(20)
+        )
+        self.name_label.bind(size=self.name_label.setter('text_size'))
+        self.add_widget(self.name_label)
+
+        # Date and location
+        self.info_label = Label(
+            font_size=sp(12),
+            color=COLORS_RGBA['text_secondary'],
+            halign='left',
+            valign='middle',
+            size_hint_y=None,
+            height=dp(20)
+        )
+        self.info_label.bind(size=self.info_label.setter('text_size'))
+        self.add_widget(self.info_label)
+
+        # Action button
+        self.details_btn = Button(
+            size_hint_y=None,
+            height=dp(30),
+            background_color=COLORS_RGBA['secondary'],
+            font_size=sp(12)
+        )
+        self.details_btn.bind(on_release=self._on_open)
+        self.add_widget(self.details_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self._rv = rv
+        self.url = data['url']
+        self.type_badge.bg_color = data['type_color']
+        self.type_label.text = data['event_type']
+        self.reg_label.text = data['registered_text']
+        self.name_label.text = data['name']
+        self.info_label.text = data['info']
+        self.details_btn.text = data['button_text']
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_open(self, *args):
+        if self._rv is not None:
+            self._rv.owner._open_url(self.url)
+
+
+class SectionHeaderItem(RecycleDataViewBehavior, Label):
+    """Recyclable section header."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            font_size=sp(14),
+            bold=True,
+            color=COLORS_RGBA['text'],
+            halign='left',
+            valign='bottom',
+            **kwargs
+        )
+        self.bind(size=self.setter('text_size'))
+
+
+class EmptyStateItem(RecycleDataViewBehavior, BoxLayout):
+    """Recyclable empty state message."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', padding=dp(30), **kwargs)
+
+        self.title_label = Label(
+            font_size=sp(16),
+            bold=True,
+            color=COLORS_RGBA['text_secondary'],
+            halign='center'
+        )
+        self.add_widget(self.title_label)
+
+        self.subtitle_label = Label(
+            font_size=sp(13),
+            color=COLORS_RGBA['text_muted'],
+            halign='center'
+        )
+        self.add_widget(self.subtitle_label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Update the existing child widgets from the data entry."""
+        self.title_label.text = data['title']
+        self.subtitle_label.text = data['subtitle']
+        return super().refresh_view_attrs(rv, index, data)
+
 
 class NewsScreen(Screen):
     """Screen for displaying news and events."""
@@ -54,17 +314,61 @@ class NewsScreen(Screen):
     lang = StringProperty("en")
     is_loading = BooleanProperty(False)
 
+    STRINGS = {
+        'en': {
+            'title': 'News & Events',
+            'news': 'News',
+            'events': 'Events',
+            'refresh': 'Refresh',
+            'read_more': 'Read More',
+            'view_details': 'View Details',
+            'registered': '✓ Registered',
+            'my_events': 'My Events',
+            'upcoming_events': 'Upcoming Events',
+            'no_news': 'No news available',
+            'no_news_hint': 'Pull to refresh',
+            'no_events': 'No events available',
+            'no_events_hint': 'Check back later',
+        },
+        'pt': {
+            'title': 'Notícias & Eventos',
+            'news': 'Notícias',
+            'events': 'Eventos',
+            'refresh': 'Atualizar',
+            'read_more': 'Ler Mais',
+            'view_details': 'Ver Detalhes',
+            'registered': '✓ Inscrito',
+            'my_events': 'Meus Eventos',
+            'upcoming_events': 'Próximos Eventos',
+            'no_news': 'Nenhuma notícia disponível',
+            'no_news_hint': 'Deslize para atualizar',
+            'no_events': 'Nenhum evento disponível',
+            'no_events_hint': 'Volte mais tarde',
+        },
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.news_service = NewsService()
+        # Created on first display so app start does not read the news cache
+        self.news_service = None
+        self.thumbnails = ThumbnailCache()
+        self._refreshing = False
+        self._load_generation = 0
+        # Loads run one after another on this thread, so tab switches and
+        # refreshes never call into the NewsService at the same time
+        self._content_worker = ThreadPoolExecutor(max_workers=1)
         self._build_ui()
 
+    def T(self, key: str) -> str:
+        """Get the UI string for key in the current language."""
+        return self.STRINGS[self.lang][key]
+
     def _build_ui(self):
         """Build the news screen UI."""
         main_layout = BoxLayout(orientation='vertical', padding=dp(12), spacing=dp(10))
 
         with main_layout.canvas.before:
-            Color(*get_color_from_hex(COLORS['background']))
+            Color(*COLORS_RGBA['background'])
             self._bg_rect = Rectangle(pos=main_layout.pos, size=main_layout.size)
         main_layout.bind(pos=self._update_bg, size=self._update_bg)
 
@@ -76,22 +380,26 @@ class NewsScreen(Screen):
         tabs = self._create_tabs()
         main_layout.add_widget(tabs)
 
-        # Content area (scrollable)
-        self.scroll = ScrollView()
-        self.content_grid = GridLayout(
-            cols=1,
+        # Content area - recycled cards; each data entry names its viewclass
+        # and height
+        self.rv = RecycleView(key_viewclass='viewclass')
+        self.rv.owner = self
+        content_layout = RecycleBoxLayout(
+            orientation='vertical',
             spacing=dp(10),
-            size_hint_y=None,
-            padding=[0, dp(8)]
+            padding=[0, dp(8)],
+            default_size=(None, dp(120)),
+            default_size_hint=(1, None),
+            size_hint_y=None
         )
-        self.content_grid.bind(minimum_height=self.content_grid.setter('height'))
-        self.scroll.add_widget(self.content_grid)
-        main_layout.add_widget(self.scroll)
+        content_layout.bind(minimum_height=content_layout.setter('height'))
+        self.rv.add_widget(content_layout)
+        main_layout.add_widget(self.rv)
 
         # Refresh button
         refresh_btn = Button(
-            text='Refresh' if self.lang == 'en' else 'Atualizar',
-            background_color=get_color_from_hex(COLORS['primary']),
+            text=self.T('refresh'),
+            background_color=COLORS_RGBA['primary'],
             font_size=sp(14),
             size_hint_y=None,
             height=dp(45)
@@ -114,17 +422,17 @@ class NewsScreen(Screen):
             text='<',
             size_hint_x=None,
             width=dp(40),
-            background_color=get_color_from_hex(COLORS['text_muted']),
+            background_color=COLORS_RGBA['text_muted'],
             font_size=sp(20)
         )
         back_btn.bind(on_release=self._go_back)
         header.add_widget(back_btn)
 
         title = Label(
-            text='News & Events' if self.lang == 'en' else 'Notícias & Eventos',
+            text=self.T('title'),
             font_size=sp(18),
             bold=True,
-            color=get_color_from_hex(COLORS['text']),
+            color=COLORS_RGBA['text'],
             halign='left',
             valign='middle'
         )
@@ -138,19 +446,21 @@ class NewsScreen(Screen):
         tabs = BoxLayout(size_hint_y=None, height=dp(40), spacing=dp(8))
 
         self.news_tab = Button(
-            text='News' if self.lang == 'en' else 'Notícias',
-            background_color=get_color_from_hex(COLORS['primary']),
+            text=self.T('news'),
+            background_color=COLORS_RGBA['primary'],
             font_size=sp(14)
         )
-        self.news_tab.bind(on_release=lambda x: self._switch_tab('news'))
+        self.news_tab.tab = 'news'
+        self.news_tab.bind(on_release=self._on_tab_press)
         tabs.add_widget(self.news_tab)
 
         self.events_tab = Button(
-            text='Events' if self.lang == 'en' else 'Eventos',
-            background_color=get_color_from_hex(COLORS['text_muted']),
+            text=self.T('events'),
+            background_color=COLORS_RGBA['text_muted'],
             font_size=sp(14)
         )
-        self.events_tab.bind(on_release=lambda x: self._switch_tab('events'))
+        self.events_tab.tab = 'events'
+        self.events_tab.bind(on_release=self._on_tab_press)
         tabs.add_widget(self.events_tab)
 
         return tabs
@@ -161,352 +471,179 @@ class NewsScreen(Screen):
 
     def on_enter(self):
         """Called when screen is displayed."""
+        if self.news_service is None:
+            from services.news_service import NewsService
+            self.news_service = NewsService()
         self._load_content()
 
+    def on_leave(self):
+        """Called when screen is hidden; stop fetching thumbnails."""
+        self.thumbnails.cancel_pending()
+
+    def _on_tab_press(self, button):
+        """Shared handler of the tab buttons."""
+        self._switch_tab(button.tab)
+
     def _switch_tab(self, tab):
         """Switch between news and events tabs."""
         self.current_tab = tab
 
         if tab == 'news':
-            self.news_tab.background_color = get_color_from_hex(COLORS['primary'])
-            self.events_tab.background_color = get_color_from_hex(COLORS['text_muted'])
+            self.news_tab.background_color = COLORS_RGBA['primary']
+            self.events_tab.background_color = COLORS_RGBA['text_muted']
         else:
-            self.news_tab.background_color = get_color_from_hex(COLORS['text_muted'])
-            self.events_tab.background_color = get_color_from_hex(COLORS['primary'])
+            self.news_tab.background_color = COLORS_RGBA['text_muted']
+            self.events_tab.background_color = COLORS_RGBA['primary']
 
         self._load_content()
 
-    def _load_content(self):
-        """Load content based on current tab."""
-        self.content_grid.clear_widgets()
+    def _load_content(self, force_refresh=False):
+        """Load content for the current tab; the data is prepared on a worker thread."""
+        self._load_generation += 1
+        self._content_worker.submit(
+            self._prepare_content, self._load_generation, self.current_tab, force_refresh
+        )
 
-        if self.current_tab == 'news':
-            self._load_news()
-        else:
-            self._load_events()
+    def _prepare_content(self, generation, tab, force_refresh):
+        """Fetch and format the content of tab, then hand it to the UI thread."""
+        data = None
+        try:
+            if tab == 'news':
+                if force_refresh:
+                    self.news_service.get_news(force_refresh=True)
+                data = self._news_data()
+            else:
+                if force_refresh:
+                    self.news_service.get_events(force_refresh=True)
+                data = self._events_data()
+        finally:
+            Clock.schedule_once(
+                lambda dt: self._on_content_prepared(generation, data, force_refresh), 0
+            )
+
+    def _on_content_prepared(self, generation, data, refreshed):
+        """Show prepared content unless a newer load superseded it."""
+        if refreshed:
+            self._refreshing = False
+            self.is_loading = False
+        if generation == self._load_generation and data is not None:
+            # Thumbnails still queued for the previous cards will not be shown
+            self.thumbnails.cancel_pending()
+            self.rv.data = data
 
     def _on_refresh(self, *args):
-        """Handle refresh button click."""
+        """Handle refresh button click; taps during a refresh are ignored."""
+        if self._refreshing:
+            return
+        self._refreshing = True
         self.is_loading = True
-        Clock.schedule_once(lambda dt: self._do_refresh(), 0.1)
-
-    def _do_refresh(self):
-        """Perform refresh."""
-        if self.current_tab == 'news':
-            self.news_service.get_news(force_refresh=True)
-        else:
-            self.news_service.get_events(force_refresh=True)
-        self._load_content()
-        self.is_loading = False
+        self._load_content(force_refresh=True)
 
     # =========================================================================
     # NEWS
     # =========================================================================
 
-    def _load_news(self):
-        """Load and display news articles."""
+    def _news_data(self):
+        """Build the recycle view data for the news tab."""
         articles = self.news_service.get_news(limit=15)
 
         if not articles:
-            self._show_empty_state(
-                'No news available' if self.lang == 'en' else 'Nenhuma notícia disponível',
-                'Pull to refresh' if self.lang == 'en' else 'Deslize para atualizar'
-            )
-            return
-
-        for article in articles:
-            card = self._create_news_card(article)
-            self.content_grid.add_widget(card)
-
-    def _create_news_card(self, article: NewsArticle):
-        """Create a news article card."""
-        card = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=dp(120),
-            padding=dp(12),
-            spacing=dp(8)
-        )
-
-        with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            card._bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(8)])
-        card.bind(
-            pos=lambda *a, c=card: setattr(c._bg, 'pos', c.pos),
-            size=lambda *a, c=card: setattr(c._bg, 'size', c.size)
-        )
-
-        # Content row
-        content = BoxLayout(spacing=dp(10))
-
-        # Image (if available)
-        if article.image_url:
-            img = AsyncImage(
-                source=article.image_url,
-                size_hint_x=None,
-                width=dp(80),
-                allow_stretch=True,
-                keep_ratio=True
-            )
-            content.add_widget(img)
-
-        # Text content
-        text_box = BoxLayout(orientation='vertical', spacing=dp(4))
-
-        # Title
-        title = Label(
-            text=article.title[:80] + ('...' if len(article.title) > 80 else ''),
-            font_size=sp(14),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            halign='left',
-            valign='top',
-            text_size=(dp(200), None)
-        )
-        text_box.add_widget(title)
-
-        # Summary
-        if article.summary:
-            summary = Label(
-                text=article.summary[:100] + ('...' if len(article.summary) > 100 else ''),
-                font_size=sp(11),
-                color=get_color_from_hex(COLORS['text_secondary']),
-                halign='left',
-                valign='top',
-                text_size=(dp(200), None)
-            )
-            text_box.add_widget(summary)
-
-        # Source and date
-        meta = Label(
-            text=f'{article.source} • {self._format_date(article.published_date)}',
-            font_size=sp(10),
-            color=get_color_from_hex(COLORS['text_muted']),
-            halign='left',
-            valign='bottom'
-        )
-        meta.bind(size=meta.setter('text_size'))
-        text_box.add_widget(meta)
-
-        content.add_widget(text_box)
-        card.add_widget(content)
-
-        # Make card clickable
-        btn = Button(
-            text='Read More' if self.lang == 'en' else 'Ler Mais',
-            size_hint_y=None,
-            height=dp(30),
-            background_color=get_color_from_hex(COLORS['secondary']),
-            font_size=sp(12)
-        )
-        btn.bind(on_release=lambda x, url=article.url: self._open_url(url))
-        card.add_widget(btn)
-
-        return card
+            return [self._empty_state_data(self.T('no_news'), self.T('no_news_hint'))]
+
+        return [self._news_card_data(article) for article in articles]
+
+    def _news_card_data(self, article: 'NewsArticle'):
+        """Build the data entry for a news article card."""
+        return {
+            'viewclass': NewsCardItem,
+            'height': dp(120),
+            'title': _truncate(article.title, 80),
+            'summary': _truncate(article.summary, 100),
+            'meta': f'{article.source} • {_format_date(article.published_date)}',
+            'url': article.url,
+            'image_url': article.image_url,
+            'button_text': self.T('read_more'),
+        }
 
     # =========================================================================
     # EVENTS
     # =========================================================================
 
-    def _load_events(self):
-        """Load and display upcoming events."""
+    def _events_data(self):
+        """Build the recycle view data for the events tab."""
         events = self.news_service.get_events(limit=10)
 
         if not events:
-            self._show_empty_state(
-                'No events available' if self.lang == 'en' else 'Nenhum evento disponível',
-                'Check back later' if self.lang == 'en' else 'Volte mais tarde'
-            )
-            return
+            return [self._empty_state_data(self.T('no_events'), self.T('no_events_hint'))]
+
+        data = []
 
         # Section: Registered events
         registered = [e for e in events if e.is_registered]
         if registered:
-            header = self._create_section_header(
-                'My Events' if self.lang == 'en' else 'Meus Eventos'
-            )
-            self.content_grid.add_widget(header)
-
-            for event in registered:
-                card = self._create_event_card(event)
-                self.content_grid.add_widget(card)
+            data.append(self._section_header_data(self.T('my_events')))
+            data.extend(self._event_card_data(event) for event in registered)
 
         # Section: Upcoming events
-        header = self._create_section_header(
-            'Upcoming Events' if self.lang == 'en' else 'Próximos Eventos'
-        )
-        self.content_grid.add_widget(header)
-
-        for event in events:
-            card = self._create_event_card(event)
-            self.content_grid.add_widget(card)
-
-    def _create_event_card(self, event: Tournament):
-        """Create an event card."""
-        card = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=dp(110),
-            padding=dp(12),
-            spacing=dp(6)
-        )
-
-        # Card background color based on event type
-        type_colors = {
-            'Worlds': COLORS['accent'],
-            'International': COLORS['secondary'],
-            'Regional': COLORS['primary'],
+        data.append(self._section_header_data(self.T('upcoming_events')))
+        data.extend(self._event_card_data(event) for event in events)
+        return data
+
+    def _event_card_data(self, event: 'Tournament'):
+        """Build the data entry for an event card."""
+        registered_text = self.T('registered') if event.is_registered else ''
+
+        return {
+            'viewclass': EventCardItem,
+            'height': dp(110),
+            'type_color': _EVENT_TYPE_RGBA.get(event.event_type, _EVENT_TYPE_RGBA[None]),
+            'event_type': event.event_type,
+            'registered_text': registered_text,
+            'name': event.name,
+            'info': f'📅 {event.date}  📍 {event.location}',
+            'url': event.url,
+            'button_text': self.T('view_details'),
         }
-        bg_color = type_colors.get(event.event_type, COLORS['surface'])
-
-        with card.canvas.before:
-            Color(*get_color_from_hex(COLORS['surface']))
-            card._bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[dp(8)])
-        card.bind(
-            pos=lambda *a, c=card: setattr(c._bg, 'pos', c.pos),
-            size=lambda *a, c=card: setattr(c._bg, 'size', c.size)
-        )
-
-        # Header row
-        header = BoxLayout(size_hint_y=None, height=dp(25))
-
-        # Event type badge
-        type_badge = BoxLayout(size_hint_x=None, width=dp(80), padding=dp(2))
-        with type_badge.canvas.before:
-            Color(*get_color_from_hex(bg_color))
-            type_badge._bg = RoundedRectangle(
-                pos=type_badge.pos,
-                size=type_badge.size,
-                radius=[dp(4)]
-            )
-        type_badge.bind(
-            pos=lambda *a, t=type_badge: setattr(t._bg, 'pos', t.pos),
-            size=lambda *a, t=type_badge: setattr(t._bg, 'size', t.size)
-        )
-
-        type_label = Label(
-            text=event.event_type,
-            font_size=sp(10),
-            bold=True,
-            color=(1, 1, 1, 1)
-        )
-        type_badge.add_widget(type_label)
-        header.add_widget(type_badge)
-
-        # Registered indicator
-        if event.is_registered:
-            reg_label = Label(
-                text='✓ Registered' if self.lang == 'en' else '✓ Inscrito',
-                font_size=sp(10),
-                color=get_color_from_hex(COLORS['success']),
-                halign='right'
-            )
-            reg_label.bind(size=reg_label.setter('text_size'))
-            header.add_widget(reg_label)
-        else:
-            header.add_widget(Label())  # Spacer
-
-        card.add_widget(header)
-
-        # Event name
-        name = Label(
-            text=event.name,
-            font_size=sp(14),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            halign='left',
-            valign='middle',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        name.bind(size=name.setter('text_size'))
-        card.add_widget(name)
-
-        # Date and location
-        info = Label(
-            text=f'📅 {event.date}  📍 {event.location}',
-            font_size=sp(12),
-            color=get_color_from_hex(COLORS['text_secondary']),
-            halign='left',
-            valign='middle',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        info.bind(size=info.setter('text_size'))
-        card.add_widget(info)
-
-        # Action button
-        btn_text = 'View Details' if self.lang == 'en' else 'Ver Detalhes'
-        btn = Button(
-            text=btn_text,
-            size_hint_y=None,
-            height=dp(30),
-            background_color=get_color_from_hex(COLORS['secondary']),
-            font_size=sp(12)
-        )
-        btn.bind(on_release=lambda x, url=event.url: self._open_url(url))
-        card.add_widget(btn)
-
-        return card
 
     # =========================================================================
     # HELPERS
     # =========================================================================
 
-    def _create_section_header(self, text):
-        """Create a section header."""
-        header = Label(
-            text=text,
-            font_size=sp(14),
-            bold=True,
-            color=get_color_from_hex(COLORS['text']),
-            size_hint_y=None,
-            height=dp(30),
-            halign='left',
-            valign='bottom'
-        )
-        header.bind(size=header.setter('text_size'))
-        return header
-
-    def _show_empty_state(self, title, subtitle):
-        """Show empty state message."""
-        container = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height=dp(150),
-            padding=dp(30)
-        )
-
-        title_label = Label(
-            text=title,
-            font_size=sp(16),
-            bold=True,
-            color=get_color_from_hex(COLORS['text_secondary']),
-            halign='center'
-        )
-        container.add_widget(title_label)
+    def _section_header_data(self, text):
+        """Build the data entry for a section header."""
+        return {'viewclass': SectionHeaderItem, 'height': dp(30), 'text': text}
+
+    def _empty_state_data(self, title, subtitle):
+        """Build the data entry for the empty state message."""
+        return {
+            'viewclass': EmptyStateItem,
+            'height': dp(150),
+            'title': title,
+            'subtitle': subtitle,
+        }
 
-        subtitle_label = Label(
-            text=subtitle,
-            font_size=sp(13),
-            color=get_color_from_hex(COLORS['text_muted']),
-            halign='center'
-        )
-        container.add_widget(subtitle_label)
+    def _set_thumbnail(self, img, url):
+        """Show the cached thumbnail of url, fetching and downscaling it first if needed."""
+        img._thumb_url = url
+        cached = self.thumbnails.get_cached(url)
+        if cached:
+            img.source = cached
+            return
+        img.source = ''
 
-        self.content_grid.add_widget(container)
+        def apply(path):
+            # Recycled images may have moved on to another article meanwhile
+            if img._thumb_url == url:
+                # Fall back to the full-size remote image if the thumbnail failed
+                img.source = path or url
 
-    def _format_date(self, date_str):
-        """Format date string for display."""
-        if not date_str:
-            return ""
-        # Simple formatting - just return first part
-        return date_str.split(',')[0] if ',' in date_str else date_str[:20]
+        self.thumbnails.fetch_async(url, lambda path: Clock.schedule_once(lambda dt: apply(path), 0))
 
     def _open_url(self, url):
         """Open URL in browser."""
         if url:
             try:
+                import webbrowser
                 webbrowser.open(url)
             except Exception:
                 pass
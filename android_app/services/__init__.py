@@ -3,5 +3,6 @@ from .user_database import UserDatabase
 from .deck_import import DeckImportService
 from .news_service import NewsService
 from .match_analysis import MatchAnalysisService
+from .thumbnail_cache import ThumbnailCache
 
-__all__ = ['UserDatabase', 'DeckImportService', 'NewsService', 'MatchAnalysisService']
+__all__ = ['UserDatabase', 'DeckImportService', 'NewsService', 'MatchAnalysisService', 'ThumbnailCache']
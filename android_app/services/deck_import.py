@@ -8,15 +8,12 @@ Supports:
 """
 
 import re
-import sys
-import os
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from .user_database import UserCard, UserDeck
 
 
@@ -24,57 +21,70 @@ from .user_database import UserCard, UserDeck
 # CONSTANTS
 # =============================================================================
 
-# Set code mappings (PTCGO codes to standard)
-SET_CODE_MAP = {
-    # Scarlet & Violet era
-    "PAF": "sv4pt5",  # Paldean Fates
-    "OBF": "sv3",     # Obsidian Flames
-    "PAL": "sv2",     # Paldea Evolved
-    "SVI": "sv1",     # Scarlet & Violet Base
-    "MEW": "sv3pt5",  # 151
-    "PAR": "sv4",     # Paradox Rift
-    "TEF": "sv5",     # Temporal Forces
-    "TWM": "sv6",     # Twilight Masquerade
-    "SFA": "sv6pt5",  # Shrouded Fable
-    "SCR": "sv7",     # Stellar Crown
-    "SSP": "sv8",     # Surging Sparks
-    "PRE": "sv8pt5",  # Prismatic Evolutions
-    "JTG": "sv9",     # Journey Together
-    "ASC": "sv9pt5",  # Ascended Heroes
-    "DRI": "sv10",    # Destined Rivals
-    # Basic Energy
-    "SVE": "sve",
-}
-
-# Regulation marks by set
-REGULATION_MARKS = {
-    # G regulation (rotating March 2026)
-    "sv1": "G", "sv2": "G", "sv3": "G", "sv3pt5": "G",
-    "sv4": "G", "sv4pt5": "G",
-    "SVI": "G", "PAL": "G", "OBF": "G", "MEW": "G",
-    "PAR": "G", "PAF": "G",
+# Set info by PTCGO code: (standard code, regulation mark)
+SET_INFO = {
+    # Scarlet & Violet era - G regulation (rotating March 2026)
+    "SVI": ("sv1", "G"),       # Scarlet & Violet Base
+    "PAL": ("sv2", "G"),       # Paldea Evolved
+    "OBF": ("sv3", "G"),       # Obsidian Flames
+    "MEW": ("sv3pt5", "G"),    # 151
+    "PAR": ("sv4", "G"),       # Paradox Rift
+    "PAF": ("sv4pt5", "G"),    # Paldean Fates
     # H regulation (safe)
-    "sv5": "H", "sv6": "H", "sv6pt5": "H", "sv7": "H", "sv8": "H",
-    "TEF": "H", "TWM": "H", "SFA": "H", "SCR": "H", "SSP": "H",
+    "TEF": ("sv5", "H"),       # Temporal Forces
+    "TWM": ("sv6", "H"),       # Twilight Masquerade
+    "SFA": ("sv6pt5", "H"),    # Shrouded Fable
+    "SCR": ("sv7", "H"),       # Stellar Crown
+    "SSP": ("sv8", "H"),       # Surging Sparks
     # I regulation (new sets)
-    "sv8pt5": "I", "sv9": "I", "sv9pt5": "I", "sv10": "I",
-    "PRE": "I", "JTG": "I", "ASC": "I", "DRI": "I",
+    "PRE": ("sv8pt5", "I"),    # Prismatic Evolutions
+    "JTG": ("sv9", "I"),       # Journey Together
+    "ASC": ("sv9pt5", "I"),    # Ascended Heroes
+    "DRI": ("sv10", "I"),      # Destined Rivals
     # Basic Energy (always legal)
-    "SVE": "H", "sve": "H",
+    "SVE": ("sve", "H"),
+}
+
+# Set code mappings (PTCGO codes to standard)
+SET_CODE_MAP = {code: standard for code, (standard, _) in SET_INFO.items()}
+
+# Regulation marks by PTCGO or standard set code
+REGULATION_MARKS = {
+    **{code: mark for code, (_, mark) in SET_INFO.items()},
+    **{standard: mark for standard, mark in SET_INFO.values()},
 }
 
-# Patterns for parsing deck lines
-DECK_LINE_PATTERNS = [
-    # PTCGO format: "4 Charizard ex SVI 125"
-    re.compile(r'^(\d+)\s+(.+?)\s+([A-Z]{2,4})\s+(\d+)$'),
-    # With star: "* 4 Charizard ex SVI 125"
-    re.compile(r'^\*?\s*(\d+)\s+(.+?)\s+([A-Z]{2,4})\s+(\d+)$'),
-    # Energy format: "4 Basic Fire Energy SVE 2"
-    re.compile(r'^(\d+)\s+(Basic\s+\w+\s+Energy)\s+([A-Z]{2,4})\s+(\d+)$'),
+# Regulation marks no longer legal in Standard
+ROTATED_REGULATION_MARKS = frozenset({"D", "E", "F"})
+
+# Pattern for parsing deck lines, covering:
+# - PTCGO format: "4 Charizard ex SVI 125"
+# - With star: "* 4 Charizard ex SVI 125"
+# - Energy format: "4 Basic Fire Energy SVE 2"
+DECK_LINE_RE = re.compile(r'^\*?\s*(\d+)\s+(.+?)\s+([A-Z]{2,4})\s+(\d+)$')
+
+# Section headers (Pokemon: 20, Trainer: 32, Energy: 8, etc.)
+SECTION_HEADER_RE = re.compile(r'^(pokemon|pokémon|trainer|energy):?\s*\d*$', re.IGNORECASE)
+
+# Line prefixes of comments
+COMMENT_PREFIXES = ('#', '//')
+
+# Common separators between decks in one file, tried in order
+DECK_SEPARATORS = [
+    re.compile(r'\n\s*\n\s*\n'),                     # Triple newline
+    re.compile(r'\n---+\n'),                         # Dashes
+    re.compile(r'\n===+\n'),                         # Equals
+    re.compile(r'\nDeck\s*\d*:?\s*\n', re.IGNORECASE),  # "Deck 1:" markers
 ]
 
+# All separators as zero-width alternatives tried at every position, so each
+# occurrence reports the highest-priority separator starting there
+_DECK_SEPARATOR_SCAN = re.compile('(?=%s)' % '|'.join(
+    f'(?P<sep{i}>{separator.pattern})' for i, separator in enumerate(DECK_SEPARATORS)
+), re.IGNORECASE)
+
 # Keywords for detecting card types
-TRAINER_KEYWORDS = [
+TRAINER_KEYWORDS = frozenset({
     "professor", "boss", "iono", "arven", "penny", "jacq", "tulip",
     "nest ball", "ultra ball", "level ball", "poke ball", "master ball",
     "rare candy", "switch", "escape rope", "battle vip pass",
@@ -88,28 +98,124 @@ TRAINER_KEYWORDS = [
     "marnie", "giovanni", "colress", "roxanne", "irida", "melony", "raihan",
     "worker", "leon", "hop", "klara", "n", "research", "judge", "acerola",
     "crasher wake", "eri", "peonia", "pokegear", "hisuian heavy ball"
-]
+})
 
-SUPPORTER_KEYWORDS = [
+SUPPORTER_KEYWORDS = frozenset({
     "professor", "boss", "iono", "arven", "penny", "jacq", "tulip",
     "cynthia", "marnie", "giovanni", "colress", "roxanne", "irida",
     "melony", "raihan", "worker", "leon", "hop", "klara", "crispin",
     "lacey", "kieran", "briar", "lana", "ciphermaniac", "research",
     "judge", "n", "acerola", "crasher wake", "eri", "peonia"
-]
+})
 
-STADIUM_KEYWORDS = [
+STADIUM_KEYWORDS = frozenset({
     "stadium", "temple", "beach", "area zero", "artazon", "mesagoza",
     "academy", "path", "training court", "collapsed", "chaotic",
     "lost city", "jubilife", "magma basin", "crystal cave", "spikemuth"
-]
+})
 
-TOOL_KEYWORDS = [
+TOOL_KEYWORDS = frozenset({
     "seal stone", "cape", "choice belt", "choice band", "leftovers",
     "rescue board", "bravery charm", "defiance band", "hero's cape",
     "survival brace", "vengeful punch", "vitality band", "exp. share",
     "technical machine", "heavy baton", "booster energy"
-]
+})
+
+_KEYWORD_LISTS = {
+    "trainer": TRAINER_KEYWORDS,
+    "supporter": SUPPORTER_KEYWORDS,
+    "stadium": STADIUM_KEYWORDS,
+    "tool": TOOL_KEYWORDS,
+}
+
+# Single-word keywords ("n", "judge", "research", ...) match whole words of
+# the name with a set lookup
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_KEYWORD_TOKENS = {
+    category: frozenset(k for k in keywords if _TOKEN_RE.fullmatch(k))
+    for category, keywords in _KEYWORD_LISTS.items()
+}
+
+# Multi-word keywords ("nest ball", "hero's cape", ...) are substring matches,
+# each tagged with the categories of all phrases it contains so the longest
+# phrase found at a position accounts for the shorter ones nested inside it
+_PHRASE_CATEGORIES = {
+    phrase: frozenset(
+        category
+        for category, keywords in _KEYWORD_LISTS.items()
+        for other in keywords
+        if other not in _KEYWORD_TOKENS[category] and other in phrase
+    )
+    for category, keywords in _KEYWORD_LISTS.items()
+    for phrase in keywords
+    if phrase not in _KEYWORD_TOKENS[category]
+}
+
+# One automaton-style pass over a name: the lookahead tries every position,
+# longest phrase first, without consuming characters
+_PHRASE_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(phrase)
+    for phrase in sorted(_PHRASE_CATEGORIES, key=len, reverse=True)
+))
+
+
+def _build_subtype_table() -> dict[frozenset[str], str]:
+    """Map every possible set of keyword categories to its trainer subtype."""
+    # Earlier subtypes win when a name hits several
+    priority = ("supporter", "stadium", "tool")
+    categories = ("trainer",) + priority
+    table = {}
+    for bits in range(1 << len(categories)):
+        hit = frozenset(c for i, c in enumerate(categories) if bits >> i & 1)
+        table[hit] = next((subtype for subtype in priority if subtype in hit), "item")
+    return table
+
+
+# Trainer subtype for a classify_card() result
+TRAINER_SUBTYPES = _build_subtype_table()
+
+
+@lru_cache(maxsize=1024)
+def classify_card(name_lower: str) -> frozenset[str]:
+    """
+    Get the keyword categories hit by a lowercased card name.
+
+    Cached, since deck lists repeat the same staples over and over.
+
+    Returns:
+        Subset of {"trainer", "supporter", "stadium", "tool"}
+    """
+    tokens = set(_TOKEN_RE.findall(name_lower))
+    categories = {
+        category
+        for category, keyword_tokens in _KEYWORD_TOKENS.items()
+        if not keyword_tokens.isdisjoint(tokens)
+    }
+    for match in _PHRASE_RE.finditer(name_lower):
+        categories |= _PHRASE_CATEGORIES[match.group(1)]
+    return frozenset(categories)
+
+
+@lru_cache(maxsize=4096)
+def card_type_and_subtype(name_lower: str) -> tuple[str, str]:
+    """
+    Get the card type and trainer subtype of a lowercased card name.
+
+    Module-level so every DeckImportService shares the cache.
+
+    Returns:
+        (card_type, subtype); subtype is "" for Pokemon and energy
+    """
+    if "energy" in name_lower:
+        return "energy", ""
+
+    # Supporter, stadium and tool keywords are trainer keywords too, even
+    # when the name hits no general trainer keyword
+    categories = classify_card(name_lower)
+    if categories:
+        return "trainer", TRAINER_SUBTYPES[categories]
+
+    return "pokemon", ""
 
 
 # =============================================================================
@@ -123,7 +229,7 @@ class ValidationSeverity(str, Enum):
     INFO = "info"        # Informational (e.g., rotating cards)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """A validation issue found in a deck."""
     severity: ValidationSeverity
@@ -132,7 +238,7 @@ class ValidationIssue:
     card_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportResult:
     """Result of importing a deck."""
     success: bool
@@ -149,7 +255,7 @@ class ImportResult:
         return any(i.severity == ValidationSeverity.WARNING for i in self.issues)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiImportResult:
     """Result of importing multiple decks from a file."""
     total_found: int
@@ -182,38 +288,36 @@ class DeckImportService:
         issues = []
         cards = []
 
-        lines = text.strip().split('\n')
-        line_number = 0
+        total_quantity = 0
+        match_line = DECK_LINE_RE.match
+        is_section_header = SECTION_HEADER_RE.match
 
-        for line in lines:
-            line_number += 1
+        for line_number, line in enumerate(text.strip().splitlines(), 1):
             line = line.strip()
-
-            # Skip empty lines, comments, and section headers
-            if not line or line.startswith('#') or line.startswith('//'):
+            if not line:
                 continue
 
-            # Skip section headers (Pokemon: 20, Trainer: 32, Energy: 8, etc.)
-            if re.match(r'^(pokemon|pokémon|trainer|energy):?\s*\d*$', line, re.IGNORECASE):
-                continue
-
-            # Try to parse the line
-            card = self._parse_line(line)
-
-            if card:
+            # Card lines are the common case; comments and section headers
+            # never match the card pattern, so they are only checked after it
+            match = match_line(line)
+            if match:
+                card = self._card_from_match(match)
                 cards.append(card)
-            else:
+                total_quantity += card.quantity
+            elif not (line.startswith(COMMENT_PREFIXES) or is_section_header(line)):
+                # Only long lines need a copy; mark those as cut
+                excerpt = line if len(line) <= 50 else line[:50] + "..."
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
-                    message_en=f"Could not parse line {line_number}: {line[:50]}",
-                    message_pt=f"Não foi possível processar linha {line_number}: {line[:50]}"
+                    message_en=f"Could not parse line {line_number}: {excerpt}",
+                    message_pt=f"Não foi possível processar linha {line_number}: {excerpt}"
                 ))
 
         # Create deck
         deck = UserDeck(
             name=deck_name,
             cards=cards,
-            is_complete=sum(c.quantity for c in cards) == 60
+            is_complete=total_quantity == 60
         )
 
         # Validate
@@ -260,12 +364,11 @@ class DeckImportService:
 
         # Split into multiple decks if present
         deck_texts = self._split_multiple_decks(content)
-        results = []
-
-        for i, deck_text in enumerate(deck_texts):
-            deck_name = f"Deck {i + 1}" if len(deck_texts) > 1 else "Imported Deck"
-            result = self.import_from_text(deck_text, deck_name)
-            results.append(result)
+        if len(deck_texts) > 1:
+            deck_names = [f"Deck {i + 1}" for i in range(len(deck_texts))]
+        else:
+            deck_names = ["Imported Deck"]
+        results = [self.import_from_text(text, name) for text, name in zip(deck_texts, deck_names)]
 
         successful = sum(1 for r in results if r.success and r.deck)
         failed = len(results) - successful
@@ -282,109 +385,104 @@ class DeckImportService:
         Split file content into multiple deck texts.
         Decks are separated by double blank lines or deck markers.
         """
-        # Common deck separators
-        separators = [
-            r'\n\s*\n\s*\n',           # Triple newline
-            r'\n---+\n',               # Dashes
-            r'\n===+\n',               # Equals
-            r'\nDeck\s*\d*:?\s*\n',    # "Deck 1:" markers
-        ]
-
-        # Try to split
-        for sep in separators:
-            parts = re.split(sep, content, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                # Filter out empty parts
-                return [p.strip() for p in parts if p.strip() and self._has_deck_content(p)]
+        # Find the highest-priority separator present in one scan
+        best = None
+        for match in _DECK_SEPARATOR_SCAN.finditer(content):
+            index = int(match.lastgroup[3:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
 
         # No separators found - treat as single deck
-        return [content]
+        if best is None:
+            return [content]
+
+        parts = DECK_SEPARATORS[best].split(content)
+        # Filter out empty parts
+        return [part for p in parts if (part := p.strip()) and self._has_deck_content(part)]
 
     def _has_deck_content(self, text: str) -> bool:
         """Check if text contains deck content (not just headers/comments)."""
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith('//'):
-                continue
-            # Skip section headers (Pokemon: 20, Trainer: 32, Energy: 8, etc.)
-            if re.match(r'^(pokemon|pokémon|trainer|energy):?\s*\d*$', line, re.IGNORECASE):
-                continue
-            # Check if line matches a card pattern
-            for pattern in DECK_LINE_PATTERNS:
-                if pattern.match(line):
-                    return True
-        return False
+        # Comments and section headers never match the card pattern
+        match_line = DECK_LINE_RE.match
+        return any(match_line(line.strip()) for line in text.splitlines())
 
     def _parse_line(self, line: str) -> Optional[UserCard]:
-        """Parse a single deck line into a UserCard."""
-        line = line.strip()
-
-        for pattern in DECK_LINE_PATTERNS:
-            match = pattern.match(line)
-            if match:
-                quantity = int(match.group(1))
-                name = match.group(2).strip()
-                set_code = match.group(3).upper()
-                set_number = match.group(4)
-
-                card_type = self._detect_card_type(name)
-                subtype = self._detect_trainer_subtype(name) if card_type == "trainer" else ""
-                regulation_mark = self._get_regulation_mark(set_code)
-
-                return UserCard(
-                    name=name,
-                    set_code=set_code,
-                    set_number=set_number,
-                    quantity=quantity,
-                    card_type=card_type,
-                    subtype=subtype,
-                    regulation_mark=regulation_mark
-                )
-
-        return None
+        """Parse a single, already stripped deck line into a UserCard."""
+        match = DECK_LINE_RE.match(line)
+        if not match:
+            return None
+        return self._card_from_match(match)
+
+    def _card_from_match(self, match: re.Match) -> UserCard:
+        """Build a UserCard from a DECK_LINE_RE match."""
+        # The pattern's whitespace runs already keep spaces out of the name
+        quantity, name, set_code, set_number = match.group(1, 2, 3, 4)
+
+        card_type, subtype = card_type_and_subtype(name.lower())
+
+        return UserCard(
+            name=name,
+            set_code=set_code,
+            set_number=set_number,
+            quantity=int(quantity),
+            card_type=card_type,
+            subtype=subtype,
+            regulation_mark=self._get_regulation_mark(set_code)
+        )
 
     def _detect_card_type(self, name: str) -> str:
         """Detect card type from name."""
-        name_lower = name.lower()
-
-        if "energy" in name_lower:
-            return "energy"
-
-        for keyword in TRAINER_KEYWORDS:
-            if keyword in name_lower:
-                return "trainer"
-
-        return "pokemon"
+        return card_type_and_subtype(name.lower())[0]
 
     def _detect_trainer_subtype(self, name: str) -> str:
         """Detect trainer subtype from name."""
-        name_lower = name.lower()
-
-        for keyword in SUPPORTER_KEYWORDS:
-            if keyword in name_lower:
-                return "supporter"
-
-        for keyword in STADIUM_KEYWORDS:
-            if keyword in name_lower:
-                return "stadium"
-
-        for keyword in TOOL_KEYWORDS:
-            if keyword in name_lower:
-                return "tool"
-
-        return "item"
+        return TRAINER_SUBTYPES[classify_card(name.lower())]
 
     def _get_regulation_mark(self, set_code: str) -> str:
         """Get regulation mark for a set code."""
-        normalized = SET_CODE_MAP.get(set_code.upper(), set_code)
-        return REGULATION_MARKS.get(set_code.upper(),
-               REGULATION_MARKS.get(normalized, "?"))
+        info = SET_INFO.get(set_code.upper())
+        if info:
+            return info[1]
+        return REGULATION_MARKS.get(set_code, "?")
 
     def _validate_deck(self, deck: UserDeck) -> list[ValidationIssue]:
         """Validate a deck and return list of issues."""
         issues = []
+        copy_issues = []
+        rotated_issues = []
+        rotating_names = set()
+        card_counts = defaultdict(int)
+        total = 0
 
-        total = deck.total_cards
+        # One pass over the cards; issues are grouped by check afterwards
+        for card in deck.cards:
+            total += card.quantity
+            mark = card.regulation_mark
+
+            # Check 4-copy rule, skipping basic energy
+            key = card.name_lower
+            if not ("basic" in key and "energy" in key):
+                card_counts[key] += card.quantity
+                if card_counts[key] > 4:
+                    copy_issues.append(ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        message_en=f"More than 4 copies of {card.name}",
+                        message_pt=f"Mais de 4 cópias de {card.name}",
+                        card_name=card.name
+                    ))
+
+            # Check rotation status
+            if mark == "G":
+                rotating_names.add(card.name)
+            elif mark in ROTATED_REGULATION_MARKS:
+                rotated_issues.append(ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    message_en=f"{card.name} is no longer legal (regulation {mark})",
+                    message_pt=f"{card.name} não é mais legal (regulação {mark})",
+                    card_name=card.name
+                ))
 
         # Check total cards
         if total < 60:
@@ -400,45 +498,17 @@ class DeckImportService:
                 message_pt=f"Deck tem cartas demais ({total}/60)"
             ))
 
-        # Check 4-copy rule
-        card_counts = {}
-        for card in deck.cards:
-            # Skip basic energy
-            if "basic" in card.name.lower() and "energy" in card.name.lower():
-                continue
-            key = card.name.lower()
-            card_counts[key] = card_counts.get(key, 0) + card.quantity
-            if card_counts[key] > 4:
-                issues.append(ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message_en=f"More than 4 copies of {card.name}",
-                    message_pt=f"Mais de 4 cópias de {card.name}",
-                    card_name=card.name
-                ))
+        issues.extend(copy_issues)
 
-        # Check rotation status
-        rotating_cards = []
-        for card in deck.cards:
-            if card.regulation_mark == "G":
-                rotating_cards.append(card.name)
-
-        if rotating_cards:
-            unique_rotating = list(set(rotating_cards))
+        if rotating_names:
             issues.append(ValidationIssue(
                 severity=ValidationSeverity.INFO,
-                message_en=f"{len(unique_rotating)} cards rotating in March 2026",
-                message_pt=f"{len(unique_rotating)} cartas rotacionam em Março 2026"
+                message_en=f"{len(rotating_names)} cards rotating in March 2026",
+                message_pt=f"{len(rotating_names)} cartas rotacionam em Março 2026"
             ))
 
-        # Check for already rotated cards
-        for card in deck.cards:
-            if card.regulation_mark in ["D", "E", "F"]:
-                issues.append(ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    message_en=f"{card.name} is no longer legal (regulation {card.regulation_mark})",
-                    message_pt=f"{card.name} não é mais legal (regulação {card.regulation_mark})",
-                    card_name=card.name
-                ))
+        # Already rotated cards
+        issues.extend(rotated_issues)
 
         return issues
 
@@ -451,7 +521,7 @@ class DeckImportService:
             return "My Deck"
 
         # Check for ex Pokemon
-        ex_pokemon = [p for p in pokemon if " ex" in p.name.lower()]
+        ex_pokemon = [p for p in pokemon if " ex" in p.name_lower]
 
         if ex_pokemon:
             # Sort by quantity, then by name length (longer names often more specific)
@@ -12,13 +12,20 @@ Features:
 import re
 import json
 import os
-from dataclasses import dataclass, field, asdict
+import heapq
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+try:
+    import orjson
+except ImportError:
+    # Without orjson the cache is encoded with the stdlib json module
+    orjson = None
+
 
 class MatchSource(Enum):
     """Source type for match data."""
@@ -36,7 +43,7 @@ class ProcessingStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayAction:
     """Represents a single play action in a match."""
     turn: int = 0
@@ -46,8 +53,18 @@ class PlayAction:
     details: str = ""
     timestamp: str = ""
 
+    def to_dict(self):
+        return {
+            'turn': self.turn,
+            'player': self.player,
+            'action_type': self.action_type,
+            'card_name': self.card_name,
+            'details': self.details,
+            'timestamp': self.timestamp,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MatchData:
     """Represents processed match data."""
     id: str = ""
@@ -67,10 +84,24 @@ class MatchData:
     error_message: str = ""
 
     def to_dict(self):
-        data = asdict(self)
-        data['source'] = self.source.value
-        data['status'] = self.status.value
-        return data
+        # Built by hand: asdict deep-copies every field, including each action
+        return {
+            'id': self.id,
+            'title': self.title,
+            'source': self.source.value,
+            'source_url': self.source_url,
+            'player1_deck': self.player1_deck,
+            'player2_deck': self.player2_deck,
+            'winner': self.winner,
+            'total_turns': self.total_turns,
+            'actions': [a.to_dict() for a in self.actions],
+            'cards_identified': list(self.cards_identified),
+            'insights': list(self.insights),
+            'status': self.status.value,
+            'created_at': self.created_at,
+            'processed_at': self.processed_at,
+            'error_message': self.error_message,
+        }
 
     @staticmethod
     def from_dict(data: dict) -> 'MatchData':
@@ -80,7 +111,8 @@ class MatchData:
         return MatchData(**data)
 
 
-# Common Pokemon TCG card patterns for identification
+# Common Pokemon TCG card patterns for identification, most specific first:
+# where several match at the same position, the earliest one is reported
 CARD_PATTERNS = [
     # Pokemon ex
     r'\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s+ex\b',
@@ -95,59 +127,193 @@ CARD_PATTERNS = [
     # Stadiums
     r'\b(Artazon|Temple of Sinnoh|Path to the Peak|Collapsed Stadium|Beach Court)\b',
     # Energy
-    r'\b(Double Turbo Energy|Jet Energy|Reversal Energy|Gift Energy|Basic .+ Energy)\b',
+    r'\b(Double Turbo Energy|Jet Energy|Reversal Energy|Gift Energy|Basic \w+ Energy)\b',
 ]
 
-# Action patterns for transcription parsing
+
+def _build_card_scanner(patterns: list[str]) -> tuple[re.Pattern, dict[str, range]]:
+    """
+    Combine card patterns into one alternation scanned in a single pass.
+
+    The alternation sits in a lookahead, so matches are zero-width and a name
+    contained in a longer match (e.g. "Gardevoir" in "Then Gardevoir ex") is
+    still found from its own starting position.
+
+    Returns:
+        The compiled regex and, per alternative group name, the indices of
+        that pattern's own capture groups
+    """
+    alternatives = []
+    inner_groups = {}
+    group_index = 0
+    for i, pattern in enumerate(patterns):
+        name = f"card{i}"
+        group_count = re.compile(pattern).groups
+        alternatives.append(f"(?P<{name}>{pattern})")
+        inner_groups[name] = range(group_index + 2, group_index + 2 + group_count)
+        group_index += 1 + group_count
+    return re.compile(f"(?=(?:{'|'.join(alternatives)}))", re.IGNORECASE), inner_groups
+
+
+CARD_SCAN_RE, _CARD_SCAN_GROUPS = _build_card_scanner(CARD_PATTERNS)
+
+# YouTube watch, short and embed URLs, capturing the video ID
+YOUTUBE_VIDEO_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([\w-]+)')
+
+# Action patterns for transcription parsing. Free-text captures are capped
+# at 100 characters: an open-ended (.+) followed by more pattern backtracks
+# quadratically on long lines, such as auto-generated captions on one line
 ACTION_PATTERNS = {
     'draw': [r'draw(?:s|ing)?\s+(?:a\s+)?card', r'drew\s+(?:a\s+)?card'],
     'play_pokemon': [r'play(?:s|ed)?\s+(?:down\s+)?([A-Z][a-z]+)', r'bench(?:es|ed)?\s+([A-Z][a-z]+)'],
-    'attach_energy': [r'attach(?:es|ed)?\s+(?:an?\s+)?energy', r'attach(?:es|ed)?\s+(.+)\s+energy'],
-    'attack': [r'attack(?:s|ed)?\s+(?:with\s+)?(.+)', r'use(?:s|d)?\s+(.+)\s+for\s+\d+'],
+    'attach_energy': [r'attach(?:es|ed)?\s+(?:an?\s+)?energy', r'attach(?:es|ed)?\s+(.{1,100})\s+energy'],
+    'attack': [r'attack(?:s|ed)?\s+(?:with\s+)?(.{1,100})', r'use(?:s|d)?\s+(.{1,100})\s+for\s+\d+'],
     'retreat': [r'retreat(?:s|ed)?', r'switch(?:es|ed)?'],
-    'supporter': [r'play(?:s|ed)?\s+(Professor|Iono|Boss|Arven|Penny)', r'use(?:s|d)?\s+(.+)\s+supporter'],
-    'item': [r'use(?:s|d)?\s+(?:an?\s+)?(Ultra Ball|Nest Ball|Rare Candy)', r'play(?:s|ed)?\s+(.+)\s+item'],
+    'supporter': [r'play(?:s|ed)?\s+(Professor|Iono|Boss|Arven|Penny)', r'use(?:s|d)?\s+(.{1,100})\s+supporter'],
+    'item': [r'use(?:s|d)?\s+(?:an?\s+)?(Ultra Ball|Nest Ball|Rare Candy)', r'play(?:s|ed)?\s+(.{1,100})\s+item'],
     'knock_out': [r'knock(?:s|ed)?\s+out', r'KO(?:\'s|ed)?'],
     'prize': [r'take(?:s)?\s+(?:a\s+)?prize', r'drew\s+prize'],
 }
 
+# ACTION_PATTERNS compiled once, in the same order
+_ACTION_PATTERNS_COMPILED = [
+    (action_type, [re.compile(p) for p in patterns])
+    for action_type, patterns in ACTION_PATTERNS.items()
+]
+
+_TURN_RE = re.compile(r'turn\s+(\d+)')
+
+# Deck archetypes and the card name keywords that identify them
+ARCHETYPES = {
+    'Charizard ex': ['charizard', 'pidgeot'],
+    'Dragapult ex': ['dragapult', 'giratina'],
+    'Gardevoir ex': ['gardevoir', 'kirlia'],
+    'Lugia VSTAR': ['lugia', 'archeops'],
+    'Regidrago VSTAR': ['regidrago', 'ogerpon'],
+    'Gholdengo ex': ['gholdengo', 'gimmighoul'],
+    'Roaring Moon ex': ['roaring moon', 'flutter mane'],
+    'Lost Zone': ['comfey', 'cramorant', 'sableye'],
+}
+
+
+def _build_archetype_table(archetypes: dict[str, list[str]]):
+    """
+    Give every archetype keyword its own bit.
+
+    Returns:
+        A regex finding any keyword, the bit of each keyword, and per
+        archetype (in order) its keyword mask and the hits it needs
+    """
+    keyword_bits = {}
+    table = []
+    for archetype, keywords in archetypes.items():
+        mask = 0
+        for kw in keywords:
+            mask |= keyword_bits.setdefault(kw, 1 << len(keyword_bits))
+        table.append((archetype, mask, len(keywords) // 2 + 1))
+    # Lookahead so keywords overlapping each other are all found
+    scan = re.compile('(?=(' + '|'.join(
+        re.escape(kw) for kw in sorted(keyword_bits, key=len, reverse=True)
+    ) + '))')
+    return scan, keyword_bits, table
+
+
+_ARCHETYPE_SCAN_RE, _ARCHETYPE_KEYWORD_BITS, _ARCHETYPE_TABLE = _build_archetype_table(ARCHETYPES)
+
 
 class MatchAnalysisService:
     """Service for analyzing Pokemon TCG matches."""
 
-    CACHE_FILE = "matches_cache.json"
+    # One JSON object per line, so adding a match appends a single line
+    CACHE_FILE = "matches_cache.jsonl"
+    LEGACY_CACHE_FILE = "matches_cache.json"
 
     def __init__(self, cache_dir: str = None):
         """Initialize match analysis service."""
         self.cache_dir = cache_dir or os.path.dirname(os.path.abspath(__file__))
         self.cache_path = os.path.join(self.cache_dir, self.CACHE_FILE)
         self._matches: list[MatchData] = []
+        # Same matches keyed by id, for constant-time lookups
+        self._by_id: dict[str, MatchData] = {}
         self._load_cache()
+        self._by_id = {m.id: m for m in self._matches}
+        # Suffix of generated ids; only ever increases, unlike the match count
+        self._next_seq = len(self._matches)
+
+    @staticmethod
+    def _encode_line(match: MatchData) -> bytes:
+        """Encode a match as one UTF-8 cache line."""
+        if orjson is not None:
+            # orjson produces UTF-8 bytes directly
+            return orjson.dumps(match.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(match.to_dict(), ensure_ascii=False) + '\n').encode('utf-8')
 
     def _load_cache(self):
         """Load cached matches from file."""
+        legacy_path = os.path.join(self.cache_dir, self.LEGACY_CACHE_FILE)
         try:
             if os.path.exists(self.cache_path):
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                loads = orjson.loads if orjson is not None else json.loads
+                # Both decoders accept UTF-8 bytes, so lines are never decoded to str
+                with open(self.cache_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            self._matches.append(MatchData.from_dict(loads(line)))
+                        except ValueError:
+                            # Skip a line cut short by an interrupted append
+                            continue
+            elif os.path.exists(legacy_path):
+                # Migrate the old single-document cache
+                with open(legacy_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self._matches = [MatchData.from_dict(m) for m in data.get('matches', [])]
+                self._matches = [MatchData.from_dict(m) for m in data.get('matches', [])]
+                # Only drop the old file once the new one is safely in place
+                if self._save_cache():
+                    os.remove(legacy_path)
         except (json.JSONDecodeError, IOError):
             pass
 
-    def _save_cache(self):
-        """Save matches to cache file."""
+    def _save_cache(self) -> bool:
+        """Rewrite the cache file with all matches. Returns True on success."""
+        tmp_path = self.cache_path + '.tmp'
         try:
-            data = {
-                'matches': [m.to_dict() for m in self._matches]
-            }
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.writelines(self._encode_line(m) for m in self._matches)
+            os.replace(tmp_path, self.cache_path)
+            return True
+        except IOError:
+            # Don't leave a partial temp file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def _append_to_cache(self, match: MatchData):
+        """Append a single new match to the cache file."""
+        line = self._encode_line(match)
+        try:
+            with open(self.cache_path, 'ab+') as f:
+                # Start on a fresh line if an interrupted append left a torn tail
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
         except IOError:
             pass
 
-    def _generate_id(self) -> str:
-        """Generate unique match ID."""
-        return f"match_{datetime.now().strftime('%Y%m%d%H%M%S')}_{len(self._matches)}"
+    def _generate_id(self, now: datetime) -> str:
+        """Generate unique match ID from the match creation time."""
+        self._next_seq += 1
+        match_id = f"match_{now:%Y%m%d%H%M%S}_{self._next_seq}"
+        # Matches loaded from an earlier session may already use the sequence
+        while match_id in self._by_id:
+            self._next_seq += 1
+            match_id = f"match_{now:%Y%m%d%H%M%S}_{self._next_seq}"
+        return match_id
 
     # =========================================================================
     # YOUTUBE PROCESSING
@@ -163,12 +329,13 @@ class MatchAnalysisService:
         Returns:
             MatchData with extracted information
         """
+        now = datetime.now()
         match = MatchData(
-            id=self._generate_id(),
+            id=self._generate_id(now),
             source=MatchSource.YOUTUBE,
             source_url=url,
             status=ProcessingStatus.PROCESSING,
-            created_at=datetime.now().isoformat()
+            created_at=now.isoformat()
         )
 
         # Validate YouTube URL
@@ -191,30 +358,18 @@ class MatchAnalysisService:
         match.insights.append("Tip: Add transcription manually for faster analysis")
 
         self._matches.append(match)
-        self._save_cache()
+        self._by_id[match.id] = match
+        self._append_to_cache(match)
         return match
 
     def _is_valid_youtube_url(self, url: str) -> bool:
         """Check if URL is a valid YouTube URL."""
-        patterns = [
-            r'youtube\.com/watch\?v=[\w-]+',
-            r'youtu\.be/[\w-]+',
-            r'youtube\.com/embed/[\w-]+',
-        ]
-        return any(re.search(p, url) for p in patterns)
+        return YOUTUBE_VIDEO_ID_RE.search(url) is not None
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r'youtube\.com/watch\?v=([\w-]+)',
-            r'youtu\.be/([\w-]+)',
-            r'youtube\.com/embed/([\w-]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = YOUTUBE_VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
 
     def _fetch_youtube_metadata(self, video_id: str) -> Optional[dict]:
         """Fetch YouTube video metadata (title, thumbnail)."""
@@ -243,17 +398,18 @@ class MatchAnalysisService:
         Returns:
             MatchData with extracted information
         """
+        now = datetime.now()
         match = MatchData(
-            id=self._generate_id(),
+            id=self._generate_id(now),
             source=MatchSource.TRANSCRIPTION,
             title=title or "Transcribed Match",
             status=ProcessingStatus.PROCESSING,
-            created_at=datetime.now().isoformat()
+            created_at=now.isoformat()
         )
 
         # Identify cards mentioned
         cards = self._identify_cards(text)
-        match.cards_identified = list(set(cards))
+        match.cards_identified = cards
 
         # Parse play sequence
         actions = self._parse_play_sequence(text)
@@ -271,37 +427,37 @@ class MatchAnalysisService:
         match.processed_at = datetime.now().isoformat()
 
         self._matches.append(match)
-        self._save_cache()
+        self._by_id[match.id] = match
+        self._append_to_cache(match)
         return match
 
     def _identify_cards(self, text: str) -> list[str]:
-        """Identify Pokemon TCG cards mentioned in text."""
+        """Identify Pokemon TCG cards mentioned in text, in order of first mention."""
         cards = []
-        for pattern in CARD_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for m in matches:
-                if isinstance(m, tuple):
-                    cards.append(' '.join(m).strip())
-                else:
-                    cards.append(m.strip())
-        return cards
+        for m in CARD_SCAN_RE.finditer(text):
+            # Join the capture groups of whichever pattern matched
+            cards.append(' '.join(m.group(i) or '' for i in _CARD_SCAN_GROUPS[m.lastgroup]).strip())
+        return list(dict.fromkeys(cards))
 
     def _parse_play_sequence(self, text: str) -> list[PlayAction]:
         """Parse play sequence from transcription."""
         actions = []
-        lines = text.split('\n')
+        add_action = actions.append
+        search_turn = _TURN_RE.search
         current_turn = 0
         current_player = "player1"
 
-        for line in lines:
-            line = line.strip().lower()
+        # Lowercase the whole transcription once instead of line by line
+        for line in text.lower().split('\n'):
+            line = line.strip()
             if not line:
                 continue
 
             # Detect turn changes
-            turn_match = re.search(r'turn\s+(\d+)', line)
-            if turn_match:
-                current_turn = int(turn_match.group(1))
+            if 'turn' in line:
+                turn_match = search_turn(line)
+                if turn_match:
+                    current_turn = int(turn_match.group(1))
 
             # Detect player changes
             if 'opponent' in line or 'player 2' in line:
@@ -310,41 +466,36 @@ class MatchAnalysisService:
                 current_player = "player1"
 
             # Detect actions
-            for action_type, patterns in ACTION_PATTERNS.items():
+            details = line[:100]
+            for action_type, patterns in _ACTION_PATTERNS_COMPILED:
                 for pattern in patterns:
-                    match = re.search(pattern, line)
+                    match = pattern.search(line)
                     if match:
                         card_name = match.group(1) if match.lastindex else ""
-                        action = PlayAction(
+                        add_action(PlayAction(
                             turn=current_turn,
                             player=current_player,
                             action_type=action_type,
                             card_name=card_name.title() if card_name else "",
-                            details=line[:100]
-                        )
-                        actions.append(action)
+                            details=details
+                        ))
                         break
 
         return actions
 
     def _detect_deck_archetype(self, cards: list[str]) -> str:
         """Detect deck archetype based on cards identified."""
-        archetypes = {
-            'Charizard ex': ['charizard', 'pidgeot'],
-            'Dragapult ex': ['dragapult', 'giratina'],
-            'Gardevoir ex': ['gardevoir', 'kirlia'],
-            'Lugia VSTAR': ['lugia', 'archeops'],
-            'Regidrago VSTAR': ['regidrago', 'ogerpon'],
-            'Gholdengo ex': ['gholdengo', 'gimmighoul'],
-            'Roaring Moon ex': ['roaring moon', 'flutter mane'],
-            'Lost Zone': ['comfey', 'cramorant', 'sableye'],
-        }
+        # One lowercase blob; the separator keeps keywords from matching
+        # across two card names
+        cards_blob = '\x00'.join(cards).lower()
 
-        cards_lower = [c.lower() for c in cards]
+        # Scan once for every keyword, then test each archetype's bits
+        found = 0
+        for m in _ARCHETYPE_SCAN_RE.finditer(cards_blob):
+            found |= _ARCHETYPE_KEYWORD_BITS[m.group(1)]
 
-        for archetype, keywords in archetypes.items():
-            matches = sum(1 for kw in keywords if any(kw in c for c in cards_lower))
-            if matches >= len(keywords) // 2 + 1:
+        for archetype, mask, needed in _ARCHETYPE_TABLE:
+            if (found & mask).bit_count() >= needed:
                 return archetype
 
         return "Unknown"
@@ -392,21 +543,23 @@ class MatchAnalysisService:
         """Get all processed matches."""
         return sorted(self._matches, key=lambda m: m.created_at, reverse=True)
 
+    def get_recent_matches(self, limit: int) -> list[MatchData]:
+        """Get the `limit` most recent matches without sorting the whole history."""
+        return heapq.nlargest(limit, self._matches, key=lambda m: m.created_at)
+
     def get_match(self, match_id: str) -> Optional[MatchData]:
         """Get a specific match by ID."""
-        for match in self._matches:
-            if match.id == match_id:
-                return match
-        return None
+        return self._by_id.get(match_id)
 
     def delete_match(self, match_id: str) -> bool:
         """Delete a match."""
-        for i, match in enumerate(self._matches):
-            if match.id == match_id:
-                self._matches.pop(i)
-                self._save_cache()
-                return True
-        return False
+        match = self._by_id.pop(match_id, None)
+        if match is None:
+            return False
+        # The list keeps insertion order for the cache file and insights
+        self._matches.remove(match)
+        self._save_cache()
+        return True
 
     def get_recent_insights(self, limit: int = 5) -> list[str]:
         """Get recent insights from all matches."""
@@ -11,12 +11,42 @@ Features:
 import re
 import json
 import os
-from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from typing import Optional
 from urllib.request import urlopen, Request
-from urllib.error import URLError
-from xml.etree import ElementTree
+from urllib.error import URLError, HTTPError
+
+try:
+    # C-backed parser with the same iterparse/find API
+    from lxml import etree as ElementTree
+    XMLParseError = ElementTree.XMLSyntaxError
+except ImportError:
+    from xml.etree import ElementTree
+    XMLParseError = ElementTree.ParseError
+
+try:
+    import orjson
+except ImportError:
+    # Without orjson the cache is encoded with the stdlib json module
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:
+    # Without urllib3 every request opens its own connection through urlopen
+    urllib3 = None
+
+# Keep-alive connections shared by every request to the news and event sites
+_HTTP_POOL = (
+    urllib3.PoolManager(num_pools=4, timeout=urllib3.Timeout(connect=5, read=10))
+    if urllib3 is not None else None
+)
+
+# First image source and any HTML tag in an RSS item description
+IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 
 @dataclass
@@ -31,7 +61,8 @@ class NewsArticle:
     source: str = "PokeBeach"
 
     def to_dict(self):
-        return asdict(self)
+        # Plain field copy; asdict deep-copies values that are all immutable here
+        return {name: getattr(self, name) for name in _NEWS_ARTICLE_FIELDS}
 
     @staticmethod
     def from_dict(data: dict) -> 'NewsArticle':
@@ -54,56 +85,138 @@ class Tournament:
     deck_id: Optional[int] = None
 
     def to_dict(self):
-        return asdict(self)
+        return {name: getattr(self, name) for name in _TOURNAMENT_FIELDS}
 
     @staticmethod
     def from_dict(data: dict) -> 'Tournament':
         return Tournament(**data)
 
 
+# Field names, looked up once instead of on every to_dict call
+_NEWS_ARTICLE_FIELDS = tuple(f.name for f in fields(NewsArticle))
+_TOURNAMENT_FIELDS = tuple(f.name for f in fields(Tournament))
+
+
 class NewsService:
     """Service for fetching Pokemon TCG news and events."""
 
     POKEBEACH_RSS = "https://www.pokebeach.com/feed"
     RK9_EVENTS_URL = "https://rk9.gg/events/pokemon"
     CACHE_FILE = "news_cache.json"
+    # Small file of the user's event registrations, rewritten on each change
+    # instead of the whole news cache
+    REGISTRATIONS_FILE = "event_registrations.json"
     CACHE_DURATION_HOURS = 1
 
     def __init__(self, cache_dir: str = None):
         """Initialize news service."""
         self.cache_dir = cache_dir or os.path.dirname(os.path.abspath(__file__))
         self.cache_path = os.path.join(self.cache_dir, self.CACHE_FILE)
+        self.registrations_path = os.path.join(self.cache_dir, self.REGISTRATIONS_FILE)
         self._news_cache = []
         self._events_cache = []
+        # Same events keyed by id
+        self._events_by_id = {}
+        # event id -> {'is_registered': ..., 'deck_id': ...} set by the user
+        self._registrations = {}
         self._last_fetch = None
+        # _last_fetch as stored in the cache file, formatted once per fetch
+        self._last_fetch_iso = None
+        # HTTP validators of the cached feed, sent back for conditional GETs
+        self._feed_etag = None
+        self._feed_last_modified = None
         self._load_cache()
 
     def _load_cache(self):
         """Load cached data from file."""
         try:
             if os.path.exists(self.cache_path):
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._news_cache = [NewsArticle.from_dict(n) for n in data.get('news', [])]
-                    self._events_cache = [Tournament.from_dict(e) for e in data.get('events', [])]
-                    last_fetch_str = data.get('last_fetch')
-                    if last_fetch_str:
-                        self._last_fetch = datetime.fromisoformat(last_fetch_str)
+                with open(self.cache_path, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._news_cache = [NewsArticle.from_dict(n) for n in data.get('news', [])]
+                self._events_cache = [Tournament.from_dict(e) for e in data.get('events', [])]
+                last_fetch_str = data.get('last_fetch')
+                if last_fetch_str:
+                    self._last_fetch = datetime.fromisoformat(last_fetch_str)
+                    self._last_fetch_iso = last_fetch_str
+                self._feed_etag = data.get('feed_etag')
+                self._feed_last_modified = data.get('feed_last_modified')
         except (json.JSONDecodeError, IOError):
             pass
 
+        try:
+            with open(self.registrations_path, 'rb') as f:
+                raw = f.read()
+            self._registrations = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            # Caches written before the registrations file kept them in the events
+            self._registrations = {
+                e.id: {'is_registered': e.is_registered, 'deck_id': e.deck_id}
+                for e in self._events_cache if e.is_registered or e.deck_id is not None
+            }
+        except (json.JSONDecodeError, IOError):
+            pass
+        self._index_events()
+
+    def _index_events(self):
+        """Index the cached events by id and apply the user's registrations."""
+        self._events_by_id = {e.id: e for e in self._events_cache}
+        # The registrations file is authoritative; the copies saved with the
+        # events in the news cache may be stale
+        for event in self._events_cache:
+            registration = self._registrations.get(event.id)
+            if registration is not None:
+                event.is_registered = registration['is_registered']
+                event.deck_id = registration['deck_id']
+            else:
+                event.is_registered = False
+                event.deck_id = None
+
+    def _save_registrations(self):
+        """Save the user's event registrations."""
+        if orjson is not None:
+            content = orjson.dumps(self._registrations)
+        else:
+            content = json.dumps(self._registrations).encode('utf-8')
+        self._write_file(self.registrations_path, content)
+
     def _save_cache(self):
         """Save data to cache file."""
+        data = {
+            'last_fetch': self._last_fetch_iso,
+            'feed_etag': self._feed_etag,
+            'feed_last_modified': self._feed_last_modified
+        }
+        if orjson is not None:
+            # orjson serializes the dataclasses itself, without asdict copies
+            data['news'] = self._news_cache
+            data['events'] = self._events_cache
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            data['news'] = [n.to_dict() for n in self._news_cache]
+            data['events'] = [e.to_dict() for e in self._events_cache]
+            content = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        self._write_file(self.cache_path, content)
+
+    @staticmethod
+    def _write_file(path: str, content: bytes):
+        """Replace the file at path with content, never leaving it half written."""
+        tmp_path = path + '.tmp'
         try:
-            data = {
-                'news': [n.to_dict() for n in self._news_cache],
-                'events': [e.to_dict() for e in self._events_cache],
-                'last_fetch': self._last_fetch.isoformat() if self._last_fetch else None
-            }
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
         except IOError:
-            pass
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _mark_fetched(self):
+        """Record that the cached data was just fetched."""
+        self._last_fetch = datetime.now()
+        self._last_fetch_iso = self._last_fetch.isoformat()
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid."""
@@ -115,6 +228,10 @@ class NewsService:
         """
         Get news articles.
 
+        A forced refresh is a conditional GET: when the feed is unchanged
+        since the cached copy, the server answers 304 without a body and
+        the cached articles are returned.
+
         Args:
             force_refresh: Force fetching from network
             limit: Maximum number of articles to return
@@ -128,9 +245,14 @@ class NewsService:
         # Try to fetch from network
         try:
             articles = self._fetch_pokebeach_rss()
+            if articles is None:
+                # Not modified - the cached articles are current
+                self._mark_fetched()
+                self._save_cache()
+                return self._news_cache[:limit]
             if articles:
                 self._news_cache = articles
-                self._last_fetch = datetime.now()
+                self._mark_fetched()
                 self._save_cache()
                 return articles[:limit]
         except Exception:
@@ -139,57 +261,111 @@ class NewsService:
         # Return cached data if available
         return self._news_cache[:limit]
 
-    def _fetch_pokebeach_rss(self) -> list[NewsArticle]:
-        """Fetch news from PokeBeach RSS feed."""
+    def _fetch_pokebeach_rss(self) -> Optional[list[NewsArticle]]:
+        """
+        Fetch news from PokeBeach RSS feed.
+
+        Returns None when the server reports the cached feed as not modified.
+        """
         articles = []
 
+        headers = {'User-Agent': 'TCG Tool/1.0'}
+        # Validators are only useful while there is a cached copy to fall back on
+        if self._news_cache:
+            if self._feed_etag:
+                headers['If-None-Match'] = self._feed_etag
+            if self._feed_last_modified:
+                headers['If-Modified-Since'] = self._feed_last_modified
+
         try:
-            req = Request(
-                self.POKEBEACH_RSS,
-                headers={'User-Agent': 'TCG Tool/1.0'}
-            )
-            with urlopen(req, timeout=10) as response:
-                content = response.read().decode('utf-8')
-
-            root = ElementTree.fromstring(content)
-
-            # Parse RSS items
-            for item in root.findall('.//item'):
-                title = item.find('title')
-                link = item.find('link')
-                description = item.find('description')
-                pub_date = item.find('pubDate')
-                guid = item.find('guid')
-
-                # Extract image from description if present
-                image_url = ""
-                if description is not None and description.text:
-                    img_match = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', description.text)
-                    if img_match:
-                        image_url = img_match.group(1)
-
-                    # Clean description text
-                    desc_text = re.sub(r'<[^>]+>', '', description.text)
-                    desc_text = desc_text.strip()[:200]
-                else:
-                    desc_text = ""
-
-                article = NewsArticle(
-                    id=guid.text if guid is not None else link.text if link is not None else "",
-                    title=title.text if title is not None else "Untitled",
-                    summary=desc_text,
-                    url=link.text if link is not None else "",
-                    image_url=image_url,
-                    published_date=pub_date.text if pub_date is not None else "",
-                    source="PokeBeach"
-                )
-                articles.append(article)
-
-        except (URLError, ElementTree.ParseError):
+            try:
+                with self._open_url(self.POKEBEACH_RSS, headers) as response:
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+
+                    # Parse straight from the response, one item at a time, so
+                    # neither the whole body nor the whole tree is held at once.
+                    # Bytes are fed in, so the feed's declared encoding is honoured.
+                    for _, elem in ElementTree.iterparse(response, events=('end',)):
+                        if elem.tag == 'item':
+                            articles.append(self._article_from_item(elem))
+                            elem.clear()
+            except HTTPError as e:
+                if e.code == 304:
+                    return None
+                raise
+
+            # Only keep validators for a feed that is actually cached
+            if articles:
+                self._feed_etag = etag
+                self._feed_last_modified = last_modified
+
+        except URLError:
             pass
+        except XMLParseError:
+            # Items before the error are dropped rather than cached as the feed
+            articles = []
 
         return articles
 
+    @contextmanager
+    def _open_url(self, url: str, headers: dict):
+        """
+        Open url for streaming, over a pooled keep-alive connection when
+        urllib3 is available.
+
+        Failures are raised as URLError/HTTPError either way; error statuses,
+        including 304 Not Modified, raise HTTPError as urlopen does.
+        """
+        if _HTTP_POOL is None:
+            with urlopen(Request(url, headers=headers), timeout=10) as response:
+                yield response
+            return
+
+        try:
+            response = _HTTP_POOL.request('GET', url, headers=headers, preload_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            raise URLError(e) from e
+        try:
+            if response.status >= 300:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        finally:
+            # Finish reading the body so the connection can go back to the pool
+            response.drain_conn()
+            response.release_conn()
+
+    def _article_from_item(self, item) -> NewsArticle:
+        """Build a NewsArticle from an RSS <item> element."""
+        title = item.find('title')
+        link = item.find('link')
+        description = item.find('description')
+        pub_date = item.find('pubDate')
+        guid = item.find('guid')
+
+        # Extract image from description if present
+        image_url = ""
+        if description is not None and description.text:
+            img_match = IMG_SRC_RE.search(description.text)
+            if img_match:
+                image_url = img_match.group(1)
+
+            # Clean description text
+            desc_text = HTML_TAG_RE.sub('', description.text)
+            desc_text = desc_text.strip()[:200]
+        else:
+            desc_text = ""
+
+        return NewsArticle(
+            id=guid.text if guid is not None else link.text if link is not None else "",
+            title=title.text if title is not None else "Untitled",
+            summary=desc_text,
+            url=link.text if link is not None else "",
+            image_url=image_url,
+            published_date=pub_date.text if pub_date is not None else "",
+            source="PokeBeach"
+        )
+
     def get_events(self, force_refresh: bool = False, limit: int = 10) -> list[Tournament]:
         """
         Get upcoming tournaments.
@@ -208,7 +384,8 @@ class NewsService:
         # In a real implementation, this would scrape RK9 or use their API
         sample_events = self._get_sample_events()
         self._events_cache = sample_events
-        self._last_fetch = datetime.now()
+        self._index_events()
+        self._mark_fetched()
         self._save_cache()
 
         return sample_events[:limit]
@@ -280,20 +457,30 @@ class NewsService:
 
     def register_for_event(self, event_id: str, deck_id: Optional[int] = None) -> bool:
         """Mark an event as registered."""
-        for event in self._events_cache:
-            if event.id == event_id:
-                event.is_registered = True
-                event.deck_id = deck_id
-                self._save_cache()
-                return True
-        return False
+        return self._update_registration(event_id, True, deck_id)
 
     def unregister_from_event(self, event_id: str) -> bool:
         """Unmark an event as registered."""
-        for event in self._events_cache:
-            if event.id == event_id:
-                event.is_registered = False
-                event.deck_id = None
-                self._save_cache()
-                return True
-        return False
+        return self._update_registration(event_id, False, None)
+
+    def set_event_deck(self, event_id: str, deck_id: Optional[int]) -> bool:
+        """Set the deck the user plans to play at an event."""
+        event = self._events_by_id.get(event_id)
+        if event is None:
+            return False
+        return self._update_registration(event_id, event.is_registered, deck_id)
+
+    def _update_registration(self, event_id: str, is_registered: bool,
+                             deck_id: Optional[int]) -> bool:
+        """Apply a registration change to the event and persist it."""
+        event = self._events_by_id.get(event_id)
+        if event is None:
+            return False
+        event.is_registered = is_registered
+        event.deck_id = deck_id
+        if is_registered or deck_id is not None:
+            self._registrations[event_id] = {'is_registered': is_registered, 'deck_id': deck_id}
+        else:
+            self._registrations.pop(event_id, None)
+        self._save_registrations()
+        return True
@@ -0,0 +1,114 @@
+"""
+Thumbnail Cache Service - Disk cache for downscaled remote images.
+
+Features:
+- Files keyed by SHA1 of the image URL
+- Downscaling with Pillow when it is available
+- Background fetching with a small worker pool
+- Cancellation of queued fetches that are no longer needed
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+from urllib.request import urlopen, Request
+from urllib.error import URLError
+
+try:
+    from PIL import Image
+except ImportError:
+    # Without Pillow thumbnails are cached at their original size
+    Image = None
+
+
+class ThumbnailCache:
+    """Disk cache of small versions of remote images."""
+
+    CACHE_DIR = "thumbnails"
+    DEFAULT_MAX_PX = 160
+    MAX_WORKERS = 2
+
+    def __init__(self, cache_dir: str = None):
+        """Initialize thumbnail cache."""
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), self.CACHE_DIR
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._executor = None
+        # Fetches submitted to the executor that have not finished yet
+        self._pending = set()
+
+    def path_for(self, url: str) -> str:
+        """Get the cache file path for url."""
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        if Image is not None:
+            ext = '.jpg'
+        else:
+            # Kivy picks its image loader by extension, so keep the original one
+            ext = os.path.splitext(url.split('?', 1)[0])[1].lower() or '.jpg'
+        return os.path.join(self.cache_dir, digest + ext)
+
+    def get_cached(self, url: str) -> Optional[str]:
+        """Get the local path for url if it is already cached."""
+        path = self.path_for(url)
+        return path if os.path.exists(path) else None
+
+    def fetch(self, url: str, max_px: int = DEFAULT_MAX_PX) -> Optional[str]:
+        """
+        Download url, downscale it to fit max_px and store it on disk.
+
+        Blocking - call from a worker thread.
+
+        Returns:
+            Local path of the thumbnail, or None if the download failed
+        """
+        path = self.get_cached(url)
+        if path:
+            return path
+
+        try:
+            req = Request(url, headers={'User-Agent': 'TCG Tool/1.0'})
+            with urlopen(req, timeout=10) as response:
+                data = response.read()
+        except (URLError, ValueError, OSError):
+            return None
+
+        path = self.path_for(url)
+        tmp_path = path + '.tmp'
+        try:
+            if Image is not None:
+                with Image.open(io.BytesIO(data)) as img:
+                    img.thumbnail((max_px, max_px))
+                    img.convert('RGB').save(tmp_path, 'JPEG', quality=85)
+            else:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+        return path
+
+    def fetch_async(self, url: str, callback: Callable[[Optional[str]], None],
+                    max_px: int = DEFAULT_MAX_PX) -> Future:
+        """
+        Fetch url in the background and pass the local path to callback.
+
+        The callback runs on a worker thread; UI code should hop back to
+        the main thread (e.g. with Clock.schedule_once) before touching widgets.
+        It is not called if the fetch is cancelled before it starts.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        future = self._executor.submit(lambda: callback(self.fetch(url, max_px)))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def cancel_pending(self):
+        """Cancel queued fetches; downloads already running are left to finish."""
+        for future in list(self._pending):
+            future.cancel()
@@ -11,10 +11,18 @@ This module handles:
 import sqlite3
 import json
 import os
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+
+try:
+    import orjson
+except ImportError:
+    # Without orjson deck cards are encoded with the stdlib json module
+    orjson = None
 
 
 # Database path - use app-specific directory on Android
@@ -32,7 +40,7 @@ def get_db_path() -> Path:
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UserCard:
     """Represents a card in a user's deck."""
     name: str
@@ -44,9 +52,21 @@ class UserCard:
     subtype: str = ""  # supporter, item, stadium, tool
     regulation_mark: str = ""
     image_url: str = ""
+    # Lowercased name, computed once for case-insensitive comparisons
+    name_lower: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in _USER_CARD_FIELDS}
+
+
+# Stored fields of UserCard; name_lower is derived, so it is left out
+_USER_CARD_FIELDS = tuple(f.name for f in fields(UserCard) if f.init)
+
+
+@dataclass(slots=True)
 class UserDeck:
     """Represents a user's saved deck."""
     id: int = 0
@@ -79,21 +99,26 @@ class UserDeck:
         """Validate deck and return (is_valid, list of issues)."""
         issues = []
 
+        # Total and per-name copies in one pass over the cards
+        total = 0
+        copies = Counter()
+        display_names = {}
+        for card in self.cards:
+            total += card.quantity
+            # Skip basic energy
+            key = card.name_lower
+            if "basic" in key and "energy" in key:
+                continue
+            copies[key] += card.quantity
+            display_names.setdefault(key, card.name)
+
         # Check total cards
-        total = self.total_cards
         if total != 60:
             issues.append(f"Deck has {total}/60 cards")
 
         # Check 4-copy rule
-        card_counts = {}
-        for card in self.cards:
-            # Skip basic energy
-            if "basic" in card.name.lower() and "energy" in card.name.lower():
-                continue
-            key = card.name.lower()
-            card_counts[key] = card_counts.get(key, 0) + card.quantity
-            if card_counts[key] > 4:
-                issues.append(f"More than 4 copies of {card.name}")
+        issues.extend(f"More than 4 copies of {display_names[key]}"
+                      for key, count in copies.items() if count > 4)
 
         return len(issues) == 0, issues
 
@@ -127,70 +152,84 @@ class UserDatabase:
 
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or get_db_path()
+        # One connection for the lifetime of the instance; screens call in
+        # from worker threads, so every use of it holds the lock
+        self._lock = threading.Lock()
+        self._conn = self._get_connection()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+        """Open and configure the database connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=67108864")
         return conn
 
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self):
         """Initialize database tables."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # User decks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_decks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                cards TEXT NOT NULL,
-                is_active INTEGER DEFAULT 0,
-                is_complete INTEGER DEFAULT 0,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                notes TEXT DEFAULT '',
-                archetype TEXT DEFAULT ''
-            )
-        """)
-
-        # Competitions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS competitions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                event_format TEXT DEFAULT 'Standard',
-                date TEXT NOT NULL,
-                time TEXT DEFAULT '',
-                location TEXT DEFAULT '',
-                deck_id INTEGER DEFAULT 0,
-                wins INTEGER DEFAULT 0,
-                losses INTEGER DEFAULT 0,
-                draws INTEGER DEFAULT 0,
-                placement INTEGER DEFAULT 0,
-                notes TEXT DEFAULT '',
-                rounds TEXT DEFAULT '[]',
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (deck_id) REFERENCES user_decks(id)
-            )
-        """)
-
-        # User settings table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-        """)
-
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_active ON user_decks(is_active)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_competitions_date ON competitions(date)")
-
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+
+            # User decks table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_decks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    cards TEXT NOT NULL,
+                    is_active INTEGER DEFAULT 0,
+                    is_complete INTEGER DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    notes TEXT DEFAULT '',
+                    archetype TEXT DEFAULT ''
+                )
+            """)
+
+            # Competitions table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS competitions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    event_format TEXT DEFAULT 'Standard',
+                    date TEXT NOT NULL,
+                    time TEXT DEFAULT '',
+                    location TEXT DEFAULT '',
+                    deck_id INTEGER DEFAULT 0,
+                    wins INTEGER DEFAULT 0,
+                    losses INTEGER DEFAULT 0,
+                    draws INTEGER DEFAULT 0,
+                    placement INTEGER DEFAULT 0,
+                    notes TEXT DEFAULT '',
+                    rounds TEXT DEFAULT '[]',
+                    created_at TEXT NOT NULL,
+                    FOREIGN KEY (deck_id) REFERENCES user_decks(id)
+                )
+            """)
+
+            # User settings table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+
+            # Create indexes
+            # At most one deck is active, so a partial index holds a single row
+            cursor.execute("DROP INDEX IF EXISTS idx_decks_active")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_active_only ON user_decks(is_active) WHERE is_active = 1")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_competitions_date ON competitions(date)")
+            # Per-deck grouping in get_player_stats
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_competitions_deck ON competitions(deck_id, date)")
 
     # -------------------------------------------------------------------------
     # DECK OPERATIONS
@@ -198,44 +237,58 @@ class UserDatabase:
 
     def save_deck(self, deck: UserDeck) -> int:
         """Save or update a deck. Returns deck ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        now = datetime.now().isoformat()
-        cards_json = json.dumps([asdict(c) for c in deck.cards])
-        deck.is_complete = deck.total_cards == 60
-
-        if deck.id > 0:
-            # Update existing
-            cursor.execute("""
-                UPDATE user_decks
-                SET name = ?, cards = ?, is_complete = ?, updated_at = ?,
-                    notes = ?, archetype = ?
-                WHERE id = ?
-            """, (deck.name, cards_json, deck.is_complete, now,
-                  deck.notes, deck.archetype, deck.id))
-            deck_id = deck.id
-        else:
-            # Insert new
-            cursor.execute("""
-                INSERT INTO user_decks (name, cards, is_active, is_complete,
-                                        created_at, updated_at, notes, archetype)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (deck.name, cards_json, 0, deck.is_complete,
-                  now, now, deck.notes, deck.archetype))
-            deck_id = cursor.lastrowid
-
-        conn.commit()
-        conn.close()
-        return deck_id
+        return self.save_decks([deck])[0]
+
+    def save_decks(self, decks: list[UserDeck]) -> list[int]:
+        """
+        Save or update several decks in a single transaction.
+
+        Returns:
+            The deck IDs, in the same order as decks
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+
+            now = datetime.now().isoformat()
+            deck_ids = []
+            updates = []
+
+            for deck in decks:
+                cards = [c.to_dict() for c in deck.cards]
+                # The column is TEXT, so orjson's UTF-8 bytes are decoded before binding
+                cards_json = orjson.dumps(cards).decode('utf-8') if orjson is not None else json.dumps(cards)
+                deck.is_complete = deck.total_cards == 60
+
+                if deck.id > 0:
+                    updates.append((deck.name, cards_json, deck.is_complete, now,
+                                    deck.notes, deck.archetype, deck.id))
+                    deck_ids.append(deck.id)
+                else:
+                    # Inserted one at a time, since each new row's ID is needed
+                    cursor.execute("""
+                        INSERT INTO user_decks (name, cards, is_active, is_complete,
+                                                created_at, updated_at, notes, archetype)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (deck.name, cards_json, 0, deck.is_complete,
+                          now, now, deck.notes, deck.archetype))
+                    deck_ids.append(cursor.lastrowid)
+
+            if updates:
+                cursor.executemany("""
+                    UPDATE user_decks
+                    SET name = ?, cards = ?, is_complete = ?, updated_at = ?,
+                        notes = ?, archetype = ?
+                    WHERE id = ?
+                """, updates)
+
+        return deck_ids
 
     def get_deck(self, deck_id: int) -> Optional[UserDeck]:
         """Get a deck by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM user_decks WHERE id = ?", (deck_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT * FROM user_decks WHERE id = ?", (deck_id,))
+            row = cursor.fetchone()
 
         if not row:
             return None
@@ -244,21 +297,19 @@ class UserDatabase:
 
     def get_all_decks(self) -> list[UserDeck]:
         """Get all user decks."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM user_decks ORDER BY updated_at DESC")
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT * FROM user_decks ORDER BY updated_at DESC")
+            rows = cursor.fetchall()
 
         return [self._row_to_deck(row) for row in rows]
 
     def get_active_deck(self) -> Optional[UserDeck]:
         """Get the currently active deck."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM user_decks WHERE is_active = 1 LIMIT 1")
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT * FROM user_decks WHERE is_active = 1 LIMIT 1")
+            row = cursor.fetchone()
 
         if not row:
             return None
@@ -267,32 +318,28 @@ class UserDatabase:
 
     def set_active_deck(self, deck_id: int) -> bool:
         """Set a deck as active (only one can be active)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        # Clear previous active
-        cursor.execute("UPDATE user_decks SET is_active = 0")
-        # Set new active
-        cursor.execute("UPDATE user_decks SET is_active = 1 WHERE id = ?", (deck_id,))
+            # Clear previous active
+            cursor.execute("UPDATE user_decks SET is_active = 0")
+            # Set new active
+            cursor.execute("UPDATE user_decks SET is_active = 1 WHERE id = ?", (deck_id,))
 
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
+            success = cursor.rowcount > 0
         return success
 
     def delete_deck(self, deck_id: int) -> bool:
         """Delete a deck."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM user_decks WHERE id = ?", (deck_id,))
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("DELETE FROM user_decks WHERE id = ?", (deck_id,))
+            success = cursor.rowcount > 0
         return success
 
     def _row_to_deck(self, row: sqlite3.Row) -> UserDeck:
         """Convert database row to UserDeck object."""
-        cards_data = json.loads(row['cards'])
+        cards_data = orjson.loads(row['cards']) if orjson is not None else json.loads(row['cards'])
         cards = [UserCard(**c) for c in cards_data]
 
         return UserDeck(
@@ -313,64 +360,74 @@ class UserDatabase:
 
     def save_competition(self, comp: Competition) -> int:
         """Save or update a competition."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        now = datetime.now().isoformat()
-
-        if comp.id > 0:
-            cursor.execute("""
-                UPDATE competitions
-                SET name = ?, event_type = ?, event_format = ?, date = ?,
-                    time = ?, location = ?, deck_id = ?, wins = ?, losses = ?,
-                    draws = ?, placement = ?, notes = ?, rounds = ?
-                WHERE id = ?
-            """, (comp.name, comp.event_type, comp.event_format, comp.date,
-                  comp.time, comp.location, comp.deck_id, comp.wins, comp.losses,
-                  comp.draws, comp.placement, comp.notes, comp.rounds, comp.id))
-            comp_id = comp.id
-        else:
-            cursor.execute("""
-                INSERT INTO competitions (name, event_type, event_format, date,
-                    time, location, deck_id, wins, losses, draws, placement,
-                    notes, rounds, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (comp.name, comp.event_type, comp.event_format, comp.date,
-                  comp.time, comp.location, comp.deck_id, comp.wins, comp.losses,
-                  comp.draws, comp.placement, comp.notes, comp.rounds, now))
-            comp_id = cursor.lastrowid
-
-        conn.commit()
-        conn.close()
-        return comp_id
+        return self.save_competitions([comp])[0]
+
+    def save_competitions(self, comps: list[Competition]) -> list[int]:
+        """
+        Save or update several competitions in a single transaction.
+
+        Returns:
+            The competition IDs, in the same order as comps
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+
+            now = datetime.now().isoformat()
+            comp_ids = []
+            updates = []
+
+            for comp in comps:
+                values = (comp.name, comp.event_type, comp.event_format, comp.date,
+                          comp.time, comp.location, comp.deck_id, comp.wins, comp.losses,
+                          comp.draws, comp.placement, comp.notes, comp.rounds)
+                if comp.id > 0:
+                    updates.append(values + (comp.id,))
+                    comp_ids.append(comp.id)
+                else:
+                    # Inserted one at a time, since each new row's ID is needed
+                    cursor.execute("""
+                        INSERT INTO competitions (name, event_type, event_format, date,
+                            time, location, deck_id, wins, losses, draws, placement,
+                            notes, rounds, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, values + (now,))
+                    comp_ids.append(cursor.lastrowid)
+
+            if updates:
+                cursor.executemany("""
+                    UPDATE competitions
+                    SET name = ?, event_type = ?, event_format = ?, date = ?,
+                        time = ?, location = ?, deck_id = ?, wins = ?, losses = ?,
+                        draws = ?, placement = ?, notes = ?, rounds = ?
+                    WHERE id = ?
+                """, updates)
+
+        return comp_ids
 
     def get_competitions(self, upcoming_only: bool = False) -> list[Competition]:
         """Get all competitions, optionally filtered to upcoming only."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
 
-        if upcoming_only:
-            today = datetime.now().strftime("%Y-%m-%d")
-            cursor.execute(
-                "SELECT * FROM competitions WHERE date >= ? ORDER BY date ASC",
-                (today,)
-            )
-        else:
-            cursor.execute("SELECT * FROM competitions ORDER BY date DESC")
+            if upcoming_only:
+                today = datetime.now().strftime("%Y-%m-%d")
+                cursor.execute(
+                    "SELECT * FROM competitions WHERE date >= ? ORDER BY date ASC",
+                    (today,)
+                )
+            else:
+                cursor.execute("SELECT * FROM competitions ORDER BY date DESC")
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [self._row_to_competition(row) for row in rows]
 
     def delete_competition(self, comp_id: int) -> bool:
         """Delete a competition."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM competitions WHERE id = ?", (comp_id,))
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("DELETE FROM competitions WHERE id = ?", (comp_id,))
+            success = cursor.rowcount > 0
         return success
 
     def _row_to_competition(self, row: sqlite3.Row) -> Competition:
@@ -399,9 +456,27 @@ class UserDatabase:
 
     def get_player_stats(self) -> dict:
         """Calculate player statistics."""
-        comps = self.get_competitions()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            # Best placement ignores 0, which means no placement recorded
+            cursor.execute("""
+                SELECT COUNT(*), SUM(wins), SUM(losses), SUM(draws),
+                       MIN(CASE WHEN placement > 0 THEN placement END)
+                FROM competitions
+            """)
+            total_events, total_wins, total_losses, total_draws, best_placement = cursor.fetchone()
 
-        if not comps:
+            # Ties go to the deck played most recently
+            cursor.execute("""
+                SELECT deck_id FROM competitions
+                WHERE deck_id > 0
+                GROUP BY deck_id
+                ORDER BY COUNT(*) DESC, MAX(date) DESC
+                LIMIT 1
+            """)
+            most_played = cursor.fetchone()
+
+        if not total_events:
             return {
                 'total_events': 0,
                 'total_wins': 0,
@@ -412,33 +487,17 @@ class UserDatabase:
                 'most_played_deck': None
             }
 
-        total_wins = sum(c.wins for c in comps)
-        total_losses = sum(c.losses for c in comps)
-        total_draws = sum(c.draws for c in comps)
         total_games = total_wins + total_losses + total_draws
-
         win_rate = (total_wins / total_games * 100) if total_games > 0 else 0.0
 
-        # Best placement (lower is better, 0 means no placement recorded)
-        placements = [c.placement for c in comps if c.placement > 0]
-        best_placement = min(placements) if placements else 0
-
-        # Most played deck
-        deck_counts = {}
-        for c in comps:
-            if c.deck_id > 0:
-                deck_counts[c.deck_id] = deck_counts.get(c.deck_id, 0) + 1
-
-        most_played_deck_id = max(deck_counts, key=deck_counts.get) if deck_counts else None
-
         return {
-            'total_events': len(comps),
+            'total_events': total_events,
             'total_wins': total_wins,
             'total_losses': total_losses,
             'total_draws': total_draws,
             'win_rate': win_rate,
-            'best_placement': best_placement,
-            'most_played_deck_id': most_played_deck_id
+            'best_placement': best_placement or 0,
+            'most_played_deck_id': most_played[0] if most_played else None
         }
 
     # -------------------------------------------------------------------------
@@ -447,19 +506,28 @@ class UserDatabase:
 
     def get_setting(self, key: str, default: str = "") -> str:
         """Get a user setting."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM user_settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT value FROM user_settings WHERE key = ?", (key,))
+            row = cursor.fetchone()
         return row['value'] if row else default
 
     def set_setting(self, key: str, value: str):
         """Set a user setting."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO user_settings (key, value) VALUES (?, ?)
-        """, (key, value))
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO user_settings (key, value) VALUES (?, ?)
+            """, (key, value))
+
+
+# Singleton instance shared by all screens
+_user_database = None
+
+
+def get_user_database() -> UserDatabase:
+    """Get the singleton UserDatabase instance."""
+    global _user_database
+    if _user_database is None:
+        _user_database = UserDatabase()
+    return _user_database
@@ -7,11 +7,12 @@ Tests deck parsing, validation, and import functionality.
 import unittest
 import sys
 import os
+import tempfile
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.deck_import import DeckImportService, ValidationSeverity
+from services.deck_import import DeckImportService, ValidationSeverity, classify_card
 
 
 class TestDeckImportService(unittest.TestCase):
@@ -116,6 +117,16 @@ class TestDeckImportService(unittest.TestCase):
         # Should still create deck but with issues
         self.assertTrue(len(result.issues) > 0)
 
+    def test_unparsed_line_excerpt(self):
+        """Test that only lines cut short in the warning end with '...'."""
+        short_line = "This is not a valid card line"
+        long_line = "x" * 60
+        result = self.service.import_from_text(f"{short_line}\n{long_line}")
+
+        messages = [issue.message_en for issue in result.issues]
+        self.assertIn(f"Could not parse line 1: {short_line}", messages)
+        self.assertIn(f"Could not parse line 2: {'x' * 50}...", messages)
+
     # =========================================================================
     # VALIDATION TESTS
     # =========================================================================
@@ -190,6 +201,22 @@ class TestDeckImportService(unittest.TestCase):
     # DECK NAME SUGGESTION TESTS
     # =========================================================================
 
+    def test_import_file_with_many_decks(self):
+        """Test that a file with many decks keeps deck order."""
+        decks = [f"{i} Charizard ex OBF 125" for i in range(1, 7)]
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write("\n---\n".join(decks))
+        self.addCleanup(os.remove, path)
+
+        result = self.service.import_from_file(path)
+
+        self.assertEqual(result.total_found, 6)
+        self.assertEqual([r.deck.name for r in result.results],
+                         [f"Deck {i}" for i in range(1, 7)])
+        self.assertEqual([r.deck.cards[0].quantity for r in result.results],
+                         list(range(1, 7)))
+
     def test_suggest_deck_name_charizard(self):
         """Test deck name suggestion for Charizard deck."""
         text = """4 Charizard ex OBF 125
@@ -255,6 +282,31 @@ class TestCardTypeDetection(unittest.TestCase):
         self.assertEqual(card.card_type, "trainer")
         self.assertEqual(card.subtype, "supporter")
 
+    def test_classify_card_nested_keywords(self):
+        """Test that a keyword nested in a longer one is still classified."""
+        # "choice belt" is a tool keyword and contains the trainer keyword "choice"
+        self.assertEqual(classify_card("choice belt"), {"trainer", "tool"})
+        self.assertEqual(classify_card("charizard ex"), set())
+
+    def test_classify_card_single_word_keywords(self):
+        """Test that single-word keywords only match whole words."""
+        self.assertEqual(classify_card("n"), {"trainer", "supporter"})
+        self.assertEqual(classify_card("boss's orders"), {"trainer", "supporter"})
+        # "n" and "eri" inside a Pokemon name are not supporter hits
+        self.assertEqual(classify_card("giratina vstar"), set())
+        self.assertEqual(classify_card("serperior"), set())
+
+    def test_tools_and_stadiums_are_trainers(self):
+        """Test that tool and stadium cards are typed as trainers."""
+        text = """2 Defiance Band SVI 169
+        1 Heavy Baton TEF 151
+        2 Magma Basin BRS 144"""
+        result = self.service.import_from_text(text)
+        types = {c.name: (c.card_type, c.subtype) for c in result.deck.cards}
+        self.assertEqual(types["Defiance Band"], ("trainer", "tool"))
+        self.assertEqual(types["Heavy Baton"], ("trainer", "tool"))
+        self.assertEqual(types["Magma Basin"], ("trainer", "stadium"))
+
     def test_detect_basic_energy(self):
         """Test detection of Basic Energy."""
         text = "10 Basic Fire Energy SVE 2"
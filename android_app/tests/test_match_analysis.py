@@ -5,10 +5,12 @@ Tests video URL processing, transcription parsing, and insights generation.
 """
 
 import unittest
+import json
 import sys
 import os
 import tempfile
 import shutil
+from unittest import mock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -104,6 +106,13 @@ class TestMatchAnalysisService(unittest.TestCase):
         cards_lower = [c.lower() for c in result.cards_identified]
         self.assertTrue(any('charizard' in c for c in cards_lower))
 
+    def test_identify_cards_contained_in_longer_match(self):
+        """Test that a name inside another pattern's match is still found."""
+        cards = self.service._identify_cards("Then Gardevoir ex attacked.")
+
+        self.assertIn("Then Gardevoir", cards)
+        self.assertIn("Gardevoir", cards)
+
     def test_identify_trainer_cards(self):
         """Test identification of Trainer cards in text."""
         text = """I played Professor's Research and drew 7 cards.
@@ -141,6 +150,14 @@ class TestMatchAnalysisService(unittest.TestCase):
         # total_turns is based on actions detected with turn info
         self.assertGreaterEqual(len(result.actions), 0)
 
+    def test_parse_actions_late_in_long_line(self):
+        """Test that actions far into a single-line transcript are found."""
+        text = "turn 1 i attach an energy " + "and then " * 60 + "the opponent knocks out pikachu"
+
+        actions = self.service._parse_play_sequence(text)
+
+        self.assertEqual([a.action_type for a in actions], ['attach_energy', 'knock_out'])
+
     def test_detect_deck_archetype_charizard(self):
         """Test deck archetype detection for Charizard."""
         text = """Charizard ex used Burning Darkness.
@@ -238,6 +255,69 @@ class TestMatchAnalysisService(unittest.TestCase):
         # Most recent should be first
         self.assertEqual(matches[0].title, "Transcribed Match")  # Default title
 
+    def test_get_recent_matches(self):
+        """Test that recent matches are limited and match the sorted order."""
+        for i in range(4):
+            self.service.process_transcription(f"Match {i}", title=f"Match {i}")
+
+        recent = self.service.get_recent_matches(2)
+
+        self.assertEqual(len(recent), 2)
+        self.assertEqual(recent, self.service.get_all_matches()[:2])
+
+    def test_matches_persist_across_instances(self):
+        """Test that appended and deleted matches are reloaded from disk."""
+        kept = self.service.process_transcription("Kept match", title="Kept")
+        deleted = self.service.process_transcription("Deleted match", title="Deleted")
+        self.service.delete_match(deleted.id)
+        self.service.process_transcription("Added after delete", title="Added")
+
+        reloaded = MatchAnalysisService(cache_dir=self.test_dir)
+
+        self.assertEqual(
+            [m.title for m in reloaded._matches],
+            ["Kept", "Added"]
+        )
+        self.assertEqual(reloaded.get_match(kept.id).cards_identified, kept.cards_identified)
+
+    def test_append_after_torn_line(self):
+        """Test that a match appended after a torn last line still loads."""
+        self.service.process_transcription("Before crash", title="Before")
+        with open(self.service.cache_path, 'ab') as f:
+            f.write(b'{"id": "torn", "tit')
+        self.service.process_transcription("After crash", title="After")
+
+        reloaded = MatchAnalysisService(cache_dir=self.test_dir)
+
+        self.assertEqual([m.title for m in reloaded._matches], ["Before", "After"])
+
+    def test_legacy_cache_is_migrated(self):
+        """Test that the old single-document JSON cache is converted."""
+        legacy = MatchData(id="old_1", title="Old Match", source=MatchSource.TRANSCRIPTION)
+        legacy_path = os.path.join(self.test_dir, MatchAnalysisService.LEGACY_CACHE_FILE)
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump({'matches': [legacy.to_dict()]}, f)
+
+        service = MatchAnalysisService(cache_dir=self.test_dir)
+
+        self.assertEqual(service.get_match("old_1").title, "Old Match")
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertTrue(os.path.exists(service.cache_path))
+
+    def test_legacy_cache_kept_when_migration_fails(self):
+        """Test that the old cache survives a failed write of the new one."""
+        legacy = MatchData(id="old_1", title="Old Match", source=MatchSource.TRANSCRIPTION)
+        legacy_path = os.path.join(self.test_dir, MatchAnalysisService.LEGACY_CACHE_FILE)
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump({'matches': [legacy.to_dict()]}, f)
+
+        with mock.patch('services.match_analysis.os.replace', side_effect=OSError):
+            service = MatchAnalysisService(cache_dir=self.test_dir)
+
+        self.assertEqual(service.get_match("old_1").title, "Old Match")
+        self.assertTrue(os.path.exists(legacy_path))
+        self.assertFalse(os.path.exists(service.cache_path + '.tmp'))
+
 
 class TestPlayAction(unittest.TestCase):
     """Test cases for PlayAction dataclass."""
@@ -288,6 +368,21 @@ class TestMatchData(unittest.TestCase):
         self.assertEqual(data['source'], "youtube")
         self.assertEqual(data['status'], "completed")
 
+    def test_match_data_to_dict_round_trip(self):
+        """Test that every field, including actions, survives serialization."""
+        match = MatchData(
+            id="test_123",
+            title="Test Match",
+            source=MatchSource.TRANSCRIPTION,
+            actions=[PlayAction(turn=2, player="player2", action_type="attack")],
+            cards_identified=["Charizard ex"],
+            status=ProcessingStatus.COMPLETED
+        )
+
+        restored = MatchData.from_dict(match.to_dict())
+
+        self.assertEqual(restored, match)
+
     def test_match_data_from_dict(self):
         """Test MatchData deserialization."""
         data = {
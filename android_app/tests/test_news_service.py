@@ -0,0 +1,167 @@
+"""
+Tests for NewsService
+
+Tests conditional fetching of the news feed.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+from unittest import mock
+from urllib.error import HTTPError
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import news_service
+from services.news_service import NewsService, NewsArticle
+
+
+SAMPLE_FEED = b"""<?xml version="1.0"?>
+<rss><channel>
+<item><title>New set revealed</title><link>https://example.com/a</link>
+<guid>a</guid><description>Details</description></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    """Minimal stand-in for the object returned by urlopen."""
+
+    def __init__(self, body, headers):
+        self._body = body
+        self.headers = headers
+
+    def read(self, size=-1):
+        # Serves the body in chunks, like a socket-backed response
+        if size is None or size < 0:
+            size = len(self._body)
+        chunk, self._body = self._body[:size], self._body[size:]
+        return chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class TestNewsService(unittest.TestCase):
+    """Test cases for NewsService."""
+
+    def setUp(self):
+        """Set up test fixtures with a temporary cache directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.service = NewsService(cache_dir=self.test_dir)
+        # Requests go through urlopen, which the tests replace
+        patcher = mock.patch.object(news_service, '_HTTP_POOL', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_fetch_stores_validators(self):
+        """Test that a full fetch keeps the feed's ETag and Last-Modified."""
+        response = FakeResponse(SAMPLE_FEED, {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jun 2026 00:00:00 GMT'})
+        with mock.patch('services.news_service.urlopen', return_value=response):
+            articles = self.service.get_news(force_refresh=True)
+
+        self.assertEqual(len(articles), 1)
+        self.assertEqual(self.service._feed_etag, '"v1"')
+
+        # Validators survive a reload from the cache file
+        reloaded = NewsService(cache_dir=self.test_dir)
+        self.assertEqual(reloaded._feed_etag, '"v1"')
+        self.assertEqual(reloaded._feed_last_modified, 'Mon, 01 Jun 2026 00:00:00 GMT')
+
+    def test_truncated_feed_keeps_cache(self):
+        """Test that items parsed before a feed error are not cached."""
+        self.service._news_cache = [NewsArticle(id='cached', title='Cached')]
+        truncated = SAMPLE_FEED.replace(b'</channel></rss>', b'<item><title>Cut')
+        response = FakeResponse(truncated, {'ETag': '"v2"'})
+
+        with mock.patch('services.news_service.urlopen', return_value=response):
+            articles = self.service.get_news(force_refresh=True)
+
+        self.assertEqual([a.id for a in articles], ['cached'])
+        self.assertIsNone(self.service._feed_etag)
+
+    def test_not_modified_returns_cache(self):
+        """Test that a 304 answer keeps the cached articles."""
+        self.service._news_cache = [NewsArticle(id='cached', title='Cached')]
+        self.service._feed_etag = '"v1"'
+        not_modified = HTTPError(NewsService.POKEBEACH_RSS, 304, 'Not Modified', {}, None)
+
+        with mock.patch('services.news_service.urlopen', side_effect=not_modified) as urlopen:
+            articles = self.service.get_news(force_refresh=True)
+
+        request = urlopen.call_args[0][0]
+        self.assertEqual(request.get_header('If-none-match'), '"v1"')
+        self.assertEqual([a.id for a in articles], ['cached'])
+
+    def test_no_validators_without_cache(self):
+        """Test that an empty cache always requests the full feed."""
+        self.service._feed_etag = '"v1"'
+        response = FakeResponse(SAMPLE_FEED, {})
+
+        with mock.patch('services.news_service.urlopen', return_value=response) as urlopen:
+            self.service.get_news(force_refresh=True)
+
+        request = urlopen.call_args[0][0]
+        self.assertIsNone(request.get_header('If-none-match'))
+
+
+class TestEventRegistrations(unittest.TestCase):
+    """Test cases for event registrations."""
+
+    def setUp(self):
+        """Set up a service with events in a temporary cache directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.service = NewsService(cache_dir=self.test_dir)
+        self.service.get_events()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_registration_persists(self):
+        """Test that a registration is restored by a new service."""
+        self.assertTrue(self.service.register_for_event("worlds2026", deck_id=3))
+
+        reloaded = NewsService(cache_dir=self.test_dir)
+        registered = reloaded.get_registered_events()
+
+        self.assertEqual([e.id for e in registered], ["worlds2026"])
+        self.assertEqual(registered[0].deck_id, 3)
+
+    def test_registration_survives_refresh(self):
+        """Test that refreshing the events keeps registrations."""
+        self.service.register_for_event("euic2026")
+        self.service.unregister_from_event("euic2026")
+        self.service.register_for_event("naic2026")
+
+        events = self.service.get_events(force_refresh=True)
+
+        self.assertEqual([e.id for e in events if e.is_registered], ["naic2026"])
+
+    def test_unregistration_survives_cache_save(self):
+        """Test that a stale registration in the news cache is not restored."""
+        self.service.register_for_event("worlds2026", deck_id=3)
+        self.service._save_cache()
+        self.service.unregister_from_event("worlds2026")
+
+        reloaded = NewsService(cache_dir=self.test_dir)
+
+        self.assertEqual(reloaded.get_registered_events(), [])
+        self.assertIsNone(reloaded._events_by_id["worlds2026"].deck_id)
+
+    def test_register_unknown_event(self):
+        """Test registering for an event that is not cached."""
+        self.assertFalse(self.service.register_for_event("missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
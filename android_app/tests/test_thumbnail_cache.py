@@ -0,0 +1,101 @@
+"""
+Tests for ThumbnailCache
+
+Tests cache keys, storing fetched thumbnails on disk and cancelling fetches.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+import threading
+from unittest import mock
+from urllib.error import URLError
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.thumbnail_cache import ThumbnailCache
+
+
+class FakeResponse:
+    """Minimal stand-in for the object returned by urlopen."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Test cases for ThumbnailCache."""
+
+    def setUp(self):
+        """Set up test fixtures with a temporary cache directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = ThumbnailCache(cache_dir=self.test_dir)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_path_is_stable_per_url(self):
+        """Test that each URL maps to one file inside the cache directory."""
+        url = "https://example.com/image.png"
+
+        path = self.cache.path_for(url)
+
+        self.assertEqual(path, self.cache.path_for(url))
+        self.assertNotEqual(path, self.cache.path_for("https://example.com/other.png"))
+        self.assertEqual(os.path.dirname(path), self.test_dir)
+
+    def test_fetch_caches_on_disk(self):
+        """Test that a fetched image is served from disk afterwards."""
+        url = "https://example.com/image.png"
+        self.assertIsNone(self.cache.get_cached(url))
+
+        with mock.patch('services.thumbnail_cache.Image', None), \
+                mock.patch('services.thumbnail_cache.urlopen', return_value=FakeResponse(b'png-bytes')):
+            path = self.cache.fetch(url)
+
+        self.assertTrue(os.path.exists(path))
+        with mock.patch('services.thumbnail_cache.Image', None):
+            self.assertEqual(self.cache.get_cached(url), path)
+
+    def test_fetch_failure_returns_none(self):
+        """Test that a failed download is reported and nothing is cached."""
+        url = "https://example.com/missing.png"
+
+        with mock.patch('services.thumbnail_cache.urlopen', side_effect=URLError('offline')):
+            self.assertIsNone(self.cache.fetch(url))
+
+        self.assertIsNone(self.cache.get_cached(url))
+
+    def test_cancel_pending_skips_queued_fetches(self):
+        """Test that cancelled fetches never run their callback."""
+        self.cache.MAX_WORKERS = 1
+        release = threading.Event()
+        results = []
+
+        with mock.patch.object(self.cache, 'fetch', side_effect=lambda url, max_px: release.wait(5) and url):
+            running = self.cache.fetch_async("https://example.com/a.png", results.append)
+            queued = self.cache.fetch_async("https://example.com/b.png", results.append)
+
+            self.cache.cancel_pending()
+            release.set()
+            running.result(timeout=5)
+
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(results, ["https://example.com/a.png"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,14 @@ import sys
 import os
 import tempfile
 import shutil
+import threading
+from unittest import mock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.user_database import UserDatabase, UserDeck, UserCard
+from services import user_database
+from services.user_database import UserDatabase, UserDeck, UserCard, Competition, get_user_database
 
 
 class TestUserDatabase(unittest.TestCase):
@@ -27,6 +30,7 @@ class TestUserDatabase(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files."""
+        self.db.close()
         shutil.rmtree(self.test_dir, ignore_errors=True)
 
     def _create_card(self, name, quantity, card_type="pokemon", set_code="OBF", set_number="1"):
@@ -100,6 +104,66 @@ class TestUserDatabase(unittest.TestCase):
         self.assertEqual(updated.name, "Updated Name")
         self.assertEqual(len(updated.cards), 1)
 
+    def test_save_decks_batch(self):
+        """Test saving new and existing decks together."""
+        existing_id = self.db.save_deck(UserDeck(name="Existing"))
+        existing = self.db.get_deck(existing_id)
+        existing.name = "Renamed"
+
+        ids = self.db.save_decks([UserDeck(name="New 1"), existing, UserDeck(name="New 2")])
+
+        self.assertEqual(ids[1], existing_id)
+        self.assertEqual([self.db.get_deck(i).name for i in ids], ["New 1", "Renamed", "New 2"])
+
+    def test_save_competitions_batch(self):
+        """Test saving several competitions at once."""
+        comps = [Competition(name=f"Cup {i}", event_type="league_cup", date=f"2026-0{i}-01")
+                 for i in range(1, 4)]
+
+        ids = self.db.save_competitions(comps)
+
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(len(self.db.get_competitions()), 3)
+
+    def test_use_from_worker_thread(self):
+        """Test that the shared connection can be used off the creating thread."""
+        self.db.save_deck(UserDeck(name="Threaded"))
+        names = []
+
+        worker = threading.Thread(target=lambda: names.extend(d.name for d in self.db.get_all_decks()))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(names, ["Threaded"])
+
+    def test_player_stats(self):
+        """Test aggregated competition statistics."""
+        self.db.save_competitions([
+            Competition(name="Cup 1", event_type="league_cup", date="2026-01-10",
+                        deck_id=2, wins=3, losses=1, placement=4),
+            Competition(name="Cup 2", event_type="league_cup", date="2026-02-10",
+                        deck_id=1, wins=2, losses=2, draws=0),
+            Competition(name="Cup 3", event_type="league_cup", date="2026-03-10",
+                        deck_id=2, wins=1, losses=2, draws=1, placement=2),
+        ])
+
+        stats = self.db.get_player_stats()
+
+        self.assertEqual(stats['total_events'], 3)
+        self.assertEqual(stats['total_wins'], 6)
+        self.assertEqual(stats['total_losses'], 5)
+        self.assertEqual(stats['total_draws'], 1)
+        self.assertAlmostEqual(stats['win_rate'], 50.0)
+        self.assertEqual(stats['best_placement'], 2)
+        self.assertEqual(stats['most_played_deck_id'], 2)
+
+    def test_player_stats_empty(self):
+        """Test statistics without any competitions."""
+        stats = self.db.get_player_stats()
+
+        self.assertEqual(stats['total_events'], 0)
+        self.assertEqual(stats['win_rate'], 0.0)
+
     def test_delete_deck(self):
         """Test deleting a deck."""
         deck = UserDeck(name="To Delete")
@@ -205,6 +269,20 @@ class TestUserDatabase(unittest.TestCase):
 
         self.assertEqual(deck.energy_count, 15)
 
+    def test_deck_validate(self):
+        """Test validation of deck size and the 4-copy rule."""
+        deck = UserDeck(name="Test")
+        deck.cards = [
+            self._create_card("Iono", 3, "trainer", "PAL", "185"),
+            self._create_card("iono", 2, "trainer", "PAF", "80"),
+            self._create_card("Basic Fire Energy", 10, "energy"),
+        ]
+
+        is_valid, issues = deck.validate()
+
+        self.assertFalse(is_valid)
+        self.assertEqual(issues, ["Deck has 15/60 cards", "More than 4 copies of Iono"])
+
     def test_deck_is_complete(self):
         """Test deck completeness via total_cards."""
         deck = UserDeck(name="Test")
@@ -219,6 +297,31 @@ class TestUserDatabase(unittest.TestCase):
         self.assertEqual(deck.total_cards, 60)
 
 
+class TestGetUserDatabase(unittest.TestCase):
+    """Test cases for the shared UserDatabase instance."""
+
+    def setUp(self):
+        """Point the default database path at a temporary directory."""
+        self.test_dir = tempfile.mkdtemp()
+        db_path = os.path.join(self.test_dir, "shared.db")
+        patcher = mock.patch.object(user_database, "get_db_path", return_value=db_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, user_database, "_user_database", None)
+        user_database._user_database = None
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_returns_same_instance(self):
+        """Test that every caller shares one UserDatabase."""
+        db = get_user_database()
+
+        self.assertIsInstance(db, UserDatabase)
+        self.assertIs(get_user_database(), db)
+
+
 class TestUserCard(unittest.TestCase):
     """Test cases for UserCard dataclass."""
 
@@ -252,6 +355,22 @@ class TestUserCard(unittest.TestCase):
         self.assertEqual(card.subtype, "")
         self.assertEqual(card.regulation_mark, "")
 
+    def test_card_name_lower_round_trip(self):
+        """Test that the cached lowercase name is derived, not serialized."""
+        card = UserCard(
+            name="Charizard ex",
+            set_code="OBF",
+            set_number="125",
+            quantity=4,
+            card_type="pokemon"
+        )
+
+        data = card.to_dict()
+
+        self.assertEqual(card.name_lower, "charizard ex")
+        self.assertNotIn("name_lower", data)
+        self.assertEqual(UserCard(**data), card)
+
 
 if __name__ == '__main__':
     unittest.main()